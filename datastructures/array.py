@@ -6,73 +6,161 @@
 """
 
 from __future__ import annotations
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
 import os
-from typing import Any, Iterator, overload
+from typing import Any, Iterator, Optional, overload
 import numpy as np
 from numpy.typing import NDArray
 from copy import deepcopy
 
 from datastructures.iarray import IArray, T
 
+#python types that are stored natively in a fixed width numpy dtype rather than as python objects
+#these are all immutable, so storing them never needs a deepcopy
+PRIMITIVE_DTYPES: dict[type, type] = {int: np.int64, float: np.float64, bool: np.bool_}
+#numpy dtype kinds that pass the bulk type check for each primitive type, mirroring isinstance (bool is a subclass of int)
+_PRIMITIVE_KINDS: dict[type, str] = {int: 'biu', float: 'f', bool: 'b'}
+#primitive type inferred from a numpy dtype kind by Array.from_numpy
+_KIND_TYPES: dict[str, type] = {'b': bool, 'i': int, 'u': int, 'f': float}
+#number of items converted to python scalars at a time while iterating over a primitive array
+_ITER_CHUNK_SIZE: int = 4096
+
 
 class Array(IArray[T]):  
 
-    def __init__(self, starting_sequence: Sequence[T]=[], data_type: type=object) -> None: 
+    def __init__(self, starting_sequence: Sequence[T]=[], data_type: type=object, growth_factor: float=2.0) -> None: 
         """
         init array
+        growth_factor is how much the capacity is multiplied by when the array is full
+        the capacity is divided by growth_factor once the array is at most 1/growth_factor**2 full, keeping slack at both ends, so alternating appends and pops at either end can't cause repeated resizes
         O(n) operation for length of starting_sequence
         """
-        if not isinstance(starting_sequence, Sequence):
+        if not isinstance(starting_sequence, (Sequence, np.ndarray)):
             raise ValueError("starting_sequence must be a valid sequence type")
         if not isinstance(data_type, type):
             raise ValueError("data_type must be a type")
+        if not growth_factor > 1:
+            raise ValueError("growth_factor must be greater than 1")
 
         self.__item_count: int = len(starting_sequence)
         self.__capacity: int = self.__item_count
+        #physical index of the first item, the buffer keeps slack on both ends so append_front doesn't shift items
+        self.__front: int = 0
         self.__data_type: type = data_type
+        self.__growth_factor: float = growth_factor
+        #counts changes to the logical layout, so ArrayViews can tell when the items they view have moved
+        self.__modification_count: int = 0
+        #primitive types get a fixed width dtype, everything else is stored as python objects
+        #letting numpy pick a dtype for other types is unsafe, ex: np.empty(n, dtype=str) truncates strings to 1 character
+        self.__primitive: bool = data_type in PRIMITIVE_DTYPES
+        self.__dtype: type = PRIMITIVE_DTYPES.get(data_type, object)
+
+        self.__items: NDArray = np.empty(self.__capacity, dtype = self.__dtype)
+
+        self.__store(0, starting_sequence)
+
+    @staticmethod
+    def from_numpy(items: NDArray, data_type: Optional[type]=None) -> Array:
+        """
+        create an array from a one-dimensional numpy array
+        infers data_type from the numpy dtype if it isn't given
+        if items already has the array's storage dtype and is writeable, the array uses it as its buffer without copying
+        in that case changes to the array are visible through items until the array reallocates
+        O(1) operation when no copy is needed, O(n) otherwise
+        Raises:
+            ValueError: if items isn't one-dimensional, or is unsigned 64 bit with values too large for int64
+        """
+        if not isinstance(items, np.ndarray) or items.ndim != 1:
+            raise ValueError("items must be a one-dimensional numpy array")
+        if data_type is None:
+            data_type = _KIND_TYPES.get(items.dtype.kind, object)
+
+        #numpy won't safely cast uint64 to int64, so the values are range checked and converted here instead
+        if items.dtype == np.uint64 and data_type is int:
+            if len(items) > 0 and items.max() > np.iinfo(np.int64).max:
+                raise ValueError("uint64 items larger than the int64 maximum can't be stored in an int array")
+            items = items.astype(np.int64)
+
+        if PRIMITIVE_DTYPES.get(data_type) == items.dtype and items.flags.writeable:
+            array = Array(data_type=data_type)
+            array.__items = items
+            array.__item_count = array.__capacity = len(items)
+            array.__front = 0
+            return array
+        return Array(starting_sequence=items, data_type=data_type) #type: ignore
 
-        self.__items: NDArray = np.empty(self.__capacity, dtype = self.__data_type)
+    @staticmethod
+    def from_buffer(buffer: Any, data_type: type=int) -> Array:
+        """
+        create a primitive array from an object supporting the buffer protocol, ex: bytearray, memoryview, array.array
+        the raw bytes are interpreted as the data_type's fixed width dtype
+        writeable buffers are shared without copying, read-only buffers (ex: bytes) are copied
+        O(1) operation for writeable buffers, O(n) otherwise
+        """
+        if data_type not in PRIMITIVE_DTYPES:
+            raise ValueError(f"from_buffer only supports the primitive types {list(PRIMITIVE_DTYPES)}")
+        items = np.frombuffer(buffer, dtype=PRIMITIVE_DTYPES[data_type])
+        if not items.flags.writeable:
+            items = items.copy()
+        return Array.from_numpy(items, data_type)
+
+    @staticmethod
+    def from_iterable(iterable: Iterable[T], data_type: type=object) -> Array:
+        """
+        create an array from any iterable, including generators
+        the storage is sized once instead of growing one append at a time
+        O(n) operation for length of iterable
+        """
+        if isinstance(iterable, np.ndarray):
+            return Array.from_numpy(iterable, data_type)
+        if not isinstance(iterable, Sequence):
+            iterable = list(iterable)
+        return Array(starting_sequence=iterable, data_type=data_type)
+
+    def extend(self, iterable: Iterable[T]) -> None:
+        """
+        append every item of iterable to the end of the array
+        grows the storage at most once and copies primitives in a single vectorized step
+        nothing is appended if any item has the wrong type
+        O(k) operation for length of iterable
+        """
+        if not isinstance(iterable, (Sequence, np.ndarray)):
+            iterable = list(iterable)
+        new_count = self.__item_count + len(iterable)
+        if self.__front + new_count > self.__capacity:
+            self.__resize(max(new_count, int(self.__capacity * self.__growth_factor)))
+        self.__store(self.__front + self.__item_count, iterable) #type: ignore
+        self.__item_count = new_count
+        self.__modification_count += 1
 
-        for i, item in enumerate(starting_sequence):
-            #__setitem__ handles individual item error checking
-            self[i] = item
     @overload
     def __getitem__(self, index: int) -> T: ...
     @overload
-    def __getitem__(self, index: slice) -> Sequence[T]: ...
-    def __getitem__(self, index: int | slice) -> T | Sequence[T]:
+    def __getitem__(self, index: slice) -> ArrayView[T]: ...
+    def __getitem__(self, index: int | slice) -> T | ArrayView[T]:
         """
         get item from array
-        O(n) operation for length of return sequence
+        slices return an ArrayView over the shared numpy buffer instead of a new Array
+        O(1) operation
         """
         if isinstance(index, slice):
-            #index checking and setting defaults
-            start = 0 if index.start is None else index.start
-            #start = index.start
-            if not (start is None or self.__in_range(start)): #shortcircuited or means that self.__in_range won't raise error if index is None
-                raise IndexError(f"Start index {start} out of bounds. Array length is {self.__item_count}")
-            
-            stop = self.__item_count if index.stop is None else index.stop
-            #stop = index.stop
-            if not (stop is None or self.__in_range(stop-1)): #shortcircuited or means that self.__in_range won't raise error if index is None
-                raise IndexError(f"Stop index {stop} out of bounds. Array length is {self.__item_count}")
-            
-            step = 1 if index.step is None else index.step
-            #step = index.step
-            if not (step is None or self.__in_range(step)): #shortcircuited or means that self.__in_range won't raise error if index is None
-                raise IndexError(f"Step index {step} out of bounds. Array length is {self.__item_count}")
-
-            sliced_items = self.__items[start:stop:step]
-            #surely there's a better way to do this... creating a entirely new array to return -- complete with deep copies of all the data -- seems wasteful. Maybe I'm spoiled from Rust's slices...
-            #iirc, doing this kind of slicing on a numpy array directly is O(1), and almost free. So implementing our own slice function in this way is way slower
-            return Array(starting_sequence=sliced_items.tolist(), data_type=self.__data_type)
+            #index checking, defaults are handled by numpy's own slicing
+            if not (index.start is None or self.__in_slice_range(index.start)): #shortcircuited or means that self.__in_slice_range won't raise error if index is None
+                raise IndexError(f"Start index {index.start} out of bounds. Array length is {self.__item_count}")
+            if not (index.stop is None or self.__in_slice_range(index.stop)):
+                raise IndexError(f"Stop index {index.stop} out of bounds. Array length is {self.__item_count}")
+            if index.step == 0:
+                raise ValueError("slice step cannot be zero")
+
+            #slicing a numpy array is O(1), it only creates a new view of the same buffer
+            return ArrayView(self.__logical_items()[index], self.__data_type, self)
         
         elif isinstance(index, int):
             if not self.__in_range(index):
                 raise IndexError(f"Index {index} out of bounds. Array length is {self.__item_count}")
             
-            item = self.__items[index]
+            #negative indices wrap around the logical size, not the physical size
+            item = self.__items[self.__physical_index(index)]
             return item.item() if isinstance(item, np.generic) else item
         
         else:
@@ -88,49 +176,97 @@ class Array(IArray[T]):
         if not self.__in_range(index):
             raise IndexError(f"Index {index} out of bounds. Array length is {self.__item_count}")
         
-        self.__items[index] = deepcopy(item)
+        #primitives are immutable, so they can be stored without copying
+        self.__items[self.__physical_index(index)] = item if self.__primitive else deepcopy(item)
 
     def append(self, data: T) -> None:
         """
         append to end of array
         ammortized O(1) operation
         """
-        if self.__capacity >= self.__item_count:
-            self.__resize(self.__capacity * 2)
+        if not isinstance(data, self.__data_type):
+            raise TypeError(f"item {data} of type {type(data)} not of type {self.__data_type}")
+        if self.__front + self.__item_count == self.__capacity:
+            self.__make_room()
         self.__item_count += 1
-        #__setitem__ handles type checking
-        #doing error checking after increasing __item_count lets me reuse the __setitem__ function
-        #could cause a problematic desync in the event of the program continuing after an error. Only matters if the end user catches the error
-        self[-1] = data
+        self.__modification_count += 1
+        self.__items[self.__front + self.__item_count - 1] = data if self.__primitive else deepcopy(data)
 
     def append_front(self, data: T) -> None:
         """
         append to front of array
-        O(n) operation for size of array
-        """
-        #this setup is horribly inefficient
-        #I should rewrite this to shift items over in the same step as resizing if possible
-        #Is there a way to avoid having to shift all items over every append_front()?
-        #grow if needed
-        if self.__capacity >= self.__item_count:
-            self.__grow(self.__capacity * 2)
+        uses the slack before the first item, so no items are shifted unless the array is reallocated
+        ammortized O(1) operation
+        """
+        if not isinstance(data, self.__data_type):
+            raise TypeError(f"item {data} of type {type(data)} not of type {self.__data_type}")
+        if self.__front == 0:
+            self.__make_room()
+        self.__front -= 1
         self.__item_count += 1
-        #shift elements to the right
-        for i, item in enumerate(reversed(self), start=1):
-            #setting items using public method includes unnecessary error checking. Could increase efficiency by setting items directly
-            #also, setting items using public method potentially performs unnecessary deep copying
-            self[-i] = item
-        #set data
-        #__setitem__ handles type checking
-        #doing error checking after preamble lets me reuse the __setitem__ function
-        #could cause a problematic desync in the event of the program continuing after an error. Only matters if the end user catches the error
-        self[0] = data
+        self.__modification_count += 1
+        self.__items[self.__front] = data if self.__primitive else deepcopy(data)
 
     def pop(self) -> None:
-        del self[-1]
+        """
+        remove the last item
+        ammortized O(1) operation
+        """
+        if self.__item_count == 0:
+            raise IndexError("pop from empty array")
+        self.__release(self.__front + self.__item_count - 1)
+        self.__item_count -= 1
+        self.__modification_count += 1
+        self.__shrink_if_sparse()
     
     def pop_front(self) -> None:
-        del self[0]
+        """
+        remove the first item by moving the front forward, leaving slack for append_front
+        ammortized O(1) operation
+        """
+        if self.__item_count == 0:
+            raise IndexError("pop from empty array")
+        self.__release(self.__front)
+        self.__front += 1
+        self.__item_count -= 1
+        self.__modification_count += 1
+        self.__shrink_if_sparse()
+
+    def reserve(self, capacity: int) -> None:
+        """
+        makes sure the array can hold capacity items without reallocating, as long as items are only added with append
+        never reduces the capacity
+        O(n) operation for length of array if the array reallocates, O(1) otherwise
+        """
+        if capacity < 0:
+            raise ValueError("capacity must not be negative")
+        if self.__capacity - self.__front < capacity:
+            self.__resize(max(capacity, self.__item_count))
+
+    def shrink_to_fit(self) -> None:
+        """
+        reduces the capacity to the logical size, freeing all slack
+        O(n) operation for length of array
+        """
+        if self.__capacity != self.__item_count:
+            self.__resize(self.__item_count)
+
+    @property
+    def modification_count(self) -> int:
+        """
+        number of times items have been added or removed, or the buffer has been reallocated
+        setting an item in place doesn't count as a modification
+        O(1) operation
+        """
+        return self.__modification_count
+
+    @property
+    def capacity(self) -> int:
+        """
+        physical size of the array
+        O(1) operation
+        """
+        return self.__capacity
 
     def __len__(self) -> int: 
         """
@@ -142,60 +278,72 @@ class Array(IArray[T]):
     def __eq__(self, other: object) -> bool:
         """
         check equivalence
+        Arrays and ArrayViews compare equal if they hold equal items in the same order
         O(n) operation for length of array
         """
-        if not isinstance(other, Array):
+        if not isinstance(other, (Array, ArrayView)):
             return False
         if len(other) != len(self):
             return False
         
-        items_eq = True
-        #todo, change this to makes use of __iter__ when it's implemented
         for item_o, item_s in zip(other, self):
-            items_eq = items_eq and (item_o == item_s)
-        return items_eq
+            if item_o != item_s:
+                return False
+        return True
 
     def __iter__(self) -> Iterator[T]:
         """
         numpy iterator wrapper
+        primitive arrays are converted to python scalars a chunk at a time using tolist
         O(1) operation
         """
-        iterator = iter(self.__items[0:self.__item_count])
+        items = self.__logical_items()
+        if self.__primitive:
+            for start in range(0, self.__item_count, _ITER_CHUNK_SIZE):
+                yield from items[start:start + _ITER_CHUNK_SIZE].tolist()
+            return
+        iterator = iter(items)
         for item in iterator:
             yield item.item() if isinstance(item, np.generic) else item
 
     def __reversed__(self) -> Iterator[T]:
         """
-        uses __iter__ on a reversed array
-        O(n) operation for length of array
+        iterates over a reversed view of the array
+        O(1) operation
         """
-        #this hacky code I wrote makes me upset
-        #I would ideally just use self[::-1] to reverse it, but this doesn't work with the way defaults are set in the slice
-        #It also seems incredibly wasteful to create an entirely new array to feed into __iter__, when slicing into a numpy array directly is so costless
-        return iter(Array(starting_sequence=self.__items[self.__item_count-1::-1].tolist(), data_type=self.__data_type))
+        return iter(self[::-1])
 
     def __delitem__(self, index: int) -> None:
         """
         delete item from array
-        O(n) operation for length of array-index
+        shifts whichever side of index is shorter, so deleting near either end is cheap
+        O(n) operation for min(index, length of array-index)
         """
         if not self.__in_range(index):
             raise IndexError(f"Index {index} out of bounds. Array length is {self.__item_count}")
-        
-        for i, item in enumerate(self[index+1:], index+1):
-            #setting items using public method potentially performs unnecessary deep copying. This should maybe be rewritten to set values directly
-            self[i-1] = item
+        index %= self.__item_count
+        physical = self.__front + index
+
+        #numpy handles the overlapping copies, so items are shifted without going through __setitem__
+        if index < self.__item_count // 2:
+            self.__items[self.__front+1:physical+1] = self.__items[self.__front:physical]
+            self.__release(self.__front)
+            self.__front += 1
+        else:
+            last = self.__front + self.__item_count - 1
+            self.__items[physical:last] = self.__items[physical+1:last+1]
+            self.__release(last)
         self.__item_count -= 1
+        self.__modification_count += 1
 
-        if self.__item_count <= self.__capacity/4:
-            self.__resize(int(self.__capacity/2))
+        self.__shrink_if_sparse()
 
     def __contains__(self, item: Any) -> bool:
         """
-        uses numpy __contains__
-        O(n) operation for length of array?
+        uses numpy __contains__ on the logical items only
+        O(n) operation for length of array
         """
-        return item in self.__items
+        return item in self.__logical_items()
 
     def clear(self) -> None:
         """
@@ -203,9 +351,11 @@ class Array(IArray[T]):
         sets capacity to 1 and item count to 0
         O(1) operation
         """
-        self.__items = np.empty(1, dtype=self.__data_type)
+        self.__items = np.empty(1, dtype=self.__dtype)
         self.__capacity = 1
         self.__item_count = 0
+        self.__front = 0
+        self.__modification_count += 1
 
     def __str__(self) -> str:
         return '[' + ', '.join(str(item) for item in self) + ']'
@@ -213,18 +363,211 @@ class Array(IArray[T]):
     def __repr__(self) -> str:
         return f'Array {self.__str__()}, Logical: {self.__item_count}, Physical: {len(self.__items)}, type: {self.__data_type}'
     
+    def __store(self, start: int, sequence: Sequence[T]) -> None:
+        """
+        type checks sequence and copies it into the buffer starting at physical index start
+        the buffer must already have room for it, and nothing is stored if any item has the wrong type
+        O(n) operation for length of sequence
+        """
+        if self.__primitive:
+            #the whole sequence is type checked and copied in one vectorized step
+            self.__items[start:start + len(sequence)] = self.__validate_primitives(sequence)
+            return
+        for item in sequence:
+            if not isinstance(item, self.__data_type):
+                raise TypeError(f"item {item} of type {type(item)} not of type {self.__data_type}")
+        for i, item in enumerate(sequence, start):
+            self.__items[i] = deepcopy(item)
+
+    def __validate_primitives(self, sequence: Sequence[T]) -> NDArray:
+        """
+        converts a sequence to the array's primitive dtype, type checking every item in one vectorized check
+        falls back to checking items one at a time to report which item has the wrong type
+        O(n) operation for length of sequence
+        """
+        if len(sequence) == 0:
+            return np.empty(0, dtype=self.__dtype)
+        try:
+            converted = np.asarray(sequence)
+        except (ValueError, TypeError):
+            #ragged or otherwise unconvertible items, left for the item by item check to report
+            converted = None
+        if converted is not None and converted.ndim == 1 and converted.dtype.kind in _PRIMITIVE_KINDS[self.__data_type] \
+                and np.can_cast(converted.dtype, self.__dtype, casting='safe'):
+            return converted.astype(self.__dtype, copy=False)
+        for item in sequence:
+            if not isinstance(item, self.__data_type):
+                raise TypeError(f"item {item} of type {type(item)} not of type {self.__data_type}")
+        return np.array(sequence, dtype=self.__dtype)
+
+    def __logical_items(self) -> NDArray:
+        """
+        view of the buffer holding only the items, without the slack on either end
+        O(1) operation
+        """
+        return self.__items[self.__front:self.__front + self.__item_count]
+
+    def __physical_index(self, index: int) -> int:
+        """
+        maps an in range logical index onto the buffer
+        negative indices wrap around the logical size, not the physical size
+        """
+        return self.__front + index % self.__item_count
+
+    def __release(self, physical_index: int) -> None:
+        """
+        drops the buffer's reference to a removed object so it can be garbage collected
+        primitives hold no references, so they are left in place
+        """
+        if not self.__primitive:
+            self.__items[physical_index] = None
+
+    def __make_room(self) -> None:
+        """
+        makes room for one more item on whichever end is full
+        if at least half the buffer is slack, items are recentered in the current buffer, otherwise the buffer grows by growth_factor
+        either way, the slack is split evenly between both ends
+        ammortized O(1) operation
+        """
+        #there must be at least 2 slots of slack so both ends get one
+        recenter = self.__item_count <= self.__capacity // 2 and self.__capacity - self.__item_count >= 2
+        new_size = self.__capacity if recenter \
+            else max(int(self.__capacity * self.__growth_factor), self.__item_count + 2)
+        self.__resize(new_size, front=(new_size - self.__item_count + 1) // 2)
+
+    def __shrink_if_sparse(self) -> None:
+        """
+        divides the capacity by growth_factor once the logical size is at most 1/growth_factor**2 of the physical size
+        with the default growth_factor of 2, this halves the capacity once the array is 1/4 full
+        the slack is split evenly between both ends, so front operations right after shrinking don't reallocate again
+        """
+        if self.__item_count <= self.__capacity / self.__growth_factor**2:
+            new_size = int(self.__capacity / self.__growth_factor)
+            #never shrinks below the 2 slots of slack __make_room would immediately grow back to
+            if new_size >= self.__item_count + 2:
+                self.__resize(new_size, front=(new_size - self.__item_count) // 2)
+
     def __in_range(self, index: int) -> bool:
         return -self.__item_count <= index < self.__item_count
+
+    def __in_slice_range(self, index: int) -> bool:
+        #slice bounds may point one past the last item
+        return -self.__item_count <= index <= self.__item_count
     
-    def __resize(self, new_size: int) -> None:
+    def __resize(self, new_size: int, front: int = 0) -> None:
         """
-        resizes array using numpy.resize
+        resizes array by copying into a newly allocated numpy array, placing the first item at physical index front
+        np.ndarray.resize refuses to run while an ArrayView still references the buffer, so a new buffer is used instead
+        views taken before the resize would keep referencing the old buffer, so the resize counts as a modification
         O(n) operation for new length of array
         """
-        if new_size <= self.__item_count:
+        if front + self.__item_count > new_size:
             raise ValueError("attempted to set capacity smaller than item_count")
+        new_items: NDArray = np.empty(new_size, dtype=self.__dtype)
+        new_items[front:front + self.__item_count] = self.__logical_items()
         self.__capacity = new_size
-        self.__items.resize(new_size)
+        self.__front = front
+        self.__items = new_items
+        self.__modification_count += 1
+
+
+class ArrayView(Sequence[T]):
+    """
+    Read-only view over a slice of an Array's numpy buffer
+    Returned by slicing an Array, so slicing never copies any items
+    Changes made to the Array through __setitem__ are visible through the view
+    Once items are added to or removed from the Array, the view is invalidated and using it raises a RuntimeError,
+    since removed items leave holes and shifted items would silently show different contents
+    Use copy() to get an independent Array
+    """
+
+    def __init__(self, items: NDArray, data_type: type=object, owner: Optional[Array]=None) -> None:
+        self.__items: NDArray = items.view()
+        #writes must go through Array, so the view itself can't be used to bypass type checking
+        self.__items.flags.writeable = False
+        self.__data_type: type = data_type
+        #the array being viewed and its modification count when the view was taken, None for views that don't track an array
+        self.__owner: Optional[Array] = owner
+        self.__modification_count: int = 0 if owner is None else owner.modification_count
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+    @overload
+    def __getitem__(self, index: slice) -> ArrayView[T]: ...
+    def __getitem__(self, index: int | slice) -> T | ArrayView[T]:
+        """
+        get item from view
+        slicing a view returns another view
+        O(1) operation
+        """
+        self.__check_valid()
+        if isinstance(index, slice):
+            return ArrayView(self.__items[index], self.__data_type, self.__owner)
+        elif isinstance(index, int):
+            if not -len(self.__items) <= index < len(self.__items):
+                raise IndexError(f"Index {index} out of bounds. View length is {len(self.__items)}")
+            item = self.__items[index]
+            return item.item() if isinstance(item, np.generic) else item
+        else:
+            raise TypeError("invalid index, not an int or slice")
+
+    def __len__(self) -> int:
+        self.__check_valid()
+        return len(self.__items)
+
+    def __iter__(self) -> Iterator[T]:
+        self.__check_valid()
+        if self.__items.dtype != object:
+            #items are still converted in chunks, but validity is checked before each one is yielded
+            for start in range(0, len(self.__items), _ITER_CHUNK_SIZE):
+                for item in self.__items[start:start + _ITER_CHUNK_SIZE].tolist():
+                    self.__check_valid()
+                    yield item
+            return
+        for item in self.__items:
+            self.__check_valid()
+            yield item.item() if isinstance(item, np.generic) else item
+
+    def __contains__(self, item: Any) -> bool:
+        self.__check_valid()
+        return item in self.__items
+
+    def __eq__(self, other: object) -> bool:
+        """
+        check equivalence against another ArrayView or Array
+        O(n) operation for length of view
+        """
+        if not isinstance(other, (Array, ArrayView)):
+            return False
+        if len(other) != len(self):
+            return False
+
+        for item_o, item_s in zip(other, self):
+            if item_o != item_s:
+                return False
+        return True
+
+    def copy(self) -> Array[T]:
+        """
+        copies the viewed items into a new, independent Array
+        O(n) operation for length of view
+        """
+        self.__check_valid()
+        return Array(starting_sequence=self.__items.tolist(), data_type=self.__data_type)
+
+    def __check_valid(self) -> None:
+        """
+        raises a RuntimeError if items were added to or removed from the viewed array since the view was taken
+        O(1) operation
+        """
+        if self.__owner is not None and self.__owner.modification_count != self.__modification_count:
+            raise RuntimeError("Array was modified after this view was taken")
+
+    def __str__(self) -> str:
+        return '[' + ', '.join(str(item) for item in self) + ']'
+
+    def __repr__(self) -> str:
+        return f'ArrayView {self.__str__()}, Logical: {len(self)}, type: {self.__data_type}'
 
 if __name__ == '__main__':
     filename = os.path.basename(__file__)
@@ -0,0 +1,287 @@
+import numbers
+import os
+from typing import Iterator
+import numpy as np
+from numpy.typing import NDArray
+from datastructures.array import PRIMITIVE_DTYPES
+from datastructures.iqueue import IQueue, T
+
+class ArrayDeque[T](IQueue[T]):
+    """
+    A double-ended queue (deque) stored in a growable circular buffer.
+    Items sit contiguously in one numpy array, with the front and back wrapping around its end like in CircularQueue.
+    Both ends are amortized O(1), and indexing any item is O(1).
+    Can be used anywhere a Deque can, chosen by constructing this class instead.
+    """
+
+    def __init__(self, data_type: type = object, capacity: int = 8) -> None:
+        """
+        Initializes the deque with a specified data type.
+
+        Args:
+            - data_type (type): The type of data the deque will hold.
+            - capacity (int): The number of items the deque can hold before it has to grow.
+        """
+        self.__data_type = data_type
+        #ints, floats and bools are stored unboxed, everything else as references
+        self.__dtype = PRIMITIVE_DTYPES.get(data_type, object)
+        self.__minimum_capacity = max(capacity, 1)
+        self.__items: NDArray = np.empty(self.__minimum_capacity, dtype=self.__dtype)
+        self.__front_index = 0
+        self.__count = 0
+
+    def enqueue(self, item: T) -> None:
+        """
+        Adds an item to the back of the deque.
+
+        Args:
+            - item (T): The item to add to the back of the deque.
+
+        Raises:
+            - TypeError: If the item is not of the correct type.
+        """
+        self.__check_type(item)
+        if self.__count == len(self.__items):
+            self.__resize(2 * len(self.__items))
+        self.__items[self.__physical_index(self.__count)] = item
+        self.__count += 1
+
+    def dequeue(self) -> T:
+        """
+        Removes and returns the item from the front of the deque.
+
+        Returns:
+            - T: The item removed from the front of the deque.
+
+        Raises:
+            - IndexError: If the deque is empty.
+        """
+        item = self.front()
+        self.__release(self.__front_index)
+        self.__front_index = self.__circularIncrement(self.__front_index)
+        self.__count -= 1
+        self.__shrink_if_sparse()
+        return item
+
+    def enqueue_front(self, item: T) -> None:
+        """
+        Adds an item to the front of the deque.
+
+        Args:
+            - item (T): The item to add to the front of the deque.
+
+        Raises:
+            - TypeError: If the item is not of the correct type.
+        """
+        self.__check_type(item)
+        if self.__count == len(self.__items):
+            self.__resize(2 * len(self.__items))
+        self.__front_index = (self.__front_index - 1) % len(self.__items)
+        self.__items[self.__front_index] = item
+        self.__count += 1
+
+    def dequeue_back(self) -> T:
+        """
+        Removes and returns the item from the back of the deque.
+
+        Returns:
+            - T: The item removed from the back of the deque.
+
+        Raises:
+            - IndexError: If the deque is empty.
+        """
+        item = self.back()
+        self.__release(self.__physical_index(self.__count - 1))
+        self.__count -= 1
+        self.__shrink_if_sparse()
+        return item
+
+    def front(self) -> T:
+        """
+        Returns the front item of the deque without removing it.
+
+        Returns:
+            - T: The front item of the deque.
+
+        Raises:
+            - IndexError: If the deque is empty.
+        """
+        if self.__count == 0:
+            raise IndexError("Deque is empty")
+        return self.__items.item(self.__front_index)
+
+    def back(self) -> T:
+        """
+        Returns the back item of the deque without removing it.
+
+        Returns:
+            - T: The back item of the deque.
+
+        Raises:
+            - IndexError: If the deque is empty.
+        """
+        if self.__count == 0:
+            raise IndexError("Deque is empty")
+        return self.__items.item(self.__physical_index(self.__count - 1))
+
+    def empty(self) -> bool:
+        """
+        Checks if the deque is empty.
+
+        Returns:
+            - bool: True if the deque is empty, False otherwise.
+        """
+        return self.__count == 0
+
+    @property
+    def capacity(self) -> int:
+        """
+        Returns the number of items the deque can hold before it has to grow.
+        """
+        return len(self.__items)
+
+    def __getitem__(self, index: int) -> T:
+        """
+        Returns the item index places from the front of the deque, or from the back for negative indices.
+        O(1)
+
+        Raises:
+            - IndexError: If the index is out of range.
+        """
+        if not -self.__count <= index < self.__count:
+            raise IndexError(f"deque index {index} out of range")
+        return self.__items.item(self.__physical_index(index % self.__count))
+
+    def __len__(self) -> int:
+        """
+        Returns the number of items in the deque.
+
+        Returns:
+            - int: The number of items in the deque.
+        """
+        return self.__count
+
+    def __iter__(self) -> Iterator[T]:
+        """
+        Iterates through the items from front to back, a contiguous segment at a time.
+        """
+        for segment in self.__segments():
+            yield from segment.tolist()
+
+    def __contains__(self, item: T) -> bool:
+        """
+        Checks if an item exists in the deque.
+
+        Args:
+            - item (T): The item to check for existence.
+
+        Returns:
+            - bool: True if the item exists in the deque, False otherwise.
+        """
+        if self.__dtype is object:
+            return any(existing == item for existing in self)
+        #numpy scalars like np.int64 are registered as numbers, np.bool_ isn't
+        if not isinstance(item, (numbers.Number, np.bool_)):
+            return False
+        return any(bool((segment == item).any()) for segment in self.__segments())
+
+    def __eq__(self, other) -> bool:
+        """
+        Compares two deques for equality.
+
+        Args:
+            - other (ArrayDeque): The deque to compare with.
+
+        Returns:
+            - bool: True if the deques are equal, False otherwise.
+        """
+        if not isinstance(other, ArrayDeque):
+            return False
+        if len(self) != len(other):
+            return False
+        return all(item1 == item2 for item1, item2 in zip(self, other))
+
+    def clear(self):
+        """
+        Clears all items from the deque.
+        """
+        self.__items = np.empty(self.__minimum_capacity, dtype=self.__dtype)
+        self.__front_index = 0
+        self.__count = 0
+
+    def __str__(self) -> str:
+        """
+        Returns a string representation of the deque.
+
+        Returns:
+            - str: A string representation of the deque.
+        """
+        return '[' + ', '.join(repr(item) for item in self) + ']'
+
+    def __repr__(self) -> str:
+        """
+        Returns a detailed string representation of the deque.
+
+        Returns:
+            - str: A detailed string representation of the deque.
+        """
+        return f"ArrayDeque({' <-> '.join(repr(item) for item in self)}) Count: {self.__count} Capacity: {len(self.__items)}"
+
+    def __check_type(self, item: T) -> None:
+        if not isinstance(item, self.__data_type):
+            raise TypeError(f"{item} is not of type {self.__data_type}")
+
+    def __physical_index(self, index: int) -> int:
+        """
+        Helper function to find where the item index places from the front is stored
+        O(1)
+        """
+        return (self.__front_index + index) % len(self.__items)
+
+    def __circularIncrement(self, index: int) -> int:
+        return (index + 1) % len(self.__items)
+
+    def __segments(self) -> tuple[NDArray, ...]:
+        """
+        Helper function to split the stored items into at most two contiguous views, front to back
+        O(1)
+        """
+        end = self.__front_index + self.__count
+        if end <= len(self.__items):
+            return (self.__items[self.__front_index:end],)
+        return (self.__items[self.__front_index:], self.__items[:end - len(self.__items)])
+
+    def __release(self, physical_index: int) -> None:
+        """
+        Helper function to drop the reference held by a removed slot, so the deque doesn't keep the item alive
+        O(1)
+        """
+        if self.__dtype is object:
+            self.__items[physical_index] = None
+
+    def __shrink_if_sparse(self) -> None:
+        """
+        Helper function to halve the buffer once it's at most a quarter full
+        Shrinking at a quarter rather than a half keeps alternating enqueues and dequeues from resizing every time
+        """
+        capacity = len(self.__items)
+        if capacity > self.__minimum_capacity and self.__count <= capacity // 4:
+            self.__resize(max(capacity // 2, self.__minimum_capacity))
+
+    def __resize(self, new_capacity: int) -> None:
+        """
+        Helper function to move the items to the front of a new buffer
+        O(n)
+        """
+        new_items = np.empty(new_capacity, dtype=self.__dtype)
+        start = 0
+        for segment in self.__segments():
+            new_items[start:start + len(segment)] = segment
+            start += len(segment)
+        self.__items = new_items
+        self.__front_index = 0
+
+
+if __name__ == '__main__':
+    filename = os.path.basename(__file__)
+    print(f'OOPS!\nThis is the {filename} file.\nDid you mean to run your tests or program.py file?\nFor tests, run them from the Test Explorer on the left.')
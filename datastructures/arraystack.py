@@ -1,8 +1,8 @@
 import os
+from typing import Iterator
 
 from datastructures.array import Array, T
 from datastructures.istack import IStack
-from copy import deepcopy
 
 class ArrayStack(IStack[T]):
     ''' ArrayStack class that implements the IStack interface. The ArrayStack is a 
@@ -60,13 +60,12 @@ class ArrayStack(IStack[T]):
         return self.__top == -1
     
     def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ArrayStack):
+            return False
         if len(self) != len(other):
             return False
-        #should I be making a deepcopy of self as well?
-        other_copy = deepcopy(other)
-        #slicing our array type is inefficient, this could be made more efficient by avoiding doing that
-        for item in reversed(self.__stack[0:self.__top+1]):
-            if item != other_copy.pop():
+        for item1, item2 in zip(self, other):
+            if item1 != item2:
                 return False
         return True
 
@@ -74,11 +73,16 @@ class ArrayStack(IStack[T]):
         return self.__top+1
     
     def __contains__(self, item: T) -> bool:
-        #slicing our array type is inefficient, so this could be made more efficient but less readable by writing contains from scratch rather than leveraging our array type's contains function
-        return item in self.__stack[0:self.__top]
+        #slicing our array type returns a view, so this leverages numpy's contains without copying the stack
+        return item in self.__stack[0:self.__top+1]
+
+    def __iter__(self) -> Iterator[T]:
+        #from the bottom of the stack to the top, the order items were pushed in
+        #slicing our array type returns a view, so this doesn't copy the stack
+        return iter(self.__stack[0:self.__top+1])
 
     def __str__(self) -> str:
-        return str([self.__stack[i] for i in range(len(self))])
+        return str(list(self))
     
     def __repr__(self) -> str:
         return f"ArrayStack({self.maxsize}): items: {str(self)}"
@@ -0,0 +1,147 @@
+import asyncio
+from typing import Sequence
+
+from datastructures.circularqueue import CircularQueue
+from datastructures.iqueue import T
+from datastructures.linkedlist import LinkedList
+
+class AsyncCircularQueue(CircularQueue[T]):
+    """ A CircularQueue for asyncio tasks, where put waits for room instead of raising when the queue is full.
+        Items are stored in the preallocated array of CircularQueue, so a burst of producers is held back
+        rather than growing the queue.
+        Waiting tasks are kept in linked lists of futures, woken in the order they started waiting.
+        A cancelled waiter removes itself through its node handle, and passes on a wakeup it had already been given,
+        so cancelling a put or get never loses an item or leaves another waiter asleep.
+        Only safe to use from one event loop's thread.
+    """
+
+    def __init__(self, maxsize: int = 0, data_type=object) -> None:
+        ''' Initializes the AsyncCircularQueue object with a maxsize and data_type.
+
+            Arguments:
+                maxsize: The maximum size of the queue
+                data_type: The type of the elements in the queue
+        '''
+        super().__init__(maxsize, data_type)
+        self.__getters = LinkedList(data_type=asyncio.Future)
+        self.__putters = LinkedList(data_type=asyncio.Future)
+
+    def enqueue(self, item: T) -> None:
+        ''' Adds an item to the rear of the queue without waiting, waking a task waiting in get
+
+            Raises:
+                IndexError: If the queue is full
+        '''
+        super().enqueue(item)
+        AsyncCircularQueue.__wake_next(self.__getters)
+
+    def dequeue(self) -> T:
+        ''' Removes and returns the item at the front of the queue without waiting, waking a task waiting in put
+
+            Raises:
+                IndexError: If the queue is empty
+        '''
+        item = super().dequeue()
+        AsyncCircularQueue.__wake_next(self.__putters)
+        return item
+
+    def put_nowait(self, item: T) -> None:
+        ''' Same as enqueue
+
+            Raises:
+                IndexError: If the queue is full
+        '''
+        self.enqueue(item)
+
+    def get_nowait(self) -> T:
+        ''' Same as dequeue
+
+            Raises:
+                IndexError: If the queue is empty
+        '''
+        return self.dequeue()
+
+    async def put(self, item: T) -> None:
+        ''' Adds an item to the rear of the queue, waiting for room if it's full
+            Wrap it in asyncio.timeout to give up after a while
+        '''
+        while self.full:
+            await AsyncCircularQueue.__wait(self.__putters, lambda: not self.full)
+        self.enqueue(item)
+
+    async def get(self) -> T:
+        ''' Removes and returns the item at the front of the queue, waiting for one if it's empty
+            Wrap it in asyncio.timeout to give up after a while
+        '''
+        while self.empty:
+            await AsyncCircularQueue.__wait(self.__getters, lambda: not self.empty)
+        return self.dequeue()
+
+    async def put_many(self, items: Sequence[T]) -> None:
+        ''' Adds every item to the rear of the queue in order, waiting for room whenever it's full '''
+        for item in items:
+            await self.put(item)
+
+    async def get_many(self, max_items: int) -> list[T]:
+        ''' Waits until the queue has an item, then removes and returns up to max_items items without waiting again
+
+            Returns:
+                The removed items in order, at least one
+        '''
+        items = [await self.get()]
+        while len(items) < max_items and not self.empty:
+            items.append(self.dequeue())
+        return items
+
+    def get_many_nowait(self, max_items: int) -> list[T]:
+        ''' Removes and returns up to max_items items from the front of the queue without waiting
+
+            Returns:
+                The removed items in order, an empty list if the queue is empty
+        '''
+        items = []
+        while len(items) < max_items and not self.empty:
+            items.append(self.dequeue())
+        return items
+
+    def clear(self) -> None:
+        ''' Removes all items from the queue, waking every task waiting in put '''
+        super().clear()
+        while not self.__putters.empty:
+            AsyncCircularQueue.__wake_next(self.__putters)
+
+    def __repr__(self) -> str:
+        return f'Async{super().__repr__()}'
+
+    @staticmethod
+    async def __wait(waiters: LinkedList[asyncio.Future], ready) -> None:
+        '''
+        Helper function to sleep until woken through waiters
+        If cancelled after being woken, passes the wakeup on to the next waiter while ready() still holds
+        '''
+        waiter = asyncio.get_running_loop().create_future()
+        handle = waiters.append(waiter)
+        try:
+            await waiter
+        except BaseException:
+            waiter.cancel()
+            try:
+                waiters.remove_handle(handle)
+            except ValueError:
+                #already removed by the wakeup
+                pass
+            if ready() and not waiter.cancelled():
+                AsyncCircularQueue.__wake_next(waiters)
+            raise
+
+    @staticmethod
+    def __wake_next(waiters: LinkedList[asyncio.Future]) -> None:
+        '''
+        Helper function to wake the longest waiting task that's still waiting
+        O(1) amortized, skipping waiters that were already cancelled
+        '''
+        while not waiters.empty:
+            waiter = waiters.pop_front()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
@@ -1,8 +1,7 @@
-from typing import Any
+from typing import Iterator
 
-from datastructures.array import Array
+from datastructures.array import Array, ArrayView
 from datastructures.iqueue import IQueue, T
-from copy import deepcopy
 
 class CircularQueue(IQueue[T]):
     """ Represents a fixed-size circular queue. The queue
@@ -50,6 +49,8 @@ class CircularQueue(IQueue[T]):
         '''
         if self.full:
             raise IndexError("Queue is full")
+        #the slot is written before the rear index moves past it, and only enqueue moves the rear index,
+        #so a single consumer thread never reads a slot that isn't written yet (SPSCCircularQueue relies on this)
         self.__circularQueue[self.__rear_index] = item
         self.__rear_index = self.__circularIncrement(self.__rear_index)
 
@@ -80,6 +81,7 @@ class CircularQueue(IQueue[T]):
         '''
         if self.empty:
             raise IndexError("Queue is empty")
+        #the slot is read before the front index frees it, and only dequeue moves the front index
         frontItem = self.__circularQueue[self.__front_index]
         self.__front_index = self.__circularIncrement(self.__front_index)
         return frontItem
@@ -142,14 +144,13 @@ class CircularQueue(IQueue[T]):
             Returns:
                 True if this CircularQueue is equal to another object, False otherwise
         '''
+        if not isinstance(other, CircularQueue):
+            return False
         if len(self) != len(other):
             return False
 
-        other_copy = deepcopy(other)
-        self_copy = deepcopy(self)
-
-        for _ in range(len(self)):
-            if self_copy.dequeue() != other_copy.dequeue():
+        for item1, item2 in zip(self, other):
+            if item1 != item2:
                 return False
         return True
     
@@ -167,10 +168,24 @@ class CircularQueue(IQueue[T]):
             Returns:
                 A string representation of the queue
         '''
-        #This is super inefficient, but it at least avoids printing junk data
-        self_copy = deepcopy(self)
-        to_print = [self_copy.dequeue() for _ in range(len(self_copy))]
-        return str(to_print)
+        return str(list(self))
+
+    def __iter__(self) -> Iterator[T]:
+        ''' Returns an iterator over the items from front to rear, without removing them
+
+            Returns:
+                An iterator over the items in the queue
+        '''
+        for segment in self.__segments():
+            yield from segment
+
+    def __contains__(self, item: T) -> bool:
+        ''' Returns True if the item is in the queue, False otherwise
+        
+            Returns:
+                True if the item is in the queue, False otherwise
+        '''
+        return any(item in segment for segment in self.__segments())
 
     def __repr__(self) -> str:
         ''' Returns a developer string representation of the CircularQueue object
@@ -181,4 +196,12 @@ class CircularQueue(IQueue[T]):
         return f'ArrayQueue({repr(self.__circularQueue)})'
                                   
     def __circularIncrement(self, index: int) -> int:
-        return (index + 1) % self.maxsize
\ No newline at end of file
+        return (index + 1) % self.maxsize
+
+    def __segments(self) -> tuple[ArrayView[T], ...]:
+        ''' Splits the items between the front and rear into at most two views of the array, front to rear
+            Slicing an Array returns a view, so this doesn't copy the queue
+        '''
+        if self.__front_index <= self.__rear_index:
+            return (self.__circularQueue[self.__front_index:self.__rear_index],)
+        return (self.__circularQueue[self.__front_index:], self.__circularQueue[:self.__rear_index])
@@ -0,0 +1,196 @@
+from copy import deepcopy
+import threading
+from typing import Any, Iterator, Optional, Sequence
+
+from datastructures.circularqueue import CircularQueue
+from datastructures.iqueue import T
+
+class ConcurrentCircularQueue(CircularQueue[T]):
+    """ A CircularQueue that can be shared between any number of producer and consumer threads.
+        Every operation holds one lock, and the blocking put and get wait on conditions sharing that lock,
+        so a waiting thread sleeps until another thread makes room or adds an item instead of polling.
+        Items are stored in the preallocated array of CircularQueue, so the queue never grows.
+        For exactly one producer thread and one consumer thread, SPSCCircularQueue avoids the lock.
+    """
+
+    def __init__(self, maxsize: int = 0, data_type=object) -> None:
+        ''' Initializes the ConcurrentCircularQueue object with a maxsize and data_type.
+
+            Arguments:
+                maxsize: The maximum size of the queue
+                data_type: The type of the elements in the queue
+        '''
+        super().__init__(maxsize, data_type)
+        #reentrant, so the methods below can use each other and CircularQueue's methods while holding it
+        self.__lock = threading.RLock()
+        self.__not_empty = threading.Condition(self.__lock)
+        self.__not_full = threading.Condition(self.__lock)
+
+    def enqueue(self, item: T) -> None:
+        ''' Adds an item to the rear of the queue without waiting
+
+            Raises:
+                IndexError: If the queue is full
+        '''
+        with self.__lock:
+            super().enqueue(item)
+            self.__not_empty.notify()
+
+    def dequeue(self) -> T:
+        ''' Removes and returns the item at the front of the queue without waiting
+
+            Raises:
+                IndexError: If the queue is empty
+        '''
+        with self.__lock:
+            item = super().dequeue()
+            self.__not_full.notify()
+            return item
+
+    def put(self, item: T, timeout: Optional[float] = None) -> None:
+        ''' Adds an item to the rear of the queue, waiting for room if it's full
+
+            Arguments:
+                item: The item to add to the queue
+                timeout: The most seconds to wait, or None to wait as long as it takes
+
+            Raises:
+                TimeoutError: If the queue is still full after timeout seconds
+        '''
+        with self.__not_full:
+            if not self.__not_full.wait_for(lambda: not super(ConcurrentCircularQueue, self).full, timeout):
+                raise TimeoutError("Queue is full")
+            self.enqueue(item)
+
+    def get(self, timeout: Optional[float] = None) -> T:
+        ''' Removes and returns the item at the front of the queue, waiting for one if it's empty
+
+            Arguments:
+                timeout: The most seconds to wait, or None to wait as long as it takes
+
+            Raises:
+                TimeoutError: If the queue is still empty after timeout seconds
+        '''
+        with self.__not_empty:
+            if not self.__not_empty.wait_for(lambda: not super(ConcurrentCircularQueue, self).empty, timeout):
+                raise TimeoutError("Queue is empty")
+            return self.dequeue()
+
+    def try_enqueue(self, item: T) -> bool:
+        ''' Adds an item to the rear of the queue if there's room
+
+            Returns:
+                True if the item was added, False if the queue is full
+        '''
+        with self.__lock:
+            if super().full:
+                return False
+            self.enqueue(item)
+            return True
+
+    def try_dequeue(self, default: Any = None) -> T:
+        ''' Removes and returns the item at the front of the queue if there is one
+
+            Returns:
+                The item at the front of the queue, or default if the queue is empty
+        '''
+        with self.__lock:
+            if super().empty:
+                return default
+            return self.dequeue()
+
+    def enqueue_many(self, items: Sequence[T]) -> int:
+        ''' Adds items to the rear of the queue in order, until they run out or the queue is full
+
+            Returns:
+                The number of items added, so items[count:] are the ones that didn't fit
+        '''
+        with self.__lock:
+            count = 0
+            for item in items:
+                if super().full:
+                    break
+                super().enqueue(item)
+                count += 1
+            self.__not_empty.notify(count)
+            return count
+
+    def dequeue_many(self, max_items: int) -> list[T]:
+        ''' Removes and returns up to max_items items from the front of the queue, without waiting
+
+            Returns:
+                The removed items in order, an empty list if the queue is empty
+        '''
+        with self.__lock:
+            items = []
+            while len(items) < max_items and not super().empty:
+                items.append(super().dequeue())
+            self.__not_full.notify(len(items))
+            return items
+
+    def clear(self) -> None:
+        ''' Removes all items from the queue '''
+        with self.__lock:
+            super().clear()
+            self.__not_full.notify_all()
+
+    @property
+    def front(self) -> T:
+        with self.__lock:
+            return super().front
+
+    @property
+    def full(self) -> bool:
+        with self.__lock:
+            return super().full
+
+    @property
+    def empty(self) -> bool:
+        with self.__lock:
+            return super().empty
+
+    def __len__(self) -> int:
+        with self.__lock:
+            return super().__len__()
+
+    def __iter__(self) -> Iterator[T]:
+        ''' Returns an iterator over a snapshot of the items taken while holding the lock,
+            so other threads can keep using the queue while it's iterated
+        '''
+        with self.__lock:
+            return iter(list(super().__iter__()))
+
+    def __contains__(self, item: T) -> bool:
+        with self.__lock:
+            return super().__contains__(item)
+
+    def __eq__(self, other: object) -> bool:
+        ''' Compares against a snapshot of other's items taken before acquiring this queue's lock,
+            so a == b and b == a running in two threads can't deadlock by taking the two locks in opposite orders
+        '''
+        if not isinstance(other, CircularQueue):
+            return False
+        other_items = list(other)
+        with self.__lock:
+            return list(super().__iter__()) == other_items
+
+    def __str__(self) -> str:
+        with self.__lock:
+            return super().__str__()
+
+    def __deepcopy__(self, memo: dict) -> "ConcurrentCircularQueue[T]":
+        ''' Returns a deep copy of the queue's items, taken while holding the lock, with locks of its own '''
+        with self.__lock:
+            copied = object.__new__(type(self))
+            memo[id(self)] = copied
+            for name, value in vars(self).items():
+                if not isinstance(value, (type(self.__lock), threading.Condition)):
+                    setattr(copied, name, deepcopy(value, memo))
+            copied.__lock = threading.RLock()
+            copied.__not_empty = threading.Condition(copied.__lock)
+            copied.__not_full = threading.Condition(copied.__lock)
+            return copied
+
+    def __repr__(self) -> str:
+        with self.__lock:
+            return f'Concurrent{super().__repr__()}'
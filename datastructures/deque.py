@@ -1,7 +1,7 @@
 import os
 from datastructures.iqueue import IQueue
 from datastructures.linkedlist import LinkedList
-from typing import TypeVar
+from typing import Optional, TypeVar
 
 T = TypeVar('T')
 
@@ -10,14 +10,16 @@ class Deque[T](IQueue[T]):
     A double-ended queue (deque) implementation.
     """
 
-    def __init__(self, data_type: type = object) -> None:
+    def __init__(self, data_type: type = object, node_pool: Optional[LinkedList.NodePool] = None, list_type: type = LinkedList) -> None:
         """
         Initializes the deque with a specified data type.
 
         Args:
             - data_type (type): The type of data the deque will hold.
+            - node_pool (LinkedList.NodePool): Optional pool to recycle the nodes of dequeued items through.
+            - list_type (type): The ILinkedList implementation to store items in, LinkedList or UnrolledLinkedList.
         """
-        self.__queue = LinkedList(data_type)
+        self.__queue = list_type(data_type) if node_pool is None else list_type(data_type, node_pool=node_pool)
 
     def enqueue(self, item: T) -> None:
         """
@@ -1,24 +1,84 @@
-import copy
+from __future__ import annotations
+from collections.abc import Mapping, Sequence, Set as AbstractSet
 from typing import Callable, Iterator, Optional, Tuple
 from datastructures.ihashmap import KT, VT, IHashMap
-from datastructures.array import Array
+import numpy as np
+from numpy.typing import NDArray
 import pickle
-import hashlib
 from datastructures.linkedlist import LinkedList
 from datastructures.primesieve import PrimeSieve
 
+def default_hash_function(key: KT) -> int:
+    """
+    Default hash function for the HashMap.
+    Uses the built-in hash() for hashable keys, so keys that are equal to each other hash the same, as in a dict.
+    Unhashable mappings, sets, sequences and bytearrays are hashed from the hashes of their items,
+    ignoring order for mappings and sets, so equal keys like {1: 2, 3: 4} and {3: 4, 1: 2} or [1] and [1.0] hash the same.
+    Any other unhashable key is serialized with pickle, or repr() if it can't be pickled, and the bytes are hashed.
+    Those keys only hash the same if they serialize the same, so equal keys aren't guaranteed to collide.
+    Hashes are consistent within a process, but strings and bytes hash differently between processes.
+    Warning: This method is not suitable
+    for unhashable keys that have mutable state.
+
+    Args:
+        key (KT): The key to hash.
+    Returns:
+        int: The hash value of the key.
+    """
+    try:
+        return hash(key)
+    except TypeError:
+        pass
+    try:
+        key_hash = _canonical_hash(key)
+    except RecursionError:
+        #self referencing containers can't be hashed from their items
+        key_hash = None
+    if key_hash is not None:
+        return key_hash
+    try:
+        key_bytes = pickle.dumps(key)
+    except Exception:
+        key_bytes = repr(key).encode()
+    return hash(key_bytes)
+
+
+def _canonical_hash(key: object) -> Optional[int]:
+    """
+    hashes unhashable containers from their items, recursing into items that are unhashable themselves
+    returns None for keys that aren't containers
+    O(n) in the number of nested items
+    """
+    if isinstance(key, (bytearray, memoryview)):
+        return hash(bytes(key))
+    if isinstance(key, Mapping):
+        #a frozenset's hash doesn't depend on order
+        return hash(frozenset((default_hash_function(item_key), default_hash_function(value)) for item_key, value in key.items()))
+    if isinstance(key, AbstractSet):
+        return hash(frozenset(key))
+    if isinstance(key, Sequence):
+        return hash(tuple(default_hash_function(item) for item in key))
+    return None
+
+
 class HashMap(IHashMap[KT, VT]):
     prime_sieve = PrimeSieve()
 
     class ChainLink:
 
-        def __init__(self, key: KT, val: VT):
+        def __init__(self, key: KT, val: VT, key_hash: int):
             self.__key = key
             self.__val = val
+            #cached so resizing and probing chains never call the hash function again
+            self.__hash = key_hash
         
         @property
         def key(self) -> KT:
             return self.__key
+
+        @property
+        def hash(self) -> int:
+            return self.__hash
         
         @property
         def val(self) -> VT:
@@ -31,123 +91,190 @@ class HashMap(IHashMap[KT, VT]):
             return self.key == other.key and self.val == other.val
 
     def __init__(self, number_of_buckets=7, load_factor=0.75, custom_hash_function: Optional[Callable[[KT], int]]=None) -> None:
-        self.__buckets: Array[LinkedList[HashMap.ChainLink]] = \
-            Array([LinkedList(data_type=HashMap.ChainLink) for _ in range(number_of_buckets)], data_type=LinkedList)
+        self.__buckets: NDArray = HashMap.__empty_buckets(number_of_buckets)
+        #while resizing, buckets are migrated from the old table a few at a time
+        #old buckets before __migration_index have already been moved into __buckets
+        self.__old_buckets: Optional[NDArray] = None
+        self.__migration_index: int = 0
         self.__count: int = 0
         self.__load_factor_threshold: float = load_factor
-        self.__hash_function = custom_hash_function if custom_hash_function is not None else HashMap.__default_hash_function
-        self.__prime_iter = iter(HashMap.prime_sieve)
+        self.__hash_function = custom_hash_function if custom_hash_function is not None else default_hash_function
 
     def __getitem__(self, key: KT) -> VT:
-        chain: LinkedList[HashMap.ChainLink] = self.__buckets[self.__get_bucket_index(key)]
-        for link in chain:
-            if link.key == key:
-                return link.val
+        key_hash = self.__hash_function(key)
+        chain: Optional[LinkedList[HashMap.ChainLink]] = self.__find_chain(key_hash)
+        if chain is not None:
+            for link in chain:
+                if link.hash == key_hash and link.key == key:
+                    return link.val
         raise KeyError(f"{key} not in HashMap")
 
     def __setitem__(self, key: KT, value: VT) -> None:
         if len(self) >= self.__load_factor_threshold * len(self.__buckets):
             self.__resize()
+        self.__migrate(HashMap.MIGRATION_STEP)
 
-        chain: LinkedList[HashMap.ChainLink] = self.__buckets[self.__get_bucket_index(key)]
-        for link in chain:
-            if link.key == key:
-                link.val = value
-                return
-        chain.append(HashMap.ChainLink(key, value))
+        key_hash = self.__hash_function(key)
+        chain: Optional[LinkedList[HashMap.ChainLink]] = self.__find_chain(key_hash)
+        if chain is not None:
+            for link in chain:
+                if link.hash == key_hash and link.key == key:
+                    link.val = value
+                    return
+        self.__insert_link(HashMap.ChainLink(key, value, key_hash))
         self.__count += 1
 
     def keys(self) -> Iterator[KT]:
-        for chain in self.__buckets:
-            for link in chain:
-                yield link.key
+        for link in self.__links():
+            yield link.key
     
     def values(self) -> Iterator[VT]:
-        for chain in self.__buckets:
-            for link in chain:
-                yield link.val
+        for link in self.__links():
+            yield link.val
 
     def items(self) -> Iterator[Tuple[KT, VT]]:
-        for chain in self.__buckets:
-            for link in chain:
-                yield (link.key, link.val)
+        for link in self.__links():
+            yield (link.key, link.val)
             
     def __delitem__(self, key: KT) -> None:
-        chain: LinkedList[HashMap.ChainLink] = self.__buckets[self.__get_bucket_index(key)]
+        self.__migrate(HashMap.MIGRATION_STEP)
+        key_hash = self.__hash_function(key)
+        chain: Optional[LinkedList[HashMap.ChainLink]] = self.__find_chain(key_hash)
         val = self[key]
-        chain.remove(HashMap.ChainLink(key, val))
+        chain.remove(HashMap.ChainLink(key, val, key_hash))
         self.__count -= 1
     
     def __contains__(self, key: KT) -> bool:
-        chain: LinkedList[HashMap.ChainLink] = self.__buckets[self.__get_bucket_index(key)]
-        for link in chain:
-            if link.key == key:
-                return True
+        key_hash = self.__hash_function(key)
+        chain: Optional[LinkedList[HashMap.ChainLink]] = self.__find_chain(key_hash)
+        if chain is not None:
+            for link in chain:
+                if link.hash == key_hash and link.key == key:
+                    return True
         return False
     
     def __len__(self) -> int:
         return self.__count
     
     def __iter__(self) -> Iterator[KT]:
-        for chain in self.__buckets:
-            for link in chain:
-                yield link.key
+        return self.keys()
     
     def __eq__(self, other: object) -> bool:
-        if not isinstance(other, HashMap):
+        if not isinstance(other, IHashMap):
+            return False
+        #compared by lookup rather than by zipping items, since equal maps can store their items in a different order
+        if len(self) != len(other):
             return False
-        #If self and other contain the same values but are hashed differently this will give false. Idk if that's correct behavior or if I need to think of a way to correct that
-        for ((k1, v1), (k2, v2)) in zip(self.items(), other.items()):
-            if (k1 != k2) or (v1 != v2):
+        for key, value in self.items():
+            if key not in other or other[key] != value:
                 return False
         return True
 
     def __str__(self) -> str:
-        return "{" + ", ".join(f"{key}: {value}" for key, value in self) + "}"
+        return "{" + ", ".join(f"{key}: {value}" for key, value in self.items()) + "}"
     
     def __repr__(self) -> str:
         return f"HashMap({str(self)})"
+
+    #number of old buckets moved into the new table by each __setitem__ and __delitem__ while resizing
+    #the table at least doubles, so migrating 2 or more buckets per insert finishes before the next resize is needed
+    MIGRATION_STEP: int = 4
     
     def __resize(self, number_of_buckets: Optional[int] = None):
+        """
+        Starts an incremental resize
+        The current buckets become the old table, and later operations migrate them into the new table a few at a time
+        """
+        #an unfinished resize has to be completed before starting another
+        if self.__old_buckets is not None:
+            self.__migrate(len(self.__old_buckets))
+
         #Find the next prime that's at least double the current size
         if number_of_buckets is None:
-            working_prime = next(self.__prime_iter)
-            while working_prime < 2*len(self.__buckets):
-                working_prime = next(self.__prime_iter)
-            number_of_buckets = working_prime
-        
-        new_buckets: Array[LinkedList[HashMap.ChainLink]] = \
-            Array([LinkedList(data_type=HashMap.ChainLink) for _ in range(number_of_buckets)], data_type=LinkedList)
+            number_of_buckets = HashMap.prime_sieve.next_prime_at_least(2*len(self.__buckets))
         
-        for key, val in self.items():
-            new_buckets[self.__get_bucket_index(key, number_of_buckets)].append(HashMap.ChainLink(key, val))
+        self.__old_buckets = self.__buckets
+        self.__buckets = HashMap.__empty_buckets(number_of_buckets)
+        self.__migration_index = 0
 
-    def __get_bucket_index(self, key: KT, num_buckets: Optional[int] = None) -> int:
+    def __migrate(self, max_buckets: int) -> None:
         """
-        Helper function to convert key to bucket index
-        Uses len(self) if num_buckets is None
+        Helper function to move up to max_buckets chains from the old table into the new table
+        Links are moved as they are, so keys are never hashed again
+        Does nothing if no resize is in progress
         """
-        bucket_index = self.__hash_function(key)
-        return bucket_index % (num_buckets if num_buckets is not None else len(self.__buckets))
-    
+        if self.__old_buckets is None:
+            return
+        stop = min(self.__migration_index + max_buckets, len(self.__old_buckets))
+        for bucket_index in range(self.__migration_index, stop):
+            chain: Optional[LinkedList[HashMap.ChainLink]] = self.__old_buckets[bucket_index]
+            if chain is None:
+                continue
+            while not chain.empty:
+                link = chain.pop_front()
+                self.__append_to_bucket(self.__buckets, self.__get_bucket_index(link.hash), link)
+            self.__old_buckets[bucket_index] = None
+        self.__migration_index = stop
+        if stop == len(self.__old_buckets):
+            self.__old_buckets = None
+
+    def __locate(self, key_hash: int) -> Tuple[NDArray, int]:
+        """
+        Helper function to find the table and bucket index a key's hash belongs in
+        Keys whose old bucket hasn't been migrated yet stay in the old table until it is
+        """
+        if self.__old_buckets is not None:
+            old_index = self.__get_bucket_index(key_hash, len(self.__old_buckets))
+            if old_index >= self.__migration_index:
+                return self.__old_buckets, old_index
+        return self.__buckets, self.__get_bucket_index(key_hash)
+
+    def __find_chain(self, key_hash: int) -> Optional[LinkedList[HashMap.ChainLink]]:
+        """
+        Helper function to get the chain a key's hash belongs in
+        Returns None if no key has been put in that bucket yet
+        """
+        table, bucket_index = self.__locate(key_hash)
+        return table[bucket_index]
+
+    def __insert_link(self, link: ChainLink) -> None:
+        """
+        Helper function to append a link to the chain its hash belongs in
+        """
+        table, bucket_index = self.__locate(link.hash)
+        self.__append_to_bucket(table, bucket_index, link)
+
+    @staticmethod
+    def __append_to_bucket(table: NDArray, bucket_index: int, link: ChainLink) -> None:
+        """
+        Helper function to append a link to a bucket's chain, creating the chain if needed
+        """
+        if table[bucket_index] is None:
+            table[bucket_index] = LinkedList(data_type=HashMap.ChainLink)
+        table[bucket_index].append(link)
+
+    def __links(self) -> Iterator[ChainLink]:
+        """
+        Helper function to iterate through every link, including links still waiting in the old table
+        """
+        tables = [self.__buckets] if self.__old_buckets is None else [self.__old_buckets[self.__migration_index:], self.__buckets]
+        for table in tables:
+            for chain in table:
+                if chain is not None:
+                    yield from chain
+
     @staticmethod
-    def __default_hash_function(key: KT) -> int:
-        """
-        Default hash function for the HashMap.
-        Uses Pickle to serialize the key and then hashes it using SHA-256. 
-        Uses pickle for serialization (to capture full object structure).
-        Falls back to repr() if the object is not pickleable (e.g., open file handles, certain C extensions).
-        Returns a consistent integer hash.
-        Warning: This method is not suitable
-        for keys that are not hashable or have mutable state.
-
-        Args:
-            key (KT): The key to hash.
-        Returns:
-            int: The hash value of the key.
-        """
-        try:
-            key_bytes = pickle.dumps(key)
-        except Exception:
-            key_bytes = repr(key).encode()
-        return int(hashlib.md5(key_bytes).hexdigest(), 16)
\ No newline at end of file
+    def __empty_buckets(number_of_buckets: int) -> NDArray:
+        """
+        Helper function to allocate a table of empty buckets
+        Chains are only created once a key lands in their bucket, so allocating a table is a single numpy allocation
+        The table is a plain numpy array rather than an Array, so storing a chain doesn't deep copy it
+        """
+        return np.empty(number_of_buckets, dtype=object)
+
+    def __get_bucket_index(self, key_hash: int, num_buckets: Optional[int] = None) -> int:
+        """
+        Helper function to convert a key's hash to bucket index
+        Uses len(self) if num_buckets is None
+        """
+        return key_hash % (num_buckets if num_buckets is not None else len(self.__buckets))
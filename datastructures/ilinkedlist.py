@@ -2,7 +2,7 @@ from __future__ import annotations
 from abc import abstractmethod
 import abc
 import os
-from typing import Sequence, TypeVar
+from typing import Iterator, Sequence, TypeVar
 
 T = TypeVar('T')
 
@@ -397,9 +397,10 @@ class ILinkedList[T](abc.ABC):
         ...
     
     @abstractmethod
-    def __iter__(self) -> ILinkedList[T]:
+    def __iter__(self) -> Iterator[T]:
 
-        ''' Returns an iterator for the list
+        ''' Returns a new iterator over the items in the list, from front to back
+            Each call returns an independent iterator, so a list can be iterated by several loops at once
         
             Examples:
                 >>> linked_list = LinkedList(data_type=str)
@@ -418,37 +419,6 @@ class ILinkedList[T](abc.ABC):
         '''
         ...
 
-    @abstractmethod
-    def __next__(self) -> T:
-
-        ''' Returns the next item in the list
-        
-            Examples:
-                >>> linked_list = LinkedList(data_type=str)
-                >>> linked_list.append('dog')
-                >>> linked_list.append('cat')
-                >>> linked_list.append('mouse')
-                >>> iterator = iter(linked_list)
-                >>> next(iterator)
-                'dog'
-                >>> next(iterator)
-                'cat'
-                >>> next(iterator)
-                'mouse'
-                >>> next(iterator)
-                Traceback (most recent call last):
-                    ...
-                StopIteration
-                
-
-            Returns:
-                The next item in the list
-
-            Raises:
-                StopIteration: If there are no more items in the list
-        '''
-        ...
-
     @abstractmethod
     def __eq__(self, other: object) -> bool:
 
@@ -2,62 +2,215 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 import os
-from typing import Iterator, Optional, Sequence
+from typing import Iterable, Iterator, Optional, Sequence
 from datastructures.ilinkedlist import ILinkedList, T
 
 
 class LinkedList[T](ILinkedList[T]):
 
-    @dataclass
+    @dataclass(slots=True)
     class Node:
         data: T
         next: Optional[LinkedList.Node] = None
         previous: Optional[LinkedList.Node] = None
+        #token of the list the node is in, None once it's removed
+        owner: Optional[LinkedList.Owner] = None
 
-    def __init__(self, data_type: type = object) -> None:
+    class Owner:
+        """
+        Token identifying which list a node handle belongs to
+        When a list's nodes are spliced into another list, its token is forwarded to the other list's token,
+        so the moved handles are recognized without visiting every node
+        """
+        __slots__ = ("forward",)
+
+        def __init__(self) -> None:
+            self.forward: Optional[LinkedList.Owner] = None
+
+    class NodePool:
+        """
+        Free list of nodes released by pop, pop_front and remove, handed back out instead of allocating new nodes
+        Free nodes are chained through their next field, so the pool needs no storage of its own
+        Can be shared by several lists, holds at most max_size free nodes
+        A handle to a removed node can end up pointing at a reused node, so don't keep handles after removing them
+        """
+        def __init__(self, max_size: int = 1024) -> None:
+            self.__free: Optional[LinkedList.Node] = None
+            self.__count = 0
+            self.__max_size = max_size
+
+        def acquire(self, data: T) -> LinkedList.Node:
+            """
+            Returns a node holding data, reusing a free node if there is one
+            O(1)
+            """
+            node = self.__free
+            if node is None:
+                return LinkedList.Node(data)
+            self.__free = node.next
+            self.__count -= 1
+            node.data = data
+            node.next = None
+            return node
+
+        def release(self, node: LinkedList.Node) -> None:
+            """
+            Returns a node that's no longer in any list to the pool, dropping it if the pool is full
+            O(1)
+            """
+            if self.__count >= self.__max_size:
+                return
+            #drop references so the pool doesn't keep items alive
+            node.data = None
+            node.previous = None
+            node.next = self.__free
+            self.__free = node
+            self.__count += 1
+
+        def __len__(self) -> int:
+            return self.__count
+
+    def __init__(self, data_type: type = object, node_pool: Optional[LinkedList.NodePool] = None) -> None:
         self.__data_type = data_type
         self.__head: Optional[LinkedList.Node] = None
         self.__tail: Optional[LinkedList.Node] = None
         self.__count = 0
+        #optional pool removed nodes are released to and new nodes are acquired from
+        self.__node_pool = node_pool
+        self.__owner = LinkedList.Owner()
 
     @staticmethod
     def from_sequence(sequence: Sequence[T], data_type: type=object) -> LinkedList[T]:
         outputList = LinkedList(data_type=data_type)
-        for item in sequence:
-            outputList.append(item)
+        outputList.extend(sequence)
         
         return outputList
 
-    def append(self, item: T) -> None:
-        if not isinstance(item, self.__data_type):
-            raise TypeError(f"{item} is not of type {self.__data_type}")
-        new_node: LinkedList.Node = LinkedList.Node(data = item)
+    @staticmethod
+    def concat(*lists: LinkedList[T], data_type: Optional[type] = None) -> LinkedList[T]:
+        """
+        Returns a new list holding the nodes of every list in order, leaving those lists empty
+        O(number of lists), no nodes are copied
+        data_type defaults to the first list's type
+        Raises:
+            TypeError: if a list's type isn't a subclass of data_type
+        """
+        if data_type is None:
+            data_type = lists[0].__data_type if lists else object
+        outputList = LinkedList(data_type=data_type)
+        for linked_list in lists:
+            outputList.splice(linked_list)
+        return outputList
 
-        if self.empty:
-            self.__head = self.__tail = new_node
+    def extend(self, items: Iterable[T]) -> None:
+        """
+        Appends every item in items
+        The items are linked into a chain of their own first, so nothing is added if one has the wrong type
+        Items from a LinkedList whose type is a subclass of this list's type aren't type checked again
+        O(k) for k items
+        Raises:
+            TypeError: if an item is not of the correct type
+        """
+        trusted = isinstance(items, LinkedList) and issubclass(items.__data_type, self.__data_type)
+        head: Optional[LinkedList.Node] = None
+        tail: Optional[LinkedList.Node] = None
+        count = 0
+        for item in items:
+            if not trusted and not isinstance(item, self.__data_type):
+                raise TypeError(f"{item} is not of type {self.__data_type}")
+            new_node = self.__new_node(item)
+            if tail is None:
+                head = new_node
+            else:
+                tail.next = new_node
+                new_node.previous = tail
+            tail = new_node
+            count += 1
+        self.__attach(head, tail, count)
+
+    def splice(self, other: LinkedList[T]) -> None:
+        """
+        Moves every node of other to the back of this list, leaving other empty
+        O(1), handles into other stay valid and now belong to this list
+        Raises:
+            TypeError: if other's type isn't a subclass of this list's type
+        """
+        if not issubclass(other.__data_type, self.__data_type):
+            raise TypeError(f"a list of {other.__data_type} can't be spliced into a list of {self.__data_type}")
+        if other is self:
+            raise ValueError("a list can't be spliced into itself")
+        head, tail, count = other.__head, other.__tail, other.__count
+        owner = other.__owner
+        other.clear()
+        #other's nodes now belong to this list without relabelling them
+        owner.forward = self.__owner
+        self.__attach(head, tail, count)
+
+    def split_at(self, position: int | LinkedList.Node) -> LinkedList[T]:
+        """
+        Moves the nodes from position to the back into a new list and returns it
+        position is either an index or a node handle, which becomes the new list's front
+        O(min(i, n - i)) for an index i, O(k) for a handle with k nodes from it to the back, since they're counted
+        Handles to the moved nodes belong to the new list afterwards
+        Raises:
+            IndexError: if the index is out of range
+            ValueError: if the handle has been removed from the list, or belongs to another list
+        """
+        if isinstance(position, int):
+            if not 0 <= position <= self.__count:
+                raise IndexError(f"split index {position} is out of range")
+            count = self.__count - position
+            first = self.__node_at(position) if count > 0 else None
         else:
-            self.__tail.next = new_node
-            new_node.previous = self.__tail
-            self.__tail = new_node
-        
-        self.__count += 1
+            self.__check_handle(position)
+            first = position
+            count = 0
+            travel = first
+            while travel is not None:
+                count += 1
+                travel = travel.next
+
+        outputList = LinkedList(data_type=self.__data_type, node_pool=self.__node_pool)
+        if first is None:
+            return outputList
+        last = self.__tail
+        self.__tail = first.previous
+        if first.previous is None:
+            self.__head = None
+        else:
+            first.previous.next = None
+            first.previous = None
+        #relabels whichever part is smaller, so handles follow their nodes without visiting the whole list
+        if count <= self.__count - count:
+            LinkedList.__relabel(first, count, outputList.__owner)
+        else:
+            outputList.__owner, self.__owner = self.__owner, LinkedList.Owner()
+            LinkedList.__relabel(self.__head, self.__count - count, self.__owner)
+        self.__count -= count
+        outputList.__attach(first, last, count)
+        return outputList
 
-    def prepend(self, item: T) -> None:
+    def append(self, item: T) -> LinkedList.Node:
+        """
+        Returns the new node as a handle, which can be passed to the *_handle methods and move_to_* in O(1)
+        """
         if not isinstance(item, self.__data_type):
             raise TypeError(f"{item} is not of type {self.__data_type}")
+        new_node: LinkedList.Node = self.__new_node(item)
+        self.__link_after(self.__tail, new_node)
+        return new_node
 
-        new_node: LinkedList.Node = LinkedList.Node(data = item)
-
-        if self.empty:
-            self.__head = self.__tail = new_node
-        else:
-            self.__head.previous = new_node
-            new_node.next = self.__tail
-            self.__head = new_node
-        
-        self.__count += 1
+    def prepend(self, item: T) -> LinkedList.Node:
+        """
+        Returns the new node as a handle, which can be passed to the *_handle methods and move_to_* in O(1)
+        """
+        if not isinstance(item, self.__data_type):
+            raise TypeError(f"{item} is not of type {self.__data_type}")
+        new_node: LinkedList.Node = self.__new_node(item)
+        self.__link_before(self.__head, new_node)
+        return new_node
 
-    def insert_before(self, target: T, item: T) -> None:
+    def insert_before(self, target: T, item: T) -> LinkedList.Node:
         if not isinstance(item, self.__data_type):
             raise TypeError(f"{item} is not of type {self.__data_type}")
         if not isinstance(target, self.__data_type):
@@ -65,16 +218,11 @@ class LinkedList[T](ILinkedList[T]):
         target_node = LinkedList.__find_following(self.__head, target)
         if target_node is None:
             raise ValueError(f"The target item {target} is not in the linked list")
-        new_node = LinkedList.Node(item)
-        
-        new_node.next = target_node
-        new_node.previous = target_node.previous
-        target_node.previous.next = new_node
-        target_node.previous = new_node
-
-        self.__count += 1
+        new_node = self.__new_node(item)
+        self.__link_before(target_node, new_node)
+        return new_node
 
-    def insert_after(self, target: T, item: T) -> None:
+    def insert_after(self, target: T, item: T) -> LinkedList.Node:
         if not isinstance(item, self.__data_type):
             raise TypeError(f"{item} is not of type {self.__data_type}")
         if not isinstance(target, self.__data_type):
@@ -82,14 +230,76 @@ class LinkedList[T](ILinkedList[T]):
         target_node = LinkedList.__find_following(self.__head, target)
         if target_node is None:
             raise ValueError(f"The target item {target} is not in the linked list")
-        new_node = LinkedList.Node(item)
-        
-        new_node.previous = target_node
-        new_node.next = target_node.next
-        target_node.next.previous = new_node
-        target_node.next = new_node
-        
-        self.__count += 1
+        new_node = self.__new_node(item)
+        self.__link_after(target_node, new_node)
+        return new_node
+
+    def insert_before_handle(self, handle: LinkedList.Node, item: T) -> LinkedList.Node:
+        """
+        Adds an item before the node handle, returning the new node's handle
+        O(1)
+        Raises:
+            TypeError: if the item is not of the correct type
+            ValueError: if handle has been removed from the list, or belongs to another list
+        """
+        if not isinstance(item, self.__data_type):
+            raise TypeError(f"{item} is not of type {self.__data_type}")
+        self.__check_handle(handle)
+        new_node = self.__new_node(item)
+        self.__link_before(handle, new_node)
+        return new_node
+
+    def insert_after_handle(self, handle: LinkedList.Node, item: T) -> LinkedList.Node:
+        """
+        Adds an item after the node handle, returning the new node's handle
+        O(1)
+        Raises:
+            TypeError: if the item is not of the correct type
+            ValueError: if handle has been removed from the list, or belongs to another list
+        """
+        if not isinstance(item, self.__data_type):
+            raise TypeError(f"{item} is not of type {self.__data_type}")
+        self.__check_handle(handle)
+        new_node = self.__new_node(item)
+        self.__link_after(handle, new_node)
+        return new_node
+
+    def remove_handle(self, handle: LinkedList.Node) -> T:
+        """
+        Removes the node handle from the list and returns its item
+        The removed node's links are cleared, so it no longer reaches its old neighbours
+        O(1)
+        Raises:
+            ValueError: if handle has already been removed from the list, or belongs to another list
+        """
+        self.__check_handle(handle)
+        out = handle.data
+        self.__remove_node(handle)
+        return out
+
+    def move_to_front(self, handle: LinkedList.Node) -> None:
+        """
+        Moves the node handle to the front of the list, keeping the handle valid
+        O(1)
+        Raises:
+            ValueError: if handle has been removed from the list, or belongs to another list
+        """
+        self.__check_handle(handle)
+        if handle is not self.__head:
+            self.__unlink(handle)
+            self.__link_before(self.__head, handle)
+
+    def move_to_back(self, handle: LinkedList.Node) -> None:
+        """
+        Moves the node handle to the back of the list, keeping the handle valid
+        O(1)
+        Raises:
+            ValueError: if handle has been removed from the list, or belongs to another list
+        """
+        self.__check_handle(handle)
+        if handle is not self.__tail:
+            self.__unlink(handle)
+            self.__link_after(self.__tail, handle)
 
     def remove(self, item: T) -> None:
         if not isinstance(item, self.__data_type):
@@ -105,9 +315,10 @@ class LinkedList[T](ILinkedList[T]):
             raise TypeError(f"{item} is not of type {self.__data_type}")
         target_node = LinkedList.__find_following(self.__head, item)
         while target_node is not None:
+            following = target_node.next
             self.__remove_node(target_node)
 
-            target_node = LinkedList.__find_following(target_node.next, item)
+            target_node = LinkedList.__find_following(following, item)
 
     @staticmethod
     def __find_following(start: Node, target: T) -> Optional[Node]:
@@ -127,9 +338,112 @@ class LinkedList[T](ILinkedList[T]):
 
         return None
 
-    def __remove_node(self, target_node: Node):
+    def __new_node(self, item: T) -> Node:
         """
-        internal helping function to remove a node from a reference
+        internal helping function to make a node, from the node pool if there is one
+        O(1)
+        """
+        new_node = LinkedList.Node(item) if self.__node_pool is None else self.__node_pool.acquire(item)
+        new_node.owner = self.__owner
+        return new_node
+
+    def __check_handle(self, handle: Node) -> None:
+        """
+        internal helping function to reject handles to nodes that have been removed or are in another list
+        Follows the handle's owner token through any splices, and shortens the chain for next time
+        ammortized O(1)
+        """
+        owner = handle.owner
+        if owner is None:
+            raise ValueError("The node handle is not in the linked list")
+        while owner.forward is not None:
+            owner = owner.forward
+        handle.owner = owner
+        if owner is not self.__owner:
+            raise ValueError("The node handle is not in the linked list")
+
+    @staticmethod
+    def __relabel(start: Optional[Node], count: int, owner: Owner) -> None:
+        """
+        internal helping function to give count nodes from start a new owner token
+        O(count)
+        """
+        travel = start
+        for _ in range(count):
+            travel.owner = owner
+            travel = travel.next
+
+    def __link_after(self, target_node: Optional[Node], new_node: Node) -> None:
+        """
+        internal helping function to link new_node after target_node, or as the only node if target_node is None
+        O(1)
+        """
+        if target_node is None:
+            self.__head = self.__tail = new_node
+        else:
+            new_node.previous = target_node
+            new_node.next = target_node.next
+            if target_node.next is None:
+                self.__tail = new_node
+            else:
+                target_node.next.previous = new_node
+            target_node.next = new_node
+
+        self.__count += 1
+
+    def __link_before(self, target_node: Optional[Node], new_node: Node) -> None:
+        """
+        internal helping function to link new_node before target_node, or as the only node if target_node is None
+        O(1)
+        """
+        if target_node is None:
+            self.__head = self.__tail = new_node
+        else:
+            new_node.next = target_node
+            new_node.previous = target_node.previous
+            if target_node.previous is None:
+                self.__head = new_node
+            else:
+                target_node.previous.next = new_node
+            target_node.previous = new_node
+
+        self.__count += 1
+
+    def __attach(self, head: Optional[Node], tail: Optional[Node], count: int) -> None:
+        """
+        internal helping function to link a chain of count nodes from head to tail onto the back of the list
+        O(1)
+        """
+        if head is None:
+            return
+        if self.__tail is None:
+            self.__head = head
+        else:
+            self.__tail.next = head
+            head.previous = self.__tail
+        self.__tail = tail
+        self.__count += count
+
+    def __node_at(self, index: int) -> Node:
+        """
+        internal helping function to find the node at index, walking from whichever end is closer
+        O(min(index, n - index))
+        """
+        if index < self.__count // 2:
+            travel = self.__head
+            for _ in range(index):
+                travel = travel.next
+        else:
+            travel = self.__tail
+            for _ in range(self.__count - 1 - index):
+                travel = travel.previous
+        return travel
+
+    def __unlink(self, target_node: Node) -> None:
+        """
+        internal helping function to unlink a node from its neighbours
+        Clears the node's own next and previous links, so removed nodes don't keep the rest of the list alive
+        Iterators read the following node before yielding, so removing the current item doesn't end an iteration
         O(1)
         """
         if target_node.next is None:
@@ -140,9 +454,20 @@ class LinkedList[T](ILinkedList[T]):
             self.__head = target_node.next
         else:
             target_node.previous.next = target_node.next
+        target_node.next = target_node.previous = None
 
         self.__count -= 1
 
+    def __remove_node(self, target_node: Node):
+        """
+        internal helping function to remove a node from a reference
+        Releases the node to the node pool if there is one
+        O(1)
+        """
+        self.__unlink(target_node)
+        target_node.owner = None
+        if self.__node_pool is not None:
+            self.__node_pool.release(target_node)
 
     def pop(self) -> T:
         if self.__tail is None:
@@ -183,34 +508,34 @@ class LinkedList[T](ILinkedList[T]):
         self.__head: Optional[LinkedList.Node] = None
         self.__tail: Optional[LinkedList.Node] = None
         self.__count = 0
+        #a new token invalidates handles to the cleared nodes
+        self.__owner = LinkedList.Owner()
 
     def __contains__(self, item: T) -> bool:
         return self.__find_following(self.__head, item) is not None
 
-    def __iter__(self) -> ILinkedList[T]:
-        self.__travel_node = self.__head
-        return self
+    def __iter__(self) -> Iterator[T]:
+        #a generator keeps the cursor in its own frame, so iterations don't share state with each other or the list
+        travel_node = self.__head
+
+        while travel_node is not None:
+            #the next node is read before yielding, since removing the current item clears its links
+            following = travel_node.next
+            yield travel_node.data
+
+            travel_node = following
 
-    def __next__(self) -> T:
-        if self.__travel_node is None:
-            raise StopIteration
-        
-        data = self.__travel_node.data
-        self.__travel_node = self.__travel_node.next
-        return data
-    
     def __reversed__(self) -> Iterator[T]:
-        #this is implemented as reccomended in class, but differs from the implementation described in ILinkedList
-        #this also behaves slightly different from __iter__ in some unintuitive ways
         travel_node = self.__tail
 
         while travel_node is not None:
+            following = travel_node.previous
             yield travel_node.data
 
-            travel_node = travel_node.previous
+            travel_node = following
     
     def __eq__(self, other: object) -> bool:
-        if not isinstance(other, LinkedList):
+        if not isinstance(other, ILinkedList):
             return False
         if len(self) != len(other):
             return False
@@ -1,6 +1,6 @@
 import os
 from datastructures.istack import IStack
-from typing import Generic
+from typing import Generic, Optional
 
 from datastructures.linkedlist import LinkedList, T
 
@@ -10,15 +10,17 @@ class ListStack(Generic[T], IStack[T]):
 
     """
 
-    def __init__(self, data_type:object) -> None:
+    def __init__(self, data_type:object, node_pool: Optional[LinkedList.NodePool] = None, list_type: type = LinkedList) -> None:
         """
         Initializes the ListStack.
 
         Args:
             data_type (type): The type of data the stack will hold.
+            node_pool (LinkedList.NodePool): Optional pool to recycle the nodes of popped items through.
+            list_type (type): The ILinkedList implementation to store items in, LinkedList or UnrolledLinkedList.
 
         """
-        self.__stack = LinkedList(data_type)
+        self.__stack = list_type(data_type) if node_pool is None else list_type(data_type, node_pool=node_pool)
 
     def push(self, item: T):
         """
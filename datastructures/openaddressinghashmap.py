@@ -0,0 +1,158 @@
+from typing import Callable, Iterator, Optional, Tuple
+import numpy as np
+from numpy.typing import NDArray
+from datastructures.ihashmap import KT, VT, IHashMap
+from datastructures.hashmap import HashMap, default_hash_function
+
+#stored hashes are masked to be non-negative, so negative values can mark slots that don't hold an entry
+_EMPTY: int = -1
+_TOMBSTONE: int = -2
+_HASH_MASK: int = (1 << 63) - 1
+
+class OpenAddressingHashMap(IHashMap[KT, VT]):
+    """
+    HashMap that stores entries directly in flat numpy slot arrays instead of chaining them in linked lists
+    Keys, values and hashes are kept in parallel arrays, and collisions are resolved with linear probing
+    Deleted entries leave a tombstone so probes for keys further along aren't cut short
+    Can be used anywhere a HashMap can, chosen by constructing this class instead
+    """
+    def __init__(self, number_of_buckets=7, load_factor=0.75, custom_hash_function: Optional[Callable[[KT], int]]=None) -> None:
+        if not 0 < load_factor < 1:
+            raise ValueError("load_factor must be between 0 and 1, open addressing needs at least one empty slot")
+        self.__hashes: NDArray = np.full(number_of_buckets, _EMPTY, dtype=np.int64)
+        self.__keys: NDArray = np.empty(number_of_buckets, dtype=object)
+        self.__values: NDArray = np.empty(number_of_buckets, dtype=object)
+        self.__count: int = 0
+        #number of slots that aren't empty, counting tombstones
+        self.__used: int = 0
+        self.__load_factor_threshold: float = load_factor
+        self.__hash_function = custom_hash_function if custom_hash_function is not None else default_hash_function
+
+    def __getitem__(self, key: KT) -> VT:
+        slot, found = self.__find_slot(key, self.__hash(key))
+        if not found:
+            raise KeyError(f"{key} not in HashMap")
+        return self.__values[slot]
+
+    def __setitem__(self, key: KT, value: VT) -> None:
+        key_hash = self.__hash(key)
+        slot, found = self.__find_slot(key, key_hash)
+        if found:
+            self.__values[slot] = value
+            return
+
+        if self.__hashes[slot] == _EMPTY:
+            self.__used += 1
+        self.__hashes[slot] = key_hash
+        self.__keys[slot] = key
+        self.__values[slot] = value
+        self.__count += 1
+
+        if self.__used >= self.__load_factor_threshold * len(self.__hashes):
+            self.__resize()
+
+    def keys(self) -> Iterator[KT]:
+        for slot in self.__occupied_slots():
+            yield self.__keys[slot]
+
+    def values(self) -> Iterator[VT]:
+        for slot in self.__occupied_slots():
+            yield self.__values[slot]
+
+    def items(self) -> Iterator[Tuple[KT, VT]]:
+        for slot in self.__occupied_slots():
+            yield (self.__keys[slot], self.__values[slot])
+
+    def __delitem__(self, key: KT) -> None:
+        slot, found = self.__find_slot(key, self.__hash(key))
+        if not found:
+            raise KeyError(f"{key} not in HashMap")
+        self.__hashes[slot] = _TOMBSTONE
+        self.__keys[slot] = None
+        self.__values[slot] = None
+        self.__count -= 1
+
+    def __contains__(self, key: KT) -> bool:
+        return self.__find_slot(key, self.__hash(key))[1]
+
+    def __len__(self) -> int:
+        return self.__count
+
+    def __iter__(self) -> Iterator[KT]:
+        return self.keys()
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, IHashMap):
+            return False
+        if len(self) != len(other):
+            return False
+        for key, value in self.items():
+            if key not in other or other[key] != value:
+                return False
+        return True
+
+    def __str__(self) -> str:
+        return "{" + ", ".join(f"{key}: {value}" for key, value in self.items()) + "}"
+
+    def __repr__(self) -> str:
+        return f"OpenAddressingHashMap({str(self)})"
+
+    def __hash(self, key: KT) -> int:
+        return self.__hash_function(key) & _HASH_MASK
+
+    def __occupied_slots(self) -> Iterator[int]:
+        """
+        Helper function to iterate through the indices of slots holding an entry
+        Finds the slots with a single vectorized comparison
+        """
+        return iter(np.flatnonzero(self.__hashes >= 0).tolist())
+
+    def __find_slot(self, key: KT, key_hash: int) -> tuple[int, bool]:
+        """
+        Helper function to linearly probe for key
+        Returns key's slot and True if key is in the map
+        Otherwise returns the slot key should be inserted into and False, reusing the first tombstone found along the way
+        """
+        hashes = self.__hashes
+        capacity = len(hashes)
+        slot = key_hash % capacity
+        first_tombstone = -1
+        while True:
+            slot_hash = hashes[slot]
+            if slot_hash == _EMPTY:
+                return (slot if first_tombstone == -1 else first_tombstone), False
+            if slot_hash == _TOMBSTONE:
+                if first_tombstone == -1:
+                    first_tombstone = slot
+            elif slot_hash == key_hash and self.__keys[slot] == key:
+                return slot, True
+            slot += 1
+            if slot == capacity:
+                slot = 0
+
+    def __resize(self) -> None:
+        """
+        Rehash every entry into new slot arrays, dropping all tombstones
+        Grows to the next prime that's at least double the current size, unless most used slots are only tombstones
+        Stored hashes are reused, so no key is hashed again
+        """
+        capacity = len(self.__hashes)
+        minimum = 2 * capacity if 2 * self.__count >= self.__used else capacity
+        new_capacity = HashMap.prime_sieve.next_prime_at_least(minimum)
+
+        old_slots = np.flatnonzero(self.__hashes >= 0)
+        old_hashes = self.__hashes[old_slots].tolist()
+        old_keys = self.__keys[old_slots]
+        old_values = self.__values[old_slots]
+
+        self.__hashes = np.full(new_capacity, _EMPTY, dtype=np.int64)
+        self.__keys = np.empty(new_capacity, dtype=object)
+        self.__values = np.empty(new_capacity, dtype=object)
+        for key_hash, key, value in zip(old_hashes, old_keys, old_values):
+            slot = key_hash % new_capacity
+            while self.__hashes[slot] != _EMPTY:
+                slot = (slot + 1) % new_capacity
+            self.__hashes[slot] = key_hash
+            self.__keys[slot] = key
+            self.__values[slot] = value
+        self.__used = self.__count
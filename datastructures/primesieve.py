@@ -1,96 +1,281 @@
-from dataclasses import dataclass, field
-from heapq import heappush, heapreplace
 from itertools import count
+from math import isqrt, log
+import os
 from typing import Iterator
+import numpy as np
+from numpy.typing import NDArray
+
+#cache files start with this magic string followed by the sieved limit as a little-endian uint64
+_CACHE_MAGIC: bytes = b"PSIEVE01"
+_CACHE_HEADER_SIZE: int = len(_CACHE_MAGIC) + 8
+
+#primes up to this bound are cheaper to sieve outright than to count
+_DIRECT_SIEVE_LIMIT: int = 1 << 22
+
+#Miller-Rabin with these bases has no strong pseudoprimes below 3.3 * 10**24, which covers every 64 bit integer
+_MILLER_RABIN_BASES: tuple[int, ...] = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
 
 class PrimeSieve:
     """
     Responsible for generating primes as needed
     Access a prime by index, starting at sieve[0] = 2
-    Will lazily generate primes as needed
+    Will lazily generate primes as needed, a block at a time
     Only one should exist per program
-    Implementation based on https://doi.org/10.1017%2FS0956796808007004
+    Implementation is a segmented Sieve of Eratosthenes, crossing off multiples with numpy slice assignments
     """
-    class MultiplesIterator:
-        """
-        Iterator that outputs sequential multiples of base_num
-        Starts at the 2*base_num
-        """
-        def __init__(self, base_num: int):
-            self.__base_num: int = base_num
-            self.__current_num = 2*self.__base_num
-        
-        @property
-        def check(self) -> int:
-            return self.__current_num
-
-        def __iter__(self):
-            return self
-
-        def __next__(self) -> int:
-            out = self.__current_num
-            self.__current_num += self.__base_num
-            return out
-
-        def __repr__(self) -> str:
-            return f"MultiplesIterator({self.__base_num}, {self.__current_num})"
-    
-    @dataclass(order=True)
-    class SieveEntry:
-        """
-        An entry in the sieve heap
-        Will compare by entry
-        """
-        entry: int
-        iterator: "PrimeSieve.MultiplesIterator"=field(compare=False)
-
-        @staticmethod
-        def from_prime(prime: int) -> "PrimeSieve.SieveEntry":
-            """
-            construct iterator and set entry to correct value
-            """
-            return PrimeSieve.SieveEntry(2*prime, PrimeSieve.MultiplesIterator(prime))
-        
-        def increment(self) -> "PrimeSieve.SieveEntry":
-            """
-            increment iterator and set entry to the new value
-            returns self so it can fit in single lines and be chained
-            """
-            self.entry = next(self.iterator)
-            return self
-
-    def __init__(self):
-        self.__sieve: list[PrimeSieve.SieveEntry] = []
-        heappush(self.__sieve, PrimeSieve.SieveEntry.from_prime(2))
-        heappush(self.__sieve, PrimeSieve.SieveEntry.from_prime(3))
-        self.__primes: list[int] = [2, 3]
-    
+
+    def __init__(self, segment_size: int = 1 << 20):
+        #every prime below __limit, in order
+        self.__primes: NDArray = np.array([2, 3], dtype=np.int64)
+        self.__limit: int = 4
+        #number of integers sieved at a time, bounds the memory used while sieving
+        self.__segment_size: int = segment_size
+        #read-only mapping of a loaded cache file, primes below __cache_limit are decoded from it instead of sieved
+        self.__cache: NDArray = np.empty(0, dtype=np.uint8)
+        self.__cache_limit: int = 0
+
     def __getitem__(self, prime_index:int) -> int:
-        if prime_index < len(self.__primes):
-            return self.__primes[prime_index]
-        
-        #generate new primes up until desired index
-        for _ in range(prime_index - (len(self.__primes)-1 )):
-            working_prime = self.__next_prime()
-
-        return working_prime
-    
+        if prime_index < 0:
+            raise IndexError("prime index must not be negative")
+        if prime_index >= len(self.__primes):
+            #the (n)th prime is less than n(ln n + ln ln n) for n >= 6, counting 2 as the 1st prime
+            n = max(prime_index + 1, 6)
+            bound = int(n * (log(n) + log(log(n)))) + 1
+            if bound > max(2 * self.__limit, self.__cache_limit, _DIRECT_SIEVE_LIMIT):
+                return self.__nth_prime(prime_index + 1)
+            self.__extend(bound)
+        return int(self.__primes[prime_index])
+
     def __iter__(self) -> Iterator[int]:
         for i in count(0):
             yield self[i]
-    
+
+    def is_prime(self, n: int) -> bool:
+        """
+        Returns whether n is prime
+        Looks n up in the generated primes if it's below them, otherwise uses Miller-Rabin
+        Deterministic for every n below 3.3 * 10**24, above that a composite n is reported prime with negligible probability
+        """
+        if n < self.__limit:
+            index = int(np.searchsorted(self.__primes, n))
+            return index < len(self.__primes) and int(self.__primes[index]) == n
+        for prime in _MILLER_RABIN_BASES:
+            if n % prime == 0:
+                return n == prime
+
+        #n - 1 = d * 2**s with d odd
+        d, s = n - 1, 0
+        while d % 2 == 0:
+            d //= 2
+            s += 1
+        for base in _MILLER_RABIN_BASES:
+            x = pow(base, d, n)
+            if x == 1 or x == n - 1:
+                continue
+            for _ in range(s - 1):
+                x = x * x % n
+                if x == n - 1:
+                    break
+            else:
+                return False
+        return True
+
+    def count_primes(self, n: int) -> int:
+        """
+        Returns the number of primes less than or equal to n
+        Uses the generated primes if they reach n, otherwise the Lucy Hedgehog method, which takes O(n**(3/4)) time
+        and O(sqrt(n)) memory
+        """
+        if n < self.__limit:
+            return int(np.searchsorted(self.__primes, n, side="right"))
+        root = isqrt(n)
+        #small[v] counts the numbers 2 <= k <= v not yet crossed off, large[i] does the same for v = n // i
+        small = np.arange(-1, root, dtype=np.int64)
+        indices = np.arange(1, root + 1, dtype=np.int64)
+        large = np.zeros(root + 1, dtype=np.int64)
+        large[1:] = n // indices - 1
+        for p in range(2, root + 1):
+            if small[p] == small[p - 1]:
+                #p was crossed off, so it isn't prime
+                continue
+            below_p = small[p - 1]
+            square = p * p
+            #every right hand side is computed before assigning, so it reads the counts from before crossing off p
+            end = min(root, n // square)
+            middle = min(end, root // p)
+            large[1:middle + 1] -= large[p:middle * p + 1:p] - below_p
+            large[middle + 1:end + 1] -= small[n // (indices[middle:end] * p)] - below_p
+            if square <= root:
+                small[square:] -= small[indices[square - 1:] // p] - below_p
+        return int(large[1])
+
+    def primes_below(self, n: int) -> NDArray:
+        """
+        Returns every prime less than n as a read-only numpy array
+        The primes are kept, so later queries below n don't sieve again
+        """
+        self.__extend(n)
+        primes = self.__primes[:np.searchsorted(self.__primes, n)]
+        primes.flags.writeable = False
+        return primes
+
+    def primes_in_range(self, start: int, stop: int) -> NDArray:
+        """
+        Returns every prime p with start <= p < stop as a numpy array
+        Ranges past the generated primes are sieved on their own, without generating the primes below start
+        """
+        if stop <= self.__limit:
+            return self.__primes[np.searchsorted(self.__primes, start):np.searchsorted(self.__primes, stop)].copy()
+        return self.__sieve_range(max(start, 0), stop)
+
+    def next_prime_at_least(self, n: int) -> int:
+        """
+        Returns the smallest prime that's at least n
+        Only sieves a window starting at n, growing it until a prime is found
+        """
+        if n < self.__limit:
+            index = int(np.searchsorted(self.__primes, n))
+            if index < len(self.__primes):
+                return int(self.__primes[index])
+        window = max(64, 2 * int(log(max(n, 2))))
+        while True:
+            primes = self.__sieve_range(n, n + window)
+            if len(primes) > 0:
+                return int(primes[0])
+            n += window
+            window *= 2
+
+    def save(self, path: str) -> None:
+        """
+        Saves the generated primes to a cache file, so another process can load them instead of sieving again
+        The file is a bitset with one bit per odd number below the sieved limit, so 10**8 numbers take about 6MB
+        Written to a temporary file and then renamed, so processes loading the cache never see a partial file
+        """
+        self.__extend(self.__cache_limit)
+        is_odd_prime = np.zeros(self.__limit // 2, dtype=np.bool_)
+        #odd number n is stored at bit n // 2, 2 is implied
+        is_odd_prime[self.__primes[1:] // 2] = True
+        temporary_path = f"{path}.{os.getpid()}.tmp"
+        with open(temporary_path, "wb") as cache:
+            cache.write(_CACHE_MAGIC)
+            cache.write(self.__limit.to_bytes(8, "little"))
+            cache.write(np.packbits(is_odd_prime, bitorder="little").tobytes())
+        os.replace(temporary_path, path)
+
+    def load(self, path: str) -> None:
+        """
+        Loads primes from a cache file written by save, if it holds more primes than have been generated
+        The file is memory-mapped read-only, so processes loading the same cache share its pages
+        Primes are only decoded from the mapping once they're needed, so loading takes constant time
+        Raises:
+            ValueError: if the file isn't a prime cache
+        """
+        with open(path, "rb") as cache:
+            header = cache.read(_CACHE_HEADER_SIZE)
+        if len(header) != _CACHE_HEADER_SIZE or header[:len(_CACHE_MAGIC)] != _CACHE_MAGIC:
+            raise ValueError(f"{path} is not a prime cache file")
+        limit = int.from_bytes(header[len(_CACHE_MAGIC):], "little")
+        if limit <= max(self.__limit, self.__cache_limit):
+            return
+        self.__cache = np.memmap(path, dtype=np.uint8, mode="r", offset=_CACHE_HEADER_SIZE)
+        self.__cache_limit = limit
+
     def __repr__(self) -> str:
-        return f"PrimeSieve(primes: {repr(self.__primes)}, sieve: {repr(self.__sieve)})"
-    
-    def __next_prime(self) -> int:
-        num = self.__primes[-1] + 2
+        return f"PrimeSieve(primes below {self.__limit}: {len(self.__primes)})"
+
+    def __extend(self, limit: int) -> None:
+        """
+        Generates every prime below limit
+        At least doubles the sieved range, so repeated small extensions don't each copy the list of primes
+        """
+        if limit <= self.__limit:
+            return
+        limit = max(limit, 2 * self.__limit)
+        #generate the base primes first, so sieving below can't extend __primes out from under this call
+        self.__extend(isqrt(limit - 1) + 1)
+        if limit <= self.__cache_limit:
+            new_primes = self.__decode_cached(self.__limit, limit)
+        else:
+            new_primes = self.__sieve_range(self.__limit, limit)
+        self.__primes = np.concatenate((self.__primes, new_primes))
+        self.__limit = limit
+
+    def __nth_prime(self, n: int) -> int:
+        """
+        Helper function to find the (n)th prime without generating every smaller prime
+        Estimates it with Cipolla's approximation, counts the primes up to the estimate,
+        then sieves windows next to the estimate until the count reaches n
+        """
+        log_n = log(n)
+        log_log_n = log(log_n)
+        estimate = int(n * (log_n + log_log_n - 1 + (log_log_n - 2) / log_n))
+        counted = self.count_primes(estimate)
+        window = max(1 << 16, isqrt(estimate))
+
+        if counted < n:
+            #the (n)th prime is above the estimate, count primes in windows going up
+            low = estimate + 1
+            while True:
+                primes = self.__sieve_range(low, low + window)
+                if counted + len(primes) >= n:
+                    return int(primes[n - counted - 1])
+                counted += len(primes)
+                low += window
+
+        #the (n)th prime is at or below the estimate, count primes in windows going down
+        high = estimate + 1
         while True:
-            if num < self.__sieve[0].entry:
-                heappush(self.__sieve, PrimeSieve.SieveEntry.from_prime(num))
-                self.__primes.append(num)
-                return num
-            
-            if num == self.__sieve[0].entry:
-                num += 2
-            
-            heapreplace(self.__sieve, self.__sieve[0].increment())
\ No newline at end of file
+            primes = self.__sieve_range(max(high - window, 0), high)
+            if counted - len(primes) < n:
+                return int(primes[n - (counted - len(primes)) - 1])
+            counted -= len(primes)
+            high -= window
+
+    def __decode_cached(self, start: int, stop: int) -> NDArray:
+        """
+        Returns every prime p with start <= p < stop from the loaded cache file
+        start must be at least 3 and stop at most __cache_limit
+        """
+        #odd numbers start <= n < stop are stored at bits start // 2 up to stop // 2
+        first_bit, end_bit = start // 2, stop // 2
+        bits = np.unpackbits(self.__cache[first_bit // 8:-(-end_bit // 8)], bitorder="little")
+        offset = first_bit - first_bit % 8
+        odd_bits = np.flatnonzero(bits[first_bit - offset:end_bit - offset]).astype(np.int64)
+        return (odd_bits + first_bit) * 2 + 1
+
+    def __sieve_range(self, start: int, stop: int) -> NDArray:
+        """
+        Returns every prime p with start <= p < stop, sieving one segment at a time
+        Generates the base primes up to sqrt(stop) first
+        """
+        if stop <= start:
+            return np.empty(0, dtype=np.int64)
+        root = isqrt(stop - 1) + 1
+        self.__extend(root)
+        base_primes = self.__primes[:np.searchsorted(self.__primes, root)].tolist()
+        #segments must be at least sqrt(stop) long for each base prime to cross off a multiple per segment
+        segment_size = max(self.__segment_size, root)
+
+        segments = []
+        for low in range(start, stop, segment_size):
+            high = min(low + segment_size, stop)
+            segments.append(PrimeSieve.__sieve_segment(low, high, base_primes))
+        return np.concatenate(segments)
+
+    @staticmethod
+    def __sieve_segment(low: int, high: int, base_primes: list[int]) -> NDArray:
+        """
+        Returns every prime p with low <= p < high
+        base_primes must contain every prime up to sqrt(high)
+        """
+        is_prime = np.ones(high - low, dtype=np.bool_)
+        for prime in base_primes:
+            square = prime * prime
+            if square >= high:
+                break
+            #first multiple of prime in the segment, skipping prime itself
+            first = max(square, -(-low // prime) * prime)
+            is_prime[first - low::prime] = False
+        if low < 2:
+            is_prime[:2 - low] = False
+        return np.flatnonzero(is_prime).astype(np.int64) + low
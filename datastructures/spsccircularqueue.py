@@ -0,0 +1,108 @@
+import time
+from typing import Any, Optional, Sequence
+
+from datastructures.circularqueue import CircularQueue
+from datastructures.iqueue import T
+
+#shortest and longest sleeps between polls while put or get wait
+_MIN_POLL_INTERVAL: float = 1e-6
+_MAX_POLL_INTERVAL: float = 1e-3
+
+class SPSCCircularQueue(CircularQueue[T]):
+    """ A CircularQueue for handing items from exactly one producer thread to exactly one consumer thread, without a lock.
+        Only the producer moves the rear index and only the consumer moves the front index,
+        and CircularQueue writes a slot before publishing it, so each side only ever sees fully written slots.
+        A stale read of the other side's index only makes the queue look fuller or emptier than it is, never corrupt.
+        The producer may only call the enqueue methods and the consumer only the dequeue methods and clear.
+        The blocking put and get poll with a growing sleep, for any number of threads use ConcurrentCircularQueue.
+    """
+
+    def put(self, item: T, timeout: Optional[float] = None) -> None:
+        ''' Adds an item to the rear of the queue, waiting for room if it's full
+
+            Arguments:
+                item: The item to add to the queue
+                timeout: The most seconds to wait, or None to wait as long as it takes
+
+            Raises:
+                TimeoutError: If the queue is still full after timeout seconds
+        '''
+        if not SPSCCircularQueue.__poll(lambda: self.try_enqueue(item), timeout):
+            raise TimeoutError("Queue is full")
+
+    def get(self, timeout: Optional[float] = None) -> T:
+        ''' Removes and returns the item at the front of the queue, waiting for one if it's empty
+
+            Arguments:
+                timeout: The most seconds to wait, or None to wait as long as it takes
+
+            Raises:
+                TimeoutError: If the queue is still empty after timeout seconds
+        '''
+        if not SPSCCircularQueue.__poll(lambda: not self.empty, timeout):
+            raise TimeoutError("Queue is empty")
+        return self.dequeue()
+
+    def try_enqueue(self, item: T) -> bool:
+        ''' Adds an item to the rear of the queue if there's room
+
+            Returns:
+                True if the item was added, False if the queue is full
+        '''
+        #only the consumer can change full from True to False, so room found here can't disappear before enqueueing
+        if self.full:
+            return False
+        self.enqueue(item)
+        return True
+
+    def try_dequeue(self, default: Any = None) -> T:
+        ''' Removes and returns the item at the front of the queue if there is one
+
+            Returns:
+                The item at the front of the queue, or default if the queue is empty
+        '''
+        if self.empty:
+            return default
+        return self.dequeue()
+
+    def enqueue_many(self, items: Sequence[T]) -> int:
+        ''' Adds items to the rear of the queue in order, until they run out or the queue is full
+
+            Returns:
+                The number of items added, so items[count:] are the ones that didn't fit
+        '''
+        count = 0
+        for item in items:
+            if not self.try_enqueue(item):
+                break
+            count += 1
+        return count
+
+    def dequeue_many(self, max_items: int) -> list[T]:
+        ''' Removes and returns up to max_items items from the front of the queue, without waiting
+
+            Returns:
+                The removed items in order, an empty list if the queue is empty
+        '''
+        items = []
+        while len(items) < max_items and not self.empty:
+            items.append(self.dequeue())
+        return items
+
+    def __repr__(self) -> str:
+        return f'SPSC{super().__repr__()}'
+
+    @staticmethod
+    def __poll(attempt, timeout: Optional[float]) -> bool:
+        '''
+        Helper function to call attempt until it returns True, sleeping a little longer after each failure
+        Returns False if timeout seconds pass first
+        '''
+        deadline = None if timeout is None else time.monotonic() + timeout
+        interval = _MIN_POLL_INTERVAL
+        while not attempt():
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(interval)
+            interval = min(2 * interval, _MAX_POLL_INTERVAL)
+        return True
@@ -0,0 +1,279 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from itertools import chain
+import os
+from typing import Iterator, Optional, Sequence
+from datastructures.ilinkedlist import ILinkedList, T
+
+
+class UnrolledLinkedList[T](ILinkedList[T]):
+    """
+    Linked list whose nodes each hold a block of up to block_size items in a python list
+    Iterating and searching scan a whole block at a time, so they run at close to the speed of scanning an array
+    append, prepend, pop and pop_front only touch the end blocks, so they stay O(1) for a fixed block size
+    Can be used anywhere a LinkedList can, including as the list behind a Deque or ListStack
+    """
+
+    @dataclass(slots=True)
+    class Block:
+        items: list = field(default_factory=list)
+        next: Optional[UnrolledLinkedList.Block] = None
+        previous: Optional[UnrolledLinkedList.Block] = None
+
+    def __init__(self, data_type: type = object, block_size: int = 64) -> None:
+        if block_size < 2:
+            raise ValueError("block_size must be at least 2")
+        self.__data_type = data_type
+        self.__block_size = block_size
+        self.__head: Optional[UnrolledLinkedList.Block] = None
+        self.__tail: Optional[UnrolledLinkedList.Block] = None
+        self.__count = 0
+
+    @staticmethod
+    def from_sequence(sequence: Sequence[T], data_type: type=object, block_size: int = 64) -> UnrolledLinkedList[T]:
+        outputList = UnrolledLinkedList(data_type=data_type, block_size=block_size)
+        items = list(sequence)
+        for item in items:
+            outputList.__check_type(item)
+
+        #fill whole blocks at once instead of appending item by item
+        for start in range(0, len(items), block_size):
+            outputList.__link_after(outputList.__tail, UnrolledLinkedList.Block(items[start:start + block_size]))
+        outputList.__count = len(items)
+        return outputList
+
+    def append(self, item: T) -> None:
+        self.__check_type(item)
+        if self.__tail is None or len(self.__tail.items) >= self.__block_size:
+            self.__link_after(self.__tail, UnrolledLinkedList.Block([item]))
+        else:
+            self.__tail.items.append(item)
+        self.__count += 1
+
+    def prepend(self, item: T) -> None:
+        self.__check_type(item)
+        if self.__head is None or len(self.__head.items) >= self.__block_size:
+            self.__link_before(self.__head, UnrolledLinkedList.Block([item]))
+        else:
+            #shifts at most block_size items
+            self.__head.items.insert(0, item)
+        self.__count += 1
+
+    def insert_before(self, target: T, item: T) -> None:
+        self.__check_type(item)
+        self.__check_type(target)
+        block, index = self.__find(target)
+        if block is None:
+            raise ValueError(f"The target item {target} is not in the linked list")
+        self.__insert_at(block, index, item)
+
+    def insert_after(self, target: T, item: T) -> None:
+        self.__check_type(item)
+        self.__check_type(target)
+        block, index = self.__find(target)
+        if block is None:
+            raise ValueError(f"The target item {target} is not in the linked list")
+        self.__insert_at(block, index + 1, item)
+
+    def remove(self, item: T) -> None:
+        self.__check_type(item)
+        block, index = self.__find(item)
+        if block is None:
+            raise ValueError(f"The target item {item} is not in the linked list")
+        del block.items[index]
+        self.__count -= 1
+        self.__compact(block)
+
+    def remove_all(self, item: T) -> None:
+        self.__check_type(item)
+        block = self.__head
+        while block is not None:
+            following = block.next
+            kept = [value for value in block.items if not value == item]
+            self.__count -= len(block.items) - len(kept)
+            block.items = kept
+            if not kept:
+                self.__unlink(block)
+            block = following
+
+    def pop(self) -> T:
+        if self.__tail is None:
+            raise IndexError("list is empty")
+        tail = self.__tail
+        out = tail.items.pop()
+        self.__count -= 1
+        if not tail.items:
+            self.__unlink(tail)
+        return out
+
+    def pop_front(self) -> T:
+        if self.__head is None:
+            raise IndexError("list is empty")
+        head = self.__head
+        #shifts at most block_size items
+        out = head.items.pop(0)
+        self.__count -= 1
+        if not head.items:
+            self.__unlink(head)
+        return out
+
+    @property
+    def front(self) -> T:
+        if self.__head is None:
+            raise(IndexError("list is empty"))
+        return self.__head.items[0]
+
+    @property
+    def back(self) -> T:
+        if self.__tail is None:
+            raise(IndexError("list is empty"))
+        return self.__tail.items[-1]
+
+    @property
+    def empty(self) -> bool:
+        return len(self) == 0
+
+    def __len__(self) -> int:
+        return self.__count
+
+    def clear(self) -> None:
+        self.__head: Optional[UnrolledLinkedList.Block] = None
+        self.__tail: Optional[UnrolledLinkedList.Block] = None
+        self.__count = 0
+
+    def __contains__(self, item: T) -> bool:
+        return self.__find(item)[0] is not None
+
+    def __iter__(self) -> Iterator[T]:
+        return self.__items()
+
+    def __reversed__(self) -> Iterator[T]:
+        block = self.__tail
+        while block is not None:
+            yield from reversed(block.items)
+            block = block.previous
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ILinkedList):
+            return False
+        if len(self) != len(other):
+            return False
+        for item1, item2 in zip(self, other):
+            if item1 != item2:
+                return False
+        return True
+
+    def __str__(self) -> str:
+        return '[' + ', '.join(repr(item) for item in self.__items()) + ']'
+
+    def __repr__(self) -> str:
+        items = ' <-> '.join(repr(item) for item in self.__items())
+        return f"UnrolledLinkedList({items}) Count: {self.__count}"
+
+    def __check_type(self, item: T) -> None:
+        if not isinstance(item, self.__data_type):
+            raise TypeError(f"{item} is not of type {self.__data_type}")
+
+    def __items(self) -> Iterator[T]:
+        """
+        internal helping function to iterate through every item, a block at a time
+        O(n)
+        """
+        return chain.from_iterable(block.items for block in self.__blocks())
+
+    def __blocks(self) -> Iterator[Block]:
+        block = self.__head
+        while block is not None:
+            yield block
+            block = block.next
+
+    def __find(self, target: T) -> tuple[Optional[Block], int]:
+        """
+        internal helping function to find the block and index of the first item equal to target
+        Returns None and -1 if target isn't in the list
+        O(n)
+        """
+        for block in self.__blocks():
+            if target in block.items:
+                return block, block.items.index(target)
+        return None, -1
+
+    def __insert_at(self, block: Block, index: int, item: T) -> None:
+        """
+        internal helping function to insert item at index in block
+        Splits the block in half first if it's full
+        O(block_size)
+        """
+        if len(block.items) >= self.__block_size:
+            half = len(block.items) // 2
+            new_block = UnrolledLinkedList.Block(block.items[half:])
+            del block.items[half:]
+            self.__link_after(block, new_block)
+            if index > half:
+                block, index = new_block, index - half
+        block.items.insert(index, item)
+        self.__count += 1
+
+    def __compact(self, block: Block) -> None:
+        """
+        internal helping function to keep blocks from getting sparse after removing from block
+        Unlinks block if it's empty, or merges the next block into it if both fit in half a block
+        O(block_size)
+        """
+        if not block.items:
+            self.__unlink(block)
+        elif block.next is not None and len(block.items) + len(block.next.items) <= self.__block_size // 2:
+            block.items.extend(block.next.items)
+            self.__unlink(block.next)
+
+    def __link_after(self, block: Optional[Block], new_block: Block) -> None:
+        """
+        internal helping function to link new_block after block, or as the only block if block is None
+        O(1)
+        """
+        if block is None:
+            self.__head = self.__tail = new_block
+            return
+        new_block.previous = block
+        new_block.next = block.next
+        if block.next is None:
+            self.__tail = new_block
+        else:
+            block.next.previous = new_block
+        block.next = new_block
+
+    def __link_before(self, block: Optional[Block], new_block: Block) -> None:
+        """
+        internal helping function to link new_block before block, or as the only block if block is None
+        O(1)
+        """
+        if block is None:
+            self.__head = self.__tail = new_block
+            return
+        new_block.next = block
+        new_block.previous = block.previous
+        if block.previous is None:
+            self.__head = new_block
+        else:
+            block.previous.next = new_block
+        block.previous = new_block
+
+    def __unlink(self, block: Block) -> None:
+        """
+        internal helping function to unlink a block
+        O(1)
+        """
+        if block.next is None:
+            self.__tail = block.previous
+        else:
+            block.next.previous = block.previous
+        if block.previous is None:
+            self.__head = block.next
+        else:
+            block.previous.next = block.next
+
+
+if __name__ == '__main__':
+    filename = os.path.basename(__file__)
+    print(f'OOPS!\nThis is the {filename} file.\nDid you mean to run your tests or program.py file?\nFor tests, run them from the Test Explorer on the left.')
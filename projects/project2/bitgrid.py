@@ -0,0 +1,221 @@
+import numpy as np
+from numpy.typing import NDArray
+from datastructures.array2d import Array2D
+from projects.project2.cell import Cell
+from projects.project2.grid import Grid
+from projects.project2.numpygrid import NumpyGrid
+
+#cells per word
+_WORD_BITS: int = 64
+#rows stepped at a time, bounds the memory used by the temporary neighbour boards
+_ROWS_PER_CHUNK: int = 1024
+_ONE = np.uint64(1)
+_HIGH_BIT_SHIFT = np.uint64(_WORD_BITS - 1)
+
+class BitGrid:
+    """
+    Grid that packs 64 cells into each uint64 word, one row of words per row of the board
+    A 10^8 cell board takes 12.5MB, instead of an object per cell
+    Computes a generation for 64 cells per operation by adding the eight neighbour boards with bitwise full adders
+    Otherwise works like NumpyGrid, including its conversions to and from numpy arrays
+    """
+    def __init__(self, rows: int = 32, cols: int = 32) -> None:
+        self.__rows: int = rows
+        self.__cols: int = cols
+        words = -(-cols // _WORD_BITS)
+        #cell (row, col) is bit col % 64 of word col // 64 in row
+        self.__words: NDArray[np.uint64] = np.zeros((rows, words), dtype=np.uint64)
+        #bits of each row that aren't boarder or padding past the last column
+        interior = np.zeros((1, words * _WORD_BITS), dtype=np.bool_)
+        interior[0, 1:cols-1] = True
+        self.__interiorMask: NDArray[np.uint64] = BitGrid.__pack(interior, words)[0]
+        #cells the last nextGeneration into this grid flipped, as rows and cols
+        self.__flipped: tuple[NDArray[np.intp], NDArray[np.intp]] = (np.empty(0, np.intp), np.empty(0, np.intp))
+
+    @staticmethod
+    def randomGrid(rows: int = 32, cols: int = 32) -> "BitGrid":
+        grid = BitGrid(rows, cols)
+        #every bit of a random word is alive with probability 0.5, without making a random number per cell
+        grid.__words[1:-1] = np.random.randint(0, 1 << _WORD_BITS, size=(rows-2, grid.__words.shape[1]),
+                                               dtype=np.uint64) & grid.__interiorMask
+        return grid
+
+    @staticmethod
+    def fromNumpy(cells: NDArray) -> "BitGrid":
+        """
+        makes a grid from a 2d array of live cells, including the boarder, which is cleared
+        """
+        grid = BitGrid(*cells.shape)
+        padded = np.zeros((grid.__rows, grid.__words.shape[1] * _WORD_BITS), dtype=np.bool_)
+        padded[:, :grid.__cols] = cells
+        grid.__words[:] = BitGrid.__pack(padded, grid.__words.shape[1]) & grid.__interiorMask
+        grid.__words[0] = grid.__words[-1] = 0
+        return grid
+
+    def toNumpy(self) -> NDArray[np.bool_]:
+        """
+        returns a new 2d bool array of the live cells, including the boarder
+        """
+        bits = np.unpackbits(self.__words.astype("<u8").view(np.uint8), axis=1, bitorder="little")
+        return bits[:, :self.__cols].astype(np.bool_)
+
+    @staticmethod
+    def fromGrid(grid) -> "BitGrid":
+        """
+        makes a BitGrid from a Grid, or any other grid with shape and isAlive
+        """
+        rows, cols = grid.shape
+        cells = np.array([[grid.isAlive(row, col) for col in range(cols)] for row in range(rows)], dtype=np.bool_)
+        return BitGrid.fromNumpy(cells)
+
+    def toGrid(self) -> Grid:
+        grid = Grid(self.__rows, self.__cols)
+        for row, col in np.argwhere(self.toNumpy()).tolist():
+            grid.setAlive(row, col, True)
+        return grid
+
+    @staticmethod
+    def fromArray2D(startingArray: Array2D[Cell]) -> "BitGrid":
+        """
+        makes a grid from the cells inside the boarder, like GameController.fromArray2D
+        """
+        rows, cols = len(startingArray), len(startingArray[0])
+        cells = np.zeros((rows+2, cols+2), dtype=np.bool_)
+        for rowNum, row in enumerate(startingArray):
+            for colNum, cell in enumerate(row):
+                cells[rowNum+1, colNum+1] = cell.isAlive
+        return BitGrid.fromNumpy(cells)
+
+    def toArray2D(self) -> Array2D[Cell]:
+        """
+        returns the cells inside the boarder as an Array2D of Cells, the form GameController.fromArray2D takes
+        """
+        output = Array2D.empty(self.__rows-2, self.__cols-2, Cell)
+        for row, col in np.argwhere(self.toNumpy()[1:-1, 1:-1]).tolist():
+            output[row][col].isAlive = True
+        return output
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return (self.__rows, self.__cols)
+
+    def isAlive(self, row: int, col: int) -> bool:
+        word, bit = divmod(col % self.__cols, _WORD_BITS)
+        return bool((int(self.__words[row, word]) >> bit) & 1)
+
+    def setAlive(self, row: int, col: int, isAlive: bool) -> None:
+        row, col = row % self.__rows, col % self.__cols
+        #boarder cells are immutable
+        if row in (0, self.__rows-1) or col in (0, self.__cols-1):
+            return
+        word, bit = divmod(col, _WORD_BITS)
+        mask = np.uint64(1 << bit)
+        if isAlive:
+            self.__words[row, word] |= mask
+        else:
+            self.__words[row, word] &= ~mask
+
+    def checkCell(self, row, col) -> bool:
+        """
+        checks cell's state and neighbors and returns its isAlive for the next generation
+        """
+        if row % self.__rows in (0, self.__rows-1) or col % self.__cols in (0, self.__cols-1):
+            raise ValueError("attempted to check boarder cell")
+        liveInBlock = sum(self.isAlive(row + offsetX, col + offsetY) for offsetX in (-1, 0, 1) for offsetY in (-1, 0, 1))
+        return liveInBlock == 3 or (liveInBlock == 4 and self.isAlive(row, col))
+
+    def nextGeneration(self, into: "BitGrid") -> None:
+        """
+        writes the generation after this one into another grid of the same size
+        steps a chunk of rows at a time, so the temporary boards stay small however big the grid is
+        """
+        flippedRows: list[NDArray[np.intp]] = [np.empty(0, np.intp)]
+        flippedCols: list[NDArray[np.intp]] = [np.empty(0, np.intp)]
+        for start in range(1, self.__rows-1, _ROWS_PER_CHUNK):
+            stop = min(start + _ROWS_PER_CHUNK, self.__rows-1)
+            nextWords = BitGrid.__nextRows(self.__words[start-1:stop+1]) & self.__interiorMask
+            #only the words with a flipped bit are unpacked, so this costs one xor per 64 cells plus the flips
+            flippedBits = nextWords ^ self.__words[start:stop]
+            wordRows, wordCols = np.nonzero(flippedBits)
+            flippedWords = flippedBits[wordRows, wordCols].reshape(-1, 1)
+            bits = np.unpackbits(flippedWords.astype("<u8").view(np.uint8), axis=1, bitorder="little")
+            word, bit = np.nonzero(bits)
+            flippedRows.append(wordRows[word] + start)
+            flippedCols.append(wordCols[word] * _WORD_BITS + bit)
+            into.__words[start:stop] = nextWords
+        into.__flipped = (np.concatenate(flippedRows), np.concatenate(flippedCols))
+
+    def flippedCells(self) -> tuple[NDArray[np.intp], NDArray[np.intp]]:
+        """
+        returns the rows and cols of the cells that differ between this grid and the grid whose nextGeneration last wrote into it
+        """
+        return self.__flipped
+
+    @staticmethod
+    def __nextRows(words: NDArray[np.uint64]) -> NDArray[np.uint64]:
+        """
+        returns the next generation of every row in words except the first and last
+        each bit of the eight neighbour boards is added in parallel, giving a 3 bit count (mod 8) per cell
+        a cell is alive next generation if its count is 3, or 2 and it's alive
+        """
+        above, center, below = words[:-2], words[1:-1], words[2:]
+        north, south = above, below
+        northWest, northEast = BitGrid.__west(above), BitGrid.__east(above)
+        west, east = BitGrid.__west(center), BitGrid.__east(center)
+        southWest, southEast = BitGrid.__west(below), BitGrid.__east(below)
+
+        #ones of three groups of neighbours, and their twos carries
+        onesA, twosA = BitGrid.__fullAdd(northWest, north, northEast)
+        onesB, twosB = BitGrid.__fullAdd(west, east, southWest)
+        onesC, twosC = south ^ southEast, south & southEast
+        ones, twosD = BitGrid.__fullAdd(onesA, onesB, onesC)
+        #adding the four twos carries
+        twosE, foursA = BitGrid.__fullAdd(twosA, twosB, twosC)
+        twos, foursB = twosE ^ twosD, twosE & twosD
+        fours = foursA | foursB
+        return twos & ~fours & (ones | center)
+
+    @staticmethod
+    def __fullAdd(a: NDArray, b: NDArray, c: NDArray) -> tuple[NDArray, NDArray]:
+        """
+        adds three boards bit by bit, returning the sum bits and carry bits
+        """
+        partial = a ^ b
+        return partial ^ c, (a & b) | (partial & c)
+
+    @staticmethod
+    def __west(words: NDArray[np.uint64]) -> NDArray[np.uint64]:
+        """
+        returns a board where each cell holds its western neighbour, carrying the last bit of each word into the next
+        """
+        shifted = words << _ONE
+        shifted[:, 1:] |= words[:, :-1] >> _HIGH_BIT_SHIFT
+        return shifted
+
+    @staticmethod
+    def __east(words: NDArray[np.uint64]) -> NDArray[np.uint64]:
+        """
+        returns a board where each cell holds its eastern neighbour, carrying the first bit of each word into the previous
+        """
+        shifted = words >> _ONE
+        shifted[:, :-1] |= words[:, 1:] << _HIGH_BIT_SHIFT
+        return shifted
+
+    @staticmethod
+    def __pack(cells: NDArray[np.bool_], words: int) -> NDArray[np.uint64]:
+        """
+        packs rows of words * 64 cells into words, with the first cell of each word in its lowest bit
+        """
+        packed = np.packbits(cells, axis=1, bitorder="little")
+        return packed.view("<u8").reshape(cells.shape[0], words).astype(np.uint64)
+
+    def __len__(self) -> int:
+        return self.__rows * self.__cols
+
+    def __str__(self) -> str:
+        return NumpyGrid.formatCells(self.toNumpy())
+
+    def __eq__(self, value) -> bool:
+        if not isinstance(value, BitGrid):
+            return False
+        return self.shape == value.shape and bool(np.array_equal(self.__words, value.__words))
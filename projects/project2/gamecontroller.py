@@ -1,32 +1,53 @@
 from os import path
+import numpy as np
+from numpy.typing import NDArray
 from datastructures.array2d import Array2D
+from datastructures.hashmap import HashMap
 from typing import Optional, TextIO
 from projects.project2.kbhit import KBHit
 from time import sleep
-from itertools import chain
 from projects.project2.grid import Grid
 from projects.project2.cell import Cell
 
+#splitmix64 constants, for deriving each cell's zobrist key from its position
+_GOLDEN_GAMMA = np.uint64(0x9E3779B97F4A7C15)
+_MIX_MULTIPLIERS = (np.uint64(0xBF58476D1CE4E5B9), np.uint64(0x94D049BB133111EB))
+_MIX_SHIFTS = (np.uint64(30), np.uint64(27), np.uint64(31))
+
 class GameController:
-    def __init__(self, rows: int = 32, cols: int = 32, history_length:int = 5) -> None:
+    def __init__(self, rows: int = 32, cols: int = 32, history_length:int = 5, gridType: type = Grid) -> None:
         self.__dimensions: tuple[int, int] = (rows, cols)
+        #any class with Grid's randomGrid, isAlive, setAlive, nextGeneration, flippedCells, __eq__ and __str__ can be used, like NumpyGrid
+        self.__gridType: type = gridType
         #this would be better as a fixed length array instead than a list, but I'd rather it hold references instead of deepcopies, so our Array implementation is unsuitable
         #edit: with how I ended up implementing this I don't think storing these as references ended up mattering. It might be more correct to store these within our Array type, but I don't think it matters enough to change
-        self.__grids: list[Grid] = [Grid(*self.__dimensions) for _ in range(history_length+1)]
-        self.__grids[0] = Grid.randomGrid(*self.__dimensions)
+        self.__grids: list[Grid] = [gridType(*self.__dimensions) for _ in range(history_length+1)]
+        self.__grids[0] = gridType.randomGrid(*self.__dimensions)
         self.__iteration: int = 0
         self.__currentGridIndex:int = 0
+        #zobrist hashing: each cell has a random key, and a board's hash is the xor of its live cells' keys
+        #so a generation's hash is the last one's xor the keys of the cells that flipped, and equal boards always have equal hashes
+        #keys are mixed from the cell's position and this seed when needed, instead of storing a key per cell
+        self.__keySeed: np.uint64 = np.uint64(np.random.randint(0, 1 << 64, dtype=np.uint64))
+        #None until the first step, since the factory methods set the starting cells after construction
+        self.__hash: Optional[int] = None
+        #latest generation seen with each hash, for finding repeats of any period
+        self.__generationsByHash: HashMap[int, int] = HashMap()
+        self.__repeatOf: Optional[int] = None
 
     @staticmethod
-    def fromArray2D(startingArray: Array2D[Cell], history_length: int = 5) -> "GameController":
+    def fromArray2D(startingArray: Array2D[Cell], history_length: int = 5, gridType: type = Grid) -> "GameController":
         #add rows and cols for boarder
-        output = GameController(len(startingArray)+2, len(startingArray[0])+2, history_length)
-        for (_, cell), startingCell in zip(output.__grids[output.__currentGridIndex], chain.from_iterable(startingArray)):
-            cell.isAlive = startingCell.isAlive
+        output = GameController(len(startingArray)+2, len(startingArray[0])+2, history_length, gridType)
+        startingGrid = output.__grids[output.__currentGridIndex]
+        for rowNum, row in enumerate(startingArray):
+            for colNum, startingCell in enumerate(row):
+                #offset by 1 for the boarder
+                startingGrid.setAlive(rowNum+1, colNum+1, startingCell.isAlive)
         return output
 
     @staticmethod
-    def fromConfig(config: TextIO) -> "GameController":
+    def fromConfig(config: TextIO, gridType: type = Grid) -> "GameController":
         nonCommentLines = 0
         for line in config.readlines():
             if line[0] == "#":
@@ -52,10 +73,10 @@ class GameController:
                             case "#":
                                 break
             nonCommentLines += 1
-        return(GameController.fromArray2D(startingGrid, historyLen))
+        return(GameController.fromArray2D(startingGrid, historyLen, gridType))
 
     @staticmethod
-    def fromUserInput() -> "GameController":
+    def fromUserInput(gridType: type = Grid) -> "GameController":
         def askYesOrNo(question: str) -> bool:
             """
             Ask a yes or no question
@@ -94,7 +115,7 @@ class GameController:
                 rawConfigFile = input(question)
                 try:
                     with open(path.normpath(rawConfigFile), "r") as config:
-                        game = GameController.fromConfig(config)
+                        game = GameController.fromConfig(config, gridType)
                 except:
                     print("Invalid config file")
                 else:
@@ -135,18 +156,33 @@ class GameController:
                 for _ in range(numberOfStartingCells):
                     x,y = askCoordinate("Coordinate of live cell (x,y): ", (rows, cols))
                     startingArrangement[x][y].isAlive = True
-                return GameController.fromArray2D(startingArrangement, historyLen)
+                return GameController.fromArray2D(startingArrangement, historyLen, gridType)
             else:
-                return GameController(rows, cols, historyLen)
+                return GameController(rows, cols, historyLen, gridType)
         
+    @property
+    def repeatOf(self) -> Optional[int]:
+        """
+        the earlier generation the current one repeats, or None if it's new
+        """
+        return self.__repeatOf
+
     def nextIteration(self):
+        if self.__hash is None:
+            self.__hash = self.__fullHash(self.__grids[self.__currentGridIndex])
+            self.__generationsByHash[self.__hash] = self.__iteration
+
         #grid history is tracked using a circular array, overwriting the oldest grid with the newest one
         self.__iteration += 1
         self.__currentGridIndex = self.__iteration % len(self.__grids)
 
-        for position, cell in self.__grids[self.__currentGridIndex]:
-            cell.isAlive = self.__grids[self.__currentGridIndex-1].checkCell(*position)
-    
+        previous, current = self.__grids[self.__currentGridIndex-1], self.__grids[self.__currentGridIndex]
+        previous.nextGeneration(into=current)
+        #the grid reports which cells flipped, so updating the hash costs time proportional to the flips, not the board
+        self.__hash ^= self.__hashCells(*current.flippedCells())
+        self.__repeatOf = self.__findRepeat(current)
+        self.__generationsByHash[self.__hash] = self.__iteration
+
     def run(self):
         hasLooped: bool = False
         kbhit = KBHit()
@@ -192,14 +228,50 @@ class GameController:
             self.nextIteration()
             print(self)
 
-            #check for match in grid history
-            for i, grid in enumerate(self.__grids):
-                if i == self.__currentGridIndex:
-                    continue
-                if grid == self.__grids[self.__currentGridIndex]:
-                    print("Detected repeat")
-                    hasLooped = True
+            #check for a match with any earlier generation
+            if self.__repeatOf is not None:
+                print(f"Detected repeat of generation {self.__repeatOf}, period {self.__iteration - self.__repeatOf}")
+                hasLooped = True
         print("Ended simulation")
     
+    def __findRepeat(self, current) -> Optional[int]:
+        """
+        looks up the current hash, O(1) however long ago the repeat was
+        boards still in the history are compared in full in case of a collision, older ones are trusted on the 64 bit hash
+        """
+        if self.__hash not in self.__generationsByHash:
+            return None
+        earlier = self.__generationsByHash[self.__hash]
+        if self.__iteration - earlier < len(self.__grids) and self.__grids[earlier % len(self.__grids)] != current:
+            return None
+        return earlier
+
+    def __fullHash(self, grid) -> int:
+        """
+        hashes a whole board, only needed for the starting generation
+        """
+        return self.__hashCells(*np.nonzero(GameController.__cellsOf(grid)))
+
+    def __hashCells(self, rows: NDArray[np.intp], cols: NDArray[np.intp]) -> int:
+        """
+        returns the xor of the keys of the cells at rows and cols
+        each key is splitmix64 of the cell's index in the board, so keys are well mixed without a table of them
+        """
+        indices = rows.astype(np.uint64) * np.uint64(self.__dimensions[1]) + cols.astype(np.uint64)
+        state = (indices + np.uint64(1)) * _GOLDEN_GAMMA + self.__keySeed
+        state = (state ^ (state >> _MIX_SHIFTS[0])) * _MIX_MULTIPLIERS[0]
+        state = (state ^ (state >> _MIX_SHIFTS[1])) * _MIX_MULTIPLIERS[1]
+        return int(np.bitwise_xor.reduce(state ^ (state >> _MIX_SHIFTS[2]), initial=np.uint64(0)))
+
+    @staticmethod
+    def __cellsOf(grid) -> NDArray[np.bool_]:
+        """
+        returns a 2d bool array of grid's live cells, including the boarder
+        """
+        if hasattr(grid, "toNumpy"):
+            return grid.toNumpy()
+        rows, cols = grid.shape
+        return np.array([[grid.isAlive(row, col) for col in range(cols)] for row in range(rows)], dtype=np.bool_)
+
     def __str__(self) -> str:
         return f"Generation {self.__iteration}\n{str(self.__grids[self.__currentGridIndex])}"
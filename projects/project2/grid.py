@@ -1,3 +1,5 @@
+import numpy as np
+from numpy.typing import NDArray
 from datastructures.array2d import Array2D
 from typing import Iterator
 from random import random
@@ -15,6 +17,8 @@ class Grid:
         for row in self.__grid:
             row[0]._Cell__isBoarder = True
             row[-1]._Cell__isBoarder = True
+        #cells the last nextGeneration into this grid flipped, as rows and cols
+        self.__flipped: tuple[NDArray[np.intp], NDArray[np.intp]] = (np.empty(0, np.intp), np.empty(0, np.intp))
     
     @staticmethod
     def randomGrid(rows: int = 32, cols: int = 32) -> "Grid":
@@ -35,6 +39,11 @@ class Grid:
                     continue
                 yield ((i, j), cell)
     
+    @property
+    def shape(self) -> tuple[int, int]:
+        #rows and cols, including the boarder
+        return (len(self.__grid), len(self.__grid[0]))
+
     def __len__(self) -> int:
         return len(self.__grid) * len(self.__grid[0])
     
@@ -54,6 +63,33 @@ class Grid:
             
         return True
     
+    def isAlive(self, row: int, col: int) -> bool:
+        return self.__grid[row][col].isAlive
+
+    def setAlive(self, row: int, col: int, isAlive: bool) -> None:
+        #boarder cells ignore this, like Cell.isAlive
+        self.__grid[row][col].isAlive = isAlive
+
+    def nextGeneration(self, into: "Grid") -> None:
+        """
+        writes the generation after this one into another grid of the same size
+        every grid type has this, so GameController can step any of them
+        """
+        flipped: list[tuple[int, int]] = []
+        for position, cell in into:
+            isAlive = self.checkCell(*position)
+            if isAlive != self.isAlive(*position):
+                flipped.append(position)
+            cell.isAlive = isAlive
+        into.__flipped = (np.array([row for row, _ in flipped], dtype=np.intp), np.array([col for _, col in flipped], dtype=np.intp))
+
+    def flippedCells(self) -> tuple[NDArray[np.intp], NDArray[np.intp]]:
+        """
+        returns the rows and cols of the cells that differ between this grid and the grid whose nextGeneration last wrote into it
+        every grid type has this, so GameController can update its hash without comparing whole boards
+        """
+        return self.__flipped
+
     def checkCell(self, row, col) -> bool:
         """
         checks cell's state and neighbors and returns its isAlive for the next generation
@@ -0,0 +1,268 @@
+import numpy as np
+from numpy.typing import NDArray
+from typing import Optional
+from datastructures.hashmap import HashMap
+from projects.project2.numpygrid import NumpyGrid
+
+class Node:
+    """
+    Square of 2^level by 2^level cells on the plane, split into four quadrants of the level below
+    Nodes are hash-consed by HashLife, so equal squares are always the same node and can be compared by identity
+    """
+    __slots__ = ("level", "population", "nw", "ne", "sw", "se")
+
+    def __init__(self, level: int, population: int, nw: Optional["Node"] = None, ne: Optional["Node"] = None,
+                 sw: Optional["Node"] = None, se: Optional["Node"] = None) -> None:
+        self.level: int = level
+        self.population: int = population
+        self.nw = nw
+        self.ne = ne
+        self.sw = sw
+        self.se = se
+
+class HashLife:
+    """
+    Game of Life on an unbounded plane, using Gosper's HashLife algorithm
+    The plane is a quadtree of canonical nodes, so repeated regions in space are stored once,
+    and the result of advancing each node is memoized, so repeated regions in time are computed once
+    step(k) jumps 2^k generations in one call, which for periodic patterns takes about as long as a single generation
+    Unlike the grids there's no boarder, conversions to and from grids crop the plane to the grid's size
+    """
+    DEAD = Node(0, 0)
+    ALIVE = Node(0, 1)
+
+    def __init__(self) -> None:
+        #canonical node for each tuple of quadrants
+        self.__nodes: HashMap[tuple[Node, Node, Node, Node], Node] = HashMap()
+        #center of each node advanced by 2^j generations, keyed by node and j
+        self.__results: HashMap[tuple[Node, int], Node] = HashMap()
+        #empty node of each level
+        self.__empty: list[Node] = [HashLife.DEAD]
+        self.__root: Node = self.__emptyNode(3)
+        #plane coordinates of the root's top left cell
+        self.__origin: tuple[int, int] = (-4, -4)
+        self.__generation: int = 0
+
+    @staticmethod
+    def fromNumpy(cells: NDArray) -> "HashLife":
+        """
+        makes a plane with cells[row, col] at (row, col), and every other cell dead
+        """
+        life = HashLife()
+        rows, cols = cells.shape
+        level = max(3, int(max(rows, cols) - 1).bit_length())
+        padded = np.zeros((1 << level, 1 << level), dtype=np.bool_)
+        padded[:rows, :cols] = cells
+        life.__root = life.__build(padded, level, 0, 0)
+        life.__origin = (0, 0)
+        return life
+
+    @staticmethod
+    def fromGrid(grid) -> "HashLife":
+        """
+        makes a plane from a Grid, NumpyGrid or BitGrid, keeping the grid's coordinates
+        the grid's boarder is dead, so the plane around it starts out dead too
+        """
+        if hasattr(grid, "toNumpy"):
+            return HashLife.fromNumpy(grid.toNumpy())
+        rows, cols = grid.shape
+        return HashLife.fromNumpy(np.array([[grid.isAlive(row, col) for col in range(cols)] for row in range(rows)], dtype=np.bool_))
+
+    def toNumpy(self, top: int, left: int, rows: int, cols: int) -> NDArray[np.bool_]:
+        """
+        returns the rows by cols window of the plane whose top left cell is (top, left)
+        """
+        output = np.zeros((rows, cols), dtype=np.bool_)
+        self.__draw(self.__root, self.__origin[0] - top, self.__origin[1] - left, output)
+        return output
+
+    def toGrid(self, rows: int = 32, cols: int = 32, gridType: type = NumpyGrid):
+        """
+        returns a grid of gridType holding the plane from (0, 0) to (rows-1, cols-1)
+        cells on the grid's boarder and outside it are cropped
+        """
+        cells = self.toNumpy(0, 0, rows, cols)
+        if hasattr(gridType, "fromNumpy"):
+            return gridType.fromNumpy(cells)
+        grid = gridType(rows, cols)
+        for row, col in np.argwhere(cells).tolist():
+            grid.setAlive(row, col, True)
+        return grid
+
+    @property
+    def generation(self) -> int:
+        return self.__generation
+
+    @property
+    def population(self) -> int:
+        return self.__root.population
+
+    def isAlive(self, row: int, col: int) -> bool:
+        return bool(self.toNumpy(row, col, 1, 1)[0, 0])
+
+    def step(self, k: int = 0) -> None:
+        """
+        advances the plane by 2^k generations
+        the root is padded with empty space first, so the pattern can't grow past it in that many generations
+        """
+        while self.__root.level < k + 2 or not self.__isPadded(self.__root):
+            self.__padRoot()
+        #padding once more puts the root in the middle, so its result is the root's own square
+        self.__padRoot()
+        self.__root = self.__successor(self.__root, k)
+        self.__origin = (self.__origin[0] + (1 << (self.__root.level - 1)), self.__origin[1] + (1 << (self.__root.level - 1)))
+        self.__generation += 1 << k
+
+    def run(self, generations: int) -> None:
+        """
+        advances the plane by any number of generations, jumping by each power of two in its binary form
+        """
+        k = 0
+        while generations:
+            if generations & 1:
+                self.step(k)
+            generations >>= 1
+            k += 1
+
+    def __len__(self) -> int:
+        return len(self.__nodes)
+
+    def __join(self, nw: Node, ne: Node, sw: Node, se: Node) -> Node:
+        """
+        returns the canonical node with these quadrants, making it if it doesn't exist yet
+        """
+        key = (nw, ne, sw, se)
+        try:
+            return self.__nodes[key]
+        except KeyError:
+            node = Node(nw.level + 1, nw.population + ne.population + sw.population + se.population, nw, ne, sw, se)
+            self.__nodes[key] = node
+            return node
+
+    def __emptyNode(self, level: int) -> Node:
+        while len(self.__empty) <= level:
+            smaller = self.__empty[-1]
+            self.__empty.append(self.__join(smaller, smaller, smaller, smaller))
+        return self.__empty[level]
+
+    def __padRoot(self) -> None:
+        """
+        surrounds the root with empty space, making it the center of a node one level up
+        """
+        root = self.__root
+        empty = self.__emptyNode(root.level - 1)
+        self.__root = self.__join(
+            self.__join(empty, empty, empty, root.nw),
+            self.__join(empty, empty, root.ne, empty),
+            self.__join(empty, root.sw, empty, empty),
+            self.__join(root.se, empty, empty, empty))
+        self.__origin = (self.__origin[0] - (1 << (root.level - 1)), self.__origin[1] - (1 << (root.level - 1)))
+
+    @staticmethod
+    def __isPadded(node: Node) -> bool:
+        """
+        checks if every live cell is in the center half of node
+        """
+        return (node.nw.population == node.nw.se.se.population and node.ne.population == node.ne.sw.sw.population
+                and node.sw.population == node.sw.ne.ne.population and node.se.population == node.se.nw.nw.population)
+
+    def __successor(self, node: Node, j: int) -> Node:
+        """
+        returns node's center square, half node's size, advanced by 2^j generations
+        j is capped at node.level - 2, the most generations the center can be advanced without seeing past node
+        the center is built from the results of nine overlapping subnodes, each memoized
+        """
+        if node.population == 0:
+            return node.nw
+        j = min(j, node.level - 2)
+        key = (node, j)
+        try:
+            return self.__results[key]
+        except KeyError:
+            pass
+
+        if node.level == 2:
+            result = self.__lifeFourByFour(node)
+        else:
+            nw, ne, sw, se = node.nw, node.ne, node.sw, node.se
+            join = self.__join
+            #the nine overlapping subnodes one level down, advanced
+            c1 = self.__successor(nw, j)
+            c2 = self.__successor(join(nw.ne, ne.nw, nw.se, ne.sw), j)
+            c3 = self.__successor(ne, j)
+            c4 = self.__successor(join(nw.sw, nw.se, sw.nw, sw.ne), j)
+            c5 = self.__successor(join(nw.se, ne.sw, sw.ne, se.nw), j)
+            c6 = self.__successor(join(ne.sw, ne.se, se.nw, se.ne), j)
+            c7 = self.__successor(sw, j)
+            c8 = self.__successor(join(sw.ne, se.nw, sw.se, se.sw), j)
+            c9 = self.__successor(se, j)
+            if j < node.level - 2:
+                #already advanced enough, so just take the centers of the four overlapping quarters
+                result = join(
+                    join(c1.se, c2.sw, c4.ne, c5.nw),
+                    join(c2.se, c3.sw, c5.ne, c6.nw),
+                    join(c4.se, c5.sw, c7.ne, c8.nw),
+                    join(c5.se, c6.sw, c8.ne, c9.nw))
+            else:
+                #advance the four overlapping quarters again, for twice the generations in total
+                result = join(
+                    self.__successor(join(c1, c2, c4, c5), j),
+                    self.__successor(join(c2, c3, c5, c6), j),
+                    self.__successor(join(c4, c5, c7, c8), j),
+                    self.__successor(join(c5, c6, c8, c9), j))
+        self.__results[key] = result
+        return result
+
+    def __lifeFourByFour(self, node: Node) -> Node:
+        """
+        returns the center 2x2 of a 4x4 node after one generation
+        """
+        cells = [[0] * 4 for _ in range(4)]
+        for quadrant, (rowOffset, colOffset) in ((node.nw, (0, 0)), (node.ne, (0, 2)), (node.sw, (2, 0)), (node.se, (2, 2))):
+            cells[rowOffset][colOffset] = quadrant.nw.population
+            cells[rowOffset][colOffset+1] = quadrant.ne.population
+            cells[rowOffset+1][colOffset] = quadrant.sw.population
+            cells[rowOffset+1][colOffset+1] = quadrant.se.population
+
+        def nextCell(row: int, col: int) -> Node:
+            #the 3x3 block includes the cell itself
+            liveInBlock = sum(cells[r][c] for r in range(row-1, row+2) for c in range(col-1, col+2))
+            alive = liveInBlock == 3 or (liveInBlock == 4 and cells[row][col])
+            return HashLife.ALIVE if alive else HashLife.DEAD
+
+        return self.__join(nextCell(1, 1), nextCell(1, 2), nextCell(2, 1), nextCell(2, 2))
+
+    def __build(self, cells: NDArray[np.bool_], level: int, top: int, left: int) -> Node:
+        """
+        returns the node for the 2^level square of cells at (top, left), skipping empty regions in one check
+        """
+        if level == 0:
+            return HashLife.ALIVE if cells[top, left] else HashLife.DEAD
+        size = 1 << level
+        if not cells[top:top+size, left:left+size].any():
+            return self.__emptyNode(level)
+        half = size // 2
+        return self.__join(
+            self.__build(cells, level-1, top, left),
+            self.__build(cells, level-1, top, left+half),
+            self.__build(cells, level-1, top+half, left),
+            self.__build(cells, level-1, top+half, left+half))
+
+    @staticmethod
+    def __draw(node: Node, top: int, left: int, output: NDArray[np.bool_]) -> None:
+        """
+        writes node's live cells into output, with node's top left cell at (top, left) in output's coordinates
+        skips empty nodes and nodes outside output
+        """
+        size = 1 << node.level
+        rows, cols = output.shape
+        if node.population == 0 or top >= rows or left >= cols or top + size <= 0 or left + size <= 0:
+            return
+        if node.level == 0:
+            output[top, left] = True
+            return
+        half = size // 2
+        HashLife.__draw(node.nw, top, left, output)
+        HashLife.__draw(node.ne, top, left+half, output)
+        HashLife.__draw(node.sw, top+half, left, output)
+        HashLife.__draw(node.se, top+half, left+half, output)
@@ -0,0 +1,111 @@
+import numpy as np
+from numpy.typing import NDArray
+
+class NumpyGrid:
+    """
+    Grid that stores the board as a numpy bool array instead of Cell objects
+    Computes a whole generation at once by summing shifted views of the board, so there's no python loop per cell
+    Has the same interface as Grid, so GameController can use either
+    The outermost rows and columns are the boarder, and are always dead
+    """
+    def __init__(self, rows: int = 32, cols: int = 32) -> None:
+        #protected rather than private, so SparseGrid can step parts of it
+        self._cells: NDArray[np.bool_] = np.zeros((rows, cols), dtype=np.bool_)
+        #cells the last nextGeneration into this grid flipped, as rows and cols
+        self._flipped: tuple[NDArray[np.intp], NDArray[np.intp]] = (np.empty(0, np.intp), np.empty(0, np.intp))
+
+    @classmethod
+    def randomGrid(cls, rows: int = 32, cols: int = 32) -> "NumpyGrid":
+        grid = cls(rows, cols)
+        grid._cells[1:-1, 1:-1] = np.random.random((rows-2, cols-2)) < 0.5
+        return grid
+
+    @classmethod
+    def fromNumpy(cls, cells: NDArray) -> "NumpyGrid":
+        """
+        makes a grid from a 2d array of live cells, including the boarder, which is cleared
+        """
+        grid = cls(*cells.shape)
+        grid._cells[1:-1, 1:-1] = cells[1:-1, 1:-1]
+        return grid
+
+    def toNumpy(self) -> NDArray[np.bool_]:
+        """
+        returns a read-only view of the live cells, including the boarder
+        """
+        view = self._cells.view()
+        view.flags.writeable = False
+        return view
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self._cells.shape
+
+    def isAlive(self, row: int, col: int) -> bool:
+        return bool(self._cells[row, col])
+
+    def setAlive(self, row: int, col: int, isAlive: bool) -> None:
+        #boarder cells are immutable
+        if self.__isBoarder(row, col):
+            return
+        self._cells[row, col] = isAlive
+
+    def checkCell(self, row, col) -> bool:
+        """
+        checks cell's state and neighbors and returns its isAlive for the next generation
+        """
+        if self.__isBoarder(row, col):
+            raise ValueError("attempted to check boarder cell")
+        #the 3x3 block includes the cell itself
+        liveInBlock = int(self._cells[row-1:row+2, col-1:col+2].sum())
+        return liveInBlock == 3 or (liveInBlock == 4 and bool(self._cells[row, col]))
+
+    def nextGeneration(self, into: "NumpyGrid") -> None:
+        """
+        writes the generation after this one into another grid of the same size
+        """
+        nextCells = NumpyGrid.nextInterior(self._cells)
+        flippedRows, flippedCols = np.nonzero(nextCells != self._cells[1:-1, 1:-1])
+        into._cells[1:-1, 1:-1] = nextCells
+        into._flipped = (flippedRows + 1, flippedCols + 1)
+
+    def flippedCells(self) -> tuple[NDArray[np.intp], NDArray[np.intp]]:
+        """
+        returns the rows and cols of the cells that differ between this grid and the grid whose nextGeneration last wrote into it
+        """
+        return self._flipped
+
+    @staticmethod
+    def nextInterior(cells: NDArray) -> NDArray[np.bool_]:
+        """
+        returns the next generation of every cell in cells except the outermost rows and columns
+        the live cells in each 3x3 block are summed as a column sum of three shifted rows, then a row sum of three shifted columns
+        a cell is alive next generation if its block has 3 live cells, or 4 including itself
+        """
+        counts = cells.view(np.uint8)
+        columnSums = counts[:-2] + counts[1:-1] + counts[2:]
+        blockSums = columnSums[:, :-2] + columnSums[:, 1:-1] + columnSums[:, 2:]
+        return (blockSums == 3) | ((blockSums == 4) & cells[1:-1, 1:-1])
+
+    def __len__(self) -> int:
+        return self._cells.size
+
+    def __str__(self) -> str:
+        return NumpyGrid.formatCells(self._cells)
+
+    @staticmethod
+    def formatCells(cells: NDArray[np.bool_]) -> str:
+        """
+        formats a 2d array of live cells, including the boarder, the way Grid prints, where boarder cells print as nothing
+        """
+        rows = ["".join(" x" if alive else " -" for alive in row[1:-1]) for row in cells[1:-1].tolist()]
+        return "\n".join(["", *rows, ""])
+
+    def __eq__(self, value) -> bool:
+        if not isinstance(value, NumpyGrid):
+            return False
+        return self._cells.shape == value._cells.shape and bool(np.array_equal(self._cells, value._cells))
+
+    def __isBoarder(self, row: int, col: int) -> bool:
+        rows, cols = self._cells.shape
+        return row % rows in (0, rows-1) or col % cols in (0, cols-1)
@@ -0,0 +1,136 @@
+from typing import Iterator
+import numpy as np
+from numpy.typing import NDArray
+from projects.project2.numpygrid import NumpyGrid
+
+#width and height of the tiles activity is tracked in
+_TILE: int = 16
+
+class SparseGrid(NumpyGrid):
+    """
+    NumpyGrid that only recomputes and copies the parts of the board that can change
+    The interior is split into 16x16 tiles, and a tile is active if it or a neighbouring tile changed last generation,
+    since a cell can only change if a cell in its 3x3 block did
+    A generation steps each run of active tiles in a row with NumpyGrid.nextInterior,
+    and copies over the other tiles the grid being written into doesn't already hold,
+    so a board with a few gliders costs work proportional to the gliders, not to its area
+    """
+    #stamps identify the contents of a tile, two tiles with the same stamp hold the same cells
+    #0 is the empty tile, and every other stamp is handed out once
+    __nextStamp: int = 1
+
+    def __init__(self, rows: int = 32, cols: int = 32) -> None:
+        super().__init__(rows, cols)
+        tileRows, tileCols = -(-max(rows-2, 0) // _TILE), -(-max(cols-2, 0) // _TILE)
+        #tiles that may change next generation, an empty board never changes
+        self.__active: NDArray[np.bool_] = np.zeros((tileRows, tileCols), dtype=np.bool_)
+        self.__stamps: NDArray[np.int64] = np.zeros((tileRows, tileCols), dtype=np.int64)
+
+    @classmethod
+    def randomGrid(cls, rows: int = 32, cols: int = 32) -> "SparseGrid":
+        grid = super().randomGrid(rows, cols)
+        grid.__touchAll()
+        return grid
+
+    @classmethod
+    def fromNumpy(cls, cells: NDArray) -> "SparseGrid":
+        """
+        makes a grid from a 2d array of live cells, including the boarder, which is cleared
+        """
+        grid = super().fromNumpy(cells)
+        grid.__touchAll()
+        return grid
+
+    @property
+    def activeTiles(self) -> int:
+        """
+        number of tiles the next generation will recompute
+        """
+        return int(self.__active.sum())
+
+    def setAlive(self, row: int, col: int, isAlive: bool) -> None:
+        wasAlive = self.isAlive(row, col)
+        super().setAlive(row, col, isAlive)
+        #boarder cells and cells already in that state don't change
+        if self.isAlive(row, col) == wasAlive:
+            return
+        rows, cols = self._cells.shape
+        tileRow, tileCol = (row % rows - 1) // _TILE, (col % cols - 1) // _TILE
+        self.__stamps[tileRow, tileCol] = SparseGrid.__takeStamps(1)[0]
+        #the cell's neighbours may be in the neighbouring tiles
+        self.__active[max(tileRow-1, 0):tileRow+2, max(tileCol-1, 0):tileCol+2] = True
+
+    def nextGeneration(self, into: "SparseGrid") -> None:
+        """
+        writes the generation after this one into another grid of the same size
+        into may hold any older board, so inactive tiles whose stamps differ are copied before the active tiles are stepped
+        """
+        rows, cols = self._cells.shape
+        stale = (into.__stamps != self.__stamps) & ~self.__active
+        for _, _, _, top, bottom, left, right in SparseGrid.__tileRuns(stale, rows, cols):
+            into._cells[top:bottom, left:right] = self._cells[top:bottom, left:right]
+        np.copyto(into.__stamps, self.__stamps)
+
+        changed = np.zeros_like(self.__active)
+        flippedRows: list[NDArray[np.intp]] = [np.empty(0, np.intp)]
+        flippedCols: list[NDArray[np.intp]] = [np.empty(0, np.intp)]
+        for tileRow, start, stop, top, bottom, left, right in SparseGrid.__tileRuns(self.__active, rows, cols):
+            nextCells = NumpyGrid.nextInterior(self._cells[top-1:bottom+1, left-1:right+1])
+            flipped = nextCells != self._cells[top:bottom, left:right]
+            changed[tileRow, start:stop] = np.logical_or.reduceat(flipped.any(axis=0), np.arange(0, right-left, _TILE))
+            runRows, runCols = np.nonzero(flipped)
+            flippedRows.append(runRows + top)
+            flippedCols.append(runCols + left)
+            into._cells[top:bottom, left:right] = nextCells
+        into.__stamps[changed] = SparseGrid.__takeStamps(int(changed.sum()))
+        into.__active = SparseGrid.__spread(changed)
+        #only active tiles can flip, so this is found without looking at the rest of the board
+        into._flipped = (np.concatenate(flippedRows), np.concatenate(flippedCols))
+
+    def __touchAll(self) -> None:
+        """
+        marks every tile as changed, after the whole board was set at once
+        """
+        self.__active[:] = True
+        self.__stamps[:] = SparseGrid.__takeStamps(self.__stamps.size).reshape(self.__stamps.shape)
+
+    @staticmethod
+    def __takeStamps(count: int) -> NDArray[np.int64]:
+        """
+        returns count stamps that haven't been used yet
+        """
+        stamps = np.arange(SparseGrid.__nextStamp, SparseGrid.__nextStamp + count, dtype=np.int64)
+        SparseGrid.__nextStamp += count
+        return stamps
+
+    @staticmethod
+    def __tileRuns(tiles: NDArray[np.bool_], rows: int, cols: int) -> Iterator[tuple[int, int, int, int, int, int, int]]:
+        """
+        yields the tile row, first tile and tile past the last, then the top, bottom, left and right cell bounds,
+        of each run of set tiles in each row of tiles
+        """
+        for tileRow in np.flatnonzero(tiles.any(axis=1)).tolist():
+            top, bottom = 1 + tileRow*_TILE, min(1 + (tileRow+1)*_TILE, rows-1)
+            for start, stop in SparseGrid.__runs(tiles[tileRow]):
+                yield tileRow, start, stop, top, bottom, 1 + start*_TILE, min(1 + stop*_TILE, cols-1)
+
+    @staticmethod
+    def __runs(active: NDArray[np.bool_]) -> list[tuple[int, int]]:
+        """
+        returns the start and stop of each run of active tiles in a row of tiles
+        """
+        edges = np.flatnonzero(np.diff(np.concatenate(([0], active.view(np.int8), [0]))))
+        return list(zip(edges[::2].tolist(), edges[1::2].tolist()))
+
+    @staticmethod
+    def __spread(changed: NDArray[np.bool_]) -> NDArray[np.bool_]:
+        """
+        returns the tiles that changed and the tiles next to them, including diagonally
+        """
+        spread = changed.copy()
+        spread[1:] |= changed[:-1]
+        spread[:-1] |= changed[1:]
+        rowsSpread = spread.copy()
+        spread[:, 1:] |= rowsSpread[:, :-1]
+        spread[:, :-1] |= rowsSpread[:, 1:]
+        return spread
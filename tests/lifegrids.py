@@ -0,0 +1,20 @@
+import numpy as np
+from projects.project2.grid import Grid
+
+#helpers shared by the game of life grid tests, which check every grid type against Grid
+
+def gridFromNumpy(cells: np.ndarray) -> Grid:
+    grid = Grid(*cells.shape)
+    for row, col in np.argwhere(cells).tolist():
+        grid.setAlive(row, col, True)
+    return grid
+
+def cellsOf(grid) -> np.ndarray:
+    rows, cols = grid.shape
+    return np.array([[grid.isAlive(row, col) for col in range(cols)] for row in range(rows)], dtype=np.bool_)
+
+def randomCells(rows: int, cols: int, seed: int = 152) -> np.ndarray:
+    cells = np.random.default_rng(seed).random((rows, cols)) < 0.4
+    cells[[0, -1], :] = False
+    cells[:, [0, -1]] = False
+    return cells
@@ -1,6 +1,8 @@
 import copy
+import math
+import numpy as np
 import pytest
-from datastructures.array import Array
+from datastructures.array import Array, ArrayView
 
 from tests.car import Car, Color, Make, Model
 
@@ -130,3 +132,278 @@ class TestArray:
     def test_bracket_operator_should_raise_a_type_error_if_the_index_is_not_an_integer_or_slice(self, setup_numerical_array: Array):
         with pytest.raises(TypeError):
             setup_numerical_array['string'] #type: ignore
+
+    def test_bracket_operator_should_return_a_view_that_reflects_changes_to_the_array(self, setup_numerical_array: Array):
+        view = setup_numerical_array[2:6]
+        assert isinstance(view, ArrayView)
+        setup_numerical_array[3] = 99
+        assert view[1] == 99
+
+    def test_slicing_a_view_should_return_a_view_of_the_same_items(self, setup_numerical_array: Array):
+        view = setup_numerical_array[1:9][2:4]
+        assert list(view) == [3, 4]
+
+    def test_bracket_operator_should_support_negative_and_reversed_slices(self, setup_numerical_array: Array):
+        assert list(setup_numerical_array[-3:]) == [7, 8, 9]
+        assert list(setup_numerical_array[::-1]) == [9, 8, 7, 6, 5, 4, 3, 2, 1, 0]
+        assert list(setup_numerical_array[::2]) == [0, 2, 4, 6, 8]
+
+    def test_view_copy_should_return_an_independent_array(self, setup_numerical_array: Array):
+        copied = setup_numerical_array[0:3].copy()
+        assert isinstance(copied, Array)
+        setup_numerical_array[0] = 99
+        assert copied == Array([0, 1, 2], data_type=int)
+
+    def test_view_should_not_allow_setting_items(self, setup_numerical_array: Array):
+        view = setup_numerical_array[0:3]
+        with pytest.raises(TypeError):
+            view[0] = 5 #type: ignore
+
+    def test_view_should_raise_a_runtime_error_after_items_are_removed_from_the_array(self):
+        array = Array(['a', 'bb', 'ccc'], data_type=str)
+        view = array[0:2]
+        array.pop_front()
+        with pytest.raises(RuntimeError):
+            list(view)
+        with pytest.raises(RuntimeError):
+            view[0]
+
+    def test_view_should_raise_a_runtime_error_after_an_item_is_deleted_from_the_array(self, setup_numerical_array: Array):
+        view = setup_numerical_array[2:6]
+        del setup_numerical_array[3]
+        with pytest.raises(RuntimeError):
+            view.copy()
+        with pytest.raises(RuntimeError):
+            len(view)
+
+    def test_view_should_raise_a_runtime_error_after_items_are_added_to_the_array(self, setup_numerical_array: Array):
+        view = setup_numerical_array[0:3]
+        nested = view[1:]
+        setup_numerical_array.append(10)
+        with pytest.raises(RuntimeError):
+            3 in view
+        with pytest.raises(RuntimeError):
+            list(nested)
+
+    def test_iterating_a_view_should_raise_a_runtime_error_once_the_array_changes_mid_chunk(self, setup_numerical_array: Array):
+        iterator = iter(setup_numerical_array[0:5])
+        assert next(iterator) == 0
+        setup_numerical_array.pop()
+        with pytest.raises(RuntimeError):
+            next(iterator)
+
+    def test_del_operator_should_shift_items_after_the_deleted_index_down(self, setup_numerical_array: Array):
+        del setup_numerical_array[4]
+        assert list(setup_numerical_array) == [0, 1, 2, 3, 5, 6, 7, 8, 9]
+        del setup_numerical_array[-1]
+        assert list(setup_numerical_array) == [0, 1, 2, 3, 5, 6, 7, 8]
+
+    def test_primitive_arrays_should_use_fixed_width_numpy_dtypes(self):
+        array = Array([1, 2, 3], data_type=int)
+        array.append(2**40)
+        assert array[-1] == 2**40
+        assert type(array[0]) is int
+        assert all(type(item) is float for item in Array([1.5, 2.5], data_type=float))
+        assert list(Array([True, False], data_type=bool)) == [True, False]
+
+    def test_constructor_should_raise_a_type_error_for_mismatched_primitives(self):
+        with pytest.raises(TypeError):
+            Array([1, 2.5], data_type=int)
+        with pytest.raises(TypeError):
+            Array([True, 1], data_type=bool)
+        with pytest.raises(TypeError):
+            Array([[1, 2], [3]], data_type=int) #type: ignore
+
+    def test_string_arrays_should_not_truncate_items(self):
+        array = Array(['zero', 'one', 'two'], data_type=str)
+        assert array[0] == 'zero'
+        assert str(array) == '[zero, one, two]'
+
+    def test_iterating_a_large_primitive_array_should_yield_every_item_in_order(self):
+        array = Array(list(range(10000)), data_type=int)
+        assert list(array) == list(range(10000))
+        assert list(array[5000:]) == list(range(5000, 10000))
+
+    def test_from_numpy_should_share_memory_with_a_compatible_numpy_array(self):
+        items = np.arange(10, dtype=np.int64)
+        array = Array.from_numpy(items)
+        assert len(array) == 10
+        array[0] = 42
+        assert items[0] == 42
+
+    def test_from_numpy_should_copy_an_incompatible_numpy_array(self):
+        items = np.arange(5, dtype=np.int32)
+        array = Array.from_numpy(items, data_type=int)
+        array[0] = 42
+        assert items[0] == 0
+        assert list(array) == [42, 1, 2, 3, 4]
+
+    @pytest.mark.parametrize('dtype', [np.uint8, np.int16, np.uint64])
+    def test_from_numpy_should_convert_other_integer_dtypes_to_int(self, dtype: type):
+        items = np.arange(5, dtype=dtype)
+        array = Array.from_numpy(items)
+        array.append(5)
+        assert list(array) == [0, 1, 2, 3, 4, 5]
+        assert all(type(item) is int for item in array)
+
+    def test_from_numpy_should_raise_a_value_error_for_uint64_items_too_large_for_int64(self):
+        with pytest.raises(ValueError):
+            Array.from_numpy(np.array([1, 2**63], dtype=np.uint64))
+        assert len(Array.from_numpy(np.array([], dtype=np.uint64))) == 0
+
+    def test_from_numpy_should_raise_a_type_error_for_the_wrong_data_type(self):
+        with pytest.raises(TypeError):
+            Array.from_numpy(np.array([1.5, 2.5]), data_type=int)
+
+    def test_from_buffer_should_interpret_the_buffer_as_the_data_type(self):
+        buffer = bytearray(np.arange(4, dtype=np.int64).tobytes())
+        array = Array.from_buffer(buffer, data_type=int)
+        assert list(array) == [0, 1, 2, 3]
+        array[1] = 7
+        assert np.frombuffer(buffer, dtype=np.int64)[1] == 7
+
+    def test_from_buffer_should_copy_a_read_only_buffer(self):
+        array = Array.from_buffer(np.arange(3, dtype=np.float64).tobytes(), data_type=float)
+        array[0] = 1.5
+        assert list(array) == [1.5, 1.0, 2.0]
+
+    def test_from_iterable_should_accept_a_generator(self):
+        assert list(Array.from_iterable((i * i for i in range(5)), data_type=int)) == [0, 1, 4, 9, 16]
+
+    def test_extend_should_append_every_item_in_order(self, setup_numerical_array: Array):
+        setup_numerical_array.extend(range(10, 15))
+        setup_numerical_array.extend(np.arange(15, 20))
+        assert list(setup_numerical_array) == list(range(20))
+
+    def test_extend_should_not_append_anything_if_an_item_has_the_wrong_type(self, setup_complex_object_array: Array):
+        with pytest.raises(TypeError):
+            setup_complex_object_array.extend([self.car1, 'string'])
+        assert len(setup_complex_object_array) == 3
+
+    def test_append_front_should_insert_items_before_the_first_item(self):
+        array = Array[int](data_type=int)
+        for i in range(10, 0, -1):
+            array.append_front(i)
+        assert list(array) == list(range(1, 11))
+        assert array[0] == 1 and array[-1] == 10
+
+    def test_pop_front_should_remove_the_first_item(self, setup_numerical_array: Array):
+        setup_numerical_array.pop_front()
+        setup_numerical_array.pop_front()
+        assert list(setup_numerical_array) == list(range(2, 10))
+        assert 0 not in setup_numerical_array and 1 not in setup_numerical_array
+
+    def test_pop_should_raise_an_index_error_if_the_array_is_empty(self):
+        array = Array[int](data_type=int)
+        with pytest.raises(IndexError):
+            array.pop()
+        with pytest.raises(IndexError):
+            array.pop_front()
+
+    def test_array_should_work_as_a_queue_with_appends_and_front_removals(self):
+        array = Array[int](data_type=int)
+        expected = []
+        for i in range(1000):
+            array.append(i)
+            expected.append(i)
+            if i % 3 == 0:
+                array.pop_front()
+                expected.pop(0)
+            if i % 7 == 0:
+                array.append_front(-i)
+                expected.insert(0, -i)
+        assert list(array) == expected
+        assert list(reversed(array)) == expected[::-1]
+
+    def test_del_operator_should_remove_items_near_the_front_and_back(self, setup_complex_object_array: Array):
+        del setup_complex_object_array[0]
+        assert list(setup_complex_object_array) == [self.car2, self.car3]
+        setup_complex_object_array.append_front(self.car1)
+        del setup_complex_object_array[2]
+        assert list(setup_complex_object_array) == [self.car1, self.car2]
+
+    def test_constructor_should_raise_a_value_error_if_the_growth_factor_is_not_greater_than_1(self):
+        with pytest.raises(ValueError):
+            Array([1, 2], data_type=int, growth_factor=1)
+
+    def test_reserve_should_allow_appending_without_reallocating(self):
+        array = Array[int](data_type=int)
+        array.reserve(100)
+        assert array.capacity >= 100
+        for i in range(100):
+            array.append(i)
+        assert array.capacity == 100
+        array.reserve(10)
+        assert array.capacity == 100
+
+    def test_shrink_to_fit_should_set_the_capacity_to_the_length(self, setup_numerical_array: Array):
+        setup_numerical_array.append(10)
+        assert setup_numerical_array.capacity > 11
+        setup_numerical_array.shrink_to_fit()
+        assert setup_numerical_array.capacity == 11
+        assert list(setup_numerical_array) == list(range(11))
+
+    def test_popping_should_shrink_the_capacity_with_hysteresis(self):
+        array = Array[int](list(range(64)), data_type=int, growth_factor=2)
+        array.append(64)
+        grown_capacity = array.capacity
+        array.pop()
+        array.append(64)
+        array.pop()
+        assert array.capacity == grown_capacity
+        while len(array) > grown_capacity // 4:
+            array.pop()
+        assert array.capacity == grown_capacity // 2
+
+    def test_popping_from_the_front_should_shrink_the_capacity_with_hysteresis(self):
+        array = Array[int](list(range(64)), data_type=int, growth_factor=2)
+        array.append_front(-1)
+        grown_capacity = array.capacity
+        array.pop_front()
+        array.append_front(-1)
+        array.pop_front()
+        assert array.capacity == grown_capacity
+        while len(array) > grown_capacity // 4:
+            array.pop_front()
+        assert array.capacity == grown_capacity // 2
+        array.append_front(-1)
+        assert array.capacity == grown_capacity // 2
+        array.pop_front()
+        assert array.capacity == grown_capacity // 2
+        assert list(array) == list(range(64 - grown_capacity // 4, 64))
+
+    @pytest.mark.parametrize('growth_factor', [1.5, 2.0, 3.0])
+    def test_alternating_front_operations_at_the_shrink_boundary_should_not_reallocate(self, growth_factor: float):
+        array = Array[int](list(range(1000)), data_type=int, growth_factor=growth_factor)
+        capacity = array.capacity
+        while array.capacity == capacity:
+            array.pop_front()
+        capacity = array.capacity
+        for i in range(2000):
+            array.append_front(i)
+            assert array.capacity == capacity
+            array.pop_front()
+            assert array.capacity == capacity
+        for i in range(2000):
+            array.pop_front()
+            assert array.capacity == capacity
+            array.append_front(i)
+            assert array.capacity == capacity
+
+    def test_append_should_be_amortized_constant_time_across_100_thousand_operations(self):
+        #every reallocation copies the whole array, so appends are amortized O(1) if the total number of copied items is O(n)
+        operations = 10**5
+        growth_factor = 1.5
+        array = Array[int](data_type=int, growth_factor=growth_factor)
+        capacity = array.capacity
+        reallocations = 0
+        copied_items = 0
+        for i in range(operations):
+            array.append(i)
+            if array.capacity != capacity:
+                reallocations += 1
+                copied_items += i
+                capacity = array.capacity
+        assert len(array) == operations
+        assert reallocations <= math.log(operations, growth_factor) + 2
+        assert copied_items <= operations * growth_factor / (growth_factor - 1)
@@ -89,3 +89,10 @@ class TestArrayStack:
     def test_repr(self, stack: ArrayStack) -> None:
         stack.push(1)
         stack.push(2)
+
+    def test_iter(self, stack: ArrayStack) -> None:
+        for i in range(3):
+            stack.push(i)
+        stack.pop()
+        assert list(stack) == [0, 1]
+        assert stack != [0, 1]
@@ -0,0 +1,80 @@
+import asyncio
+import pytest
+from datastructures.asynccircularqueue import AsyncCircularQueue
+
+@pytest.fixture
+def empty_queue():
+    return AsyncCircularQueue(maxsize=3, data_type=int)
+
+class TestAsyncCircularQueue:
+
+    def test_nowait(self, empty_queue: AsyncCircularQueue):
+        empty_queue.put_nowait(1)
+        empty_queue.put_nowait(2)
+        empty_queue.put_nowait(3)
+        with pytest.raises(IndexError):
+            empty_queue.put_nowait(4)
+        assert empty_queue.get_nowait() == 1
+        assert empty_queue.get_many_nowait(5) == [2, 3]
+        with pytest.raises(IndexError):
+            empty_queue.get_nowait()
+
+    def test_put_waits_for_room(self, empty_queue: AsyncCircularQueue):
+        async def run():
+            await empty_queue.put_many([1, 2, 3])
+            putter = asyncio.create_task(empty_queue.put(4))
+            await asyncio.sleep(0)
+            assert not putter.done()
+            assert await empty_queue.get() == 1
+            await putter
+            return empty_queue.get_many_nowait(5)
+        assert asyncio.run(run()) == [2, 3, 4]
+
+    def test_get_waits_for_item(self, empty_queue: AsyncCircularQueue):
+        async def run():
+            getter = asyncio.create_task(empty_queue.get_many(10))
+            await asyncio.sleep(0)
+            assert not getter.done()
+            empty_queue.put_nowait(1)
+            empty_queue.put_nowait(2)
+            return await getter
+        assert asyncio.run(run()) == [1, 2]
+
+    def test_timeout(self, empty_queue: AsyncCircularQueue):
+        async def run():
+            with pytest.raises(TimeoutError):
+                async with asyncio.timeout(0.01):
+                    await empty_queue.get()
+            #the timed out getter mustn't take the next item
+            empty_queue.put_nowait(1)
+            return await empty_queue.get()
+        assert asyncio.run(run()) == 1
+
+    def test_cancelled_after_wakeup_passes_it_on(self, empty_queue: AsyncCircularQueue):
+        async def run():
+            first = asyncio.create_task(empty_queue.get())
+            second = asyncio.create_task(empty_queue.get())
+            await asyncio.sleep(0)
+            #wakes first, which is cancelled before it can take the item
+            empty_queue.put_nowait(1)
+            first.cancel()
+            await asyncio.sleep(0)
+            assert first.cancelled()
+            return await asyncio.wait_for(second, 1)
+        assert asyncio.run(run()) == 1
+
+    def test_producers_and_consumers(self):
+        async def run():
+            queue = AsyncCircularQueue(maxsize=4, data_type=int)
+            received = []
+
+            async def produce(start: int):
+                await queue.put_many(list(range(start, start + 100)))
+
+            async def consume():
+                while len(received) < 300:
+                    received.extend(await queue.get_many(3))
+
+            await asyncio.gather(produce(0), produce(100), produce(200), consume())
+            return received
+        assert sorted(asyncio.run(run())) == list(range(300))
@@ -0,0 +1,96 @@
+import numpy as np
+import pytest
+from datastructures.array2d import Array2D
+from projects.project2.bitgrid import BitGrid
+from projects.project2.cell import Cell
+from projects.project2.grid import Grid
+from projects.project2.numpygrid import NumpyGrid
+from tests.lifegrids import cellsOf, gridFromNumpy, randomCells
+
+class TestBitGrid:
+    @pytest.mark.parametrize('shape', [(12, 19), (19, 12), (3, 3), (10, 64), (9, 65), (7, 130)])
+    def test_next_generation_should_match_grid(self, shape: tuple[int, int]):
+        cells = randomCells(*shape, seed=shape[0] * shape[1])
+        bitGrids = [BitGrid.fromNumpy(cells), BitGrid(*shape)]
+        grids = [gridFromNumpy(cells), Grid(*shape)]
+        for generation in range(8):
+            bitGrids[generation % 2].nextGeneration(into=bitGrids[(generation+1) % 2])
+            grids[generation % 2].nextGeneration(into=grids[(generation+1) % 2])
+            assert np.array_equal(bitGrids[(generation+1) % 2].toNumpy(), cellsOf(grids[(generation+1) % 2]))
+
+    @pytest.mark.parametrize('cols', [64, 65, 66, 127, 128, 129, 200])
+    def test_next_generation_should_match_numpy_grid_across_word_boundaries(self, cols: int):
+        cells = randomCells(40, cols, seed=cols)
+        bitGrids = [BitGrid.fromNumpy(cells), BitGrid(40, cols)]
+        numpyGrids = [NumpyGrid.fromNumpy(cells), NumpyGrid(40, cols)]
+        for generation in range(30):
+            bitGrids[generation % 2].nextGeneration(into=bitGrids[(generation+1) % 2])
+            numpyGrids[generation % 2].nextGeneration(into=numpyGrids[(generation+1) % 2])
+            assert np.array_equal(bitGrids[(generation+1) % 2].toNumpy(), numpyGrids[(generation+1) % 2].toNumpy())
+
+    def test_a_blinker_should_cross_a_word_boundary(self):
+        #a vertical blinker in columns 62 to 64 spans words 0 and 1 when it turns horizontal
+        grid, stepped = BitGrid(7, 70), BitGrid(7, 70)
+        for row in (2, 3, 4):
+            grid.setAlive(row, 63, True)
+        grid.nextGeneration(into=stepped)
+        assert [stepped.isAlive(3, col) for col in (62, 63, 64)] == [True, True, True]
+        assert not stepped.isAlive(2, 63) and not stepped.isAlive(4, 63)
+        stepped.nextGeneration(into=grid)
+        assert [grid.isAlive(row, 63) for row in (2, 3, 4)] == [True, True, True]
+
+    def test_padding_columns_should_stay_dead(self):
+        #a full board's last interior column borders the boarder column, which is followed by padding bits
+        cells = np.ones((6, 66), dtype=np.bool_)
+        grid, stepped = BitGrid.fromNumpy(cells), BitGrid(6, 66)
+        for _ in range(4):
+            grid.nextGeneration(into=stepped)
+            grid, stepped = stepped, grid
+            assert not grid.toNumpy()[:, [0, -1]].any()
+        assert grid == BitGrid.fromNumpy(grid.toNumpy())
+
+    def test_random_grid_should_leave_the_boarder_and_padding_dead(self):
+        grid = BitGrid.randomGrid(20, 70)
+        cells = grid.toNumpy()
+        assert cells.shape == (20, 70)
+        assert not cells[[0, -1], :].any() and not cells[:, [0, -1]].any()
+        assert BitGrid.fromNumpy(cells) == grid
+
+    @pytest.mark.parametrize('shape', [(5, 5), (12, 64), (12, 65), (3, 129)])
+    def test_from_numpy_and_to_numpy_should_round_trip(self, shape: tuple[int, int]):
+        cells = randomCells(*shape)
+        grid = BitGrid.fromNumpy(cells)
+        assert grid.shape == shape
+        assert np.array_equal(grid.toNumpy(), cells)
+        assert BitGrid.fromNumpy(grid.toNumpy()) == grid
+
+    def test_from_numpy_should_clear_the_boarder(self):
+        cells = BitGrid.fromNumpy(np.ones((5, 70), dtype=np.bool_)).toNumpy()
+        assert not cells[[0, -1], :].any() and not cells[:, [0, -1]].any()
+        assert cells[1:-1, 1:-1].all()
+
+    def test_grid_and_array2d_conversions_should_round_trip(self):
+        cells = randomCells(9, 13)
+        grid = BitGrid.fromGrid(gridFromNumpy(cells))
+        assert np.array_equal(grid.toNumpy(), cells)
+        assert np.array_equal(cellsOf(grid.toGrid()), cells)
+        array = grid.toArray2D()
+        assert isinstance(array, Array2D) and isinstance(array[0][0], Cell)
+        assert BitGrid.fromArray2D(array) == grid
+
+    def test_set_alive_and_check_cell_at_word_boundaries(self):
+        grid = BitGrid(5, 130)
+        for col in (63, 64, 127, 128):
+            grid.setAlive(2, col, True)
+            assert grid.isAlive(2, col)
+        grid.setAlive(2, 64, False)
+        assert not grid.isAlive(2, 64)
+        grid.setAlive(2, 129, True)
+        grid.setAlive(0, 64, True)
+        assert not grid.isAlive(2, 129) and not grid.isAlive(0, 64)
+        with pytest.raises(ValueError):
+            grid.checkCell(2, 129)
+
+    def test_str_should_match_grid(self):
+        cells = randomCells(6, 70)
+        assert str(BitGrid.fromNumpy(cells)) == str(gridFromNumpy(cells))
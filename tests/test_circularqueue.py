@@ -97,4 +97,22 @@ class TestCircularQueue:
             q2.enqueue(i)
         q1.dequeue()
         q1.enqueue(5)
-        assert q1 != q2
\ No newline at end of file
+        assert q1 != q2
+
+    def test_iter_after_wrapping(self, full_queue: CircularQueue):
+        full_queue.dequeue()
+        full_queue.dequeue()
+        full_queue.enqueue(6)
+        assert list(full_queue) == [3, 4, 5, 6]
+        assert str(full_queue) == "[3, 4, 5, 6]"
+        assert len(full_queue) == 4
+
+    def test_contains_only_queued_items(self, full_queue: CircularQueue):
+        full_queue.dequeue()
+        full_queue.enqueue(6)
+        assert 6 in full_queue
+        assert 3 in full_queue
+        assert 1 not in full_queue
+
+    def test_not_equal_to_other_types(self, small_queue: CircularQueue):
+        assert small_queue != [1, 2, 3]
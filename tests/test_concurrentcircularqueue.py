@@ -0,0 +1,89 @@
+import threading
+import pytest
+from copy import deepcopy
+from datastructures.concurrentcircularqueue import ConcurrentCircularQueue
+
+@pytest.fixture
+def empty_queue():
+    return ConcurrentCircularQueue(maxsize=5, data_type=int)
+
+class TestConcurrentCircularQueue:
+
+    def test_enqueue_dequeue(self, empty_queue: ConcurrentCircularQueue):
+        empty_queue.enqueue(1)
+        empty_queue.enqueue(2)
+        assert len(empty_queue) == 2
+        assert empty_queue.front == 1
+        assert empty_queue.dequeue() == 1
+        assert str(empty_queue) == "[2]"
+
+    def test_try_operations(self, empty_queue: ConcurrentCircularQueue):
+        assert empty_queue.try_dequeue() is None
+        assert empty_queue.try_dequeue(default=-1) == -1
+        for i in range(5):
+            assert empty_queue.try_enqueue(i)
+        assert not empty_queue.try_enqueue(5)
+        assert empty_queue.try_dequeue() == 0
+
+    def test_many(self, empty_queue: ConcurrentCircularQueue):
+        assert empty_queue.enqueue_many(list(range(7))) == 5
+        assert empty_queue.dequeue_many(3) == [0, 1, 2]
+        assert empty_queue.dequeue_many(10) == [3, 4]
+        assert empty_queue.dequeue_many(10) == []
+
+    def test_timeouts(self, empty_queue: ConcurrentCircularQueue):
+        with pytest.raises(TimeoutError):
+            empty_queue.get(timeout=0.01)
+        empty_queue.enqueue_many([1, 2, 3, 4, 5])
+        with pytest.raises(TimeoutError):
+            empty_queue.put(6, timeout=0.01)
+
+    def test_equality_and_copy(self, empty_queue: ConcurrentCircularQueue):
+        empty_queue.enqueue_many([1, 2, 3])
+        copied = deepcopy(empty_queue)
+        assert copied == empty_queue
+        copied.put(4)
+        assert copied.get() == 1
+        assert len(empty_queue) == 3
+
+    def test_comparing_in_opposite_orders_from_two_threads_should_not_deadlock(self):
+        queue1 = ConcurrentCircularQueue(maxsize=5, data_type=int)
+        queue2 = ConcurrentCircularQueue(maxsize=5, data_type=int)
+        queue1.enqueue_many([1, 2, 3])
+        queue2.enqueue_many([1, 2, 3])
+        results = []
+
+        def compare(a: ConcurrentCircularQueue, b: ConcurrentCircularQueue):
+            results.append(all(a == b for _ in range(2000)))
+
+        threads = [threading.Thread(target=compare, args=pair, daemon=True) for pair in [(queue1, queue2), (queue2, queue1)]]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=10)
+        assert not any(thread.is_alive() for thread in threads)
+        assert results == [True, True]
+
+    def test_many_producers_and_consumers(self):
+        queue = ConcurrentCircularQueue(maxsize=8, data_type=int)
+        produced_per_thread = 2000
+        results = []
+        results_lock = threading.Lock()
+
+        def produce(start: int):
+            for i in range(start, start + produced_per_thread):
+                queue.put(i, timeout=5)
+
+        def consume():
+            taken = [queue.get(timeout=5) for _ in range(produced_per_thread)]
+            with results_lock:
+                results.extend(taken)
+
+        threads = [threading.Thread(target=produce, args=(n * produced_per_thread,)) for n in range(3)]
+        threads += [threading.Thread(target=consume) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert sorted(results) == list(range(3 * produced_per_thread))
+        assert queue.empty
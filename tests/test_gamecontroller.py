@@ -0,0 +1,87 @@
+import io
+import numpy as np
+import pytest
+from datastructures.array2d import Array2D
+from projects.project2.bitgrid import BitGrid
+from projects.project2.cell import Cell
+from projects.project2.gamecontroller import GameController
+from projects.project2.grid import Grid
+from projects.project2.numpygrid import NumpyGrid
+from projects.project2.sparsegrid import SparseGrid
+from tests.lifegrids import cellsOf, gridFromNumpy, randomCells
+
+GRID_TYPES = [Grid, NumpyGrid, BitGrid, SparseGrid]
+
+def startingArray(cells: np.ndarray) -> Array2D:
+    #the cells inside the boarder, the form GameController.fromArray2D takes
+    array = Array2D.empty(cells.shape[0]-2, cells.shape[1]-2, Cell)
+    for row, col in np.argwhere(cells[1:-1, 1:-1]).tolist():
+        array[row][col].isAlive = True
+    return array
+
+def currentCells(game: GameController) -> np.ndarray:
+    #the cells inside the boarder, read from the rows after the "Generation n" line, since boarder cells print as nothing
+    lines = str(game).split("\n")[1:]
+    return np.array([[char == "x" for char in line[1::2]] for line in lines if line], dtype=np.bool_)
+
+class TestGameController:
+    @pytest.mark.parametrize('gridType', GRID_TYPES)
+    def test_repeat_of_should_find_a_blinkers_period(self, gridType: type):
+        cells = np.zeros((7, 7), dtype=np.bool_)
+        cells[3, 2:5] = True
+        game = GameController.fromArray2D(startingArray(cells), 5, gridType)
+        game.nextIteration()
+        assert game.repeatOf is None
+        game.nextIteration()
+        assert game.repeatOf == 0
+        game.nextIteration()
+        assert game.repeatOf == 1
+
+    @pytest.mark.parametrize('gridType', GRID_TYPES)
+    def test_repeat_of_should_find_a_still_life_after_one_generation(self, gridType: type):
+        cells = np.zeros((6, 6), dtype=np.bool_)
+        cells[2:4, 2:4] = True
+        game = GameController.fromArray2D(startingArray(cells), 5, gridType)
+        game.nextIteration()
+        assert game.repeatOf == 0
+
+    @pytest.mark.parametrize('gridType', GRID_TYPES)
+    def test_repeat_of_should_match_a_full_comparison_of_every_generation(self, gridType: type):
+        #the hash is updated from the cells each grid reports as flipped, so any missed flip would show up as a missed repeat
+        game = GameController.fromArray2D(startingArray(randomCells(10, 12, seed=4)), 2, gridType)
+        seen = {currentCells(game).tobytes(): 0}
+        for generation in range(1, 80):
+            game.nextIteration()
+            board = currentCells(game).tobytes()
+            assert game.repeatOf == seen.get(board)
+            seen[board] = generation
+
+    def test_repeats_older_than_the_history_should_be_found(self):
+        #a glider on a 6x6 interior dies against the boarder into a still life long after the history is overwritten
+        cells = np.zeros((8, 8), dtype=np.bool_)
+        for row, col in [(1, 2), (2, 3), (3, 1), (3, 2), (3, 3)]:
+            cells[row, col] = True
+        game = GameController.fromArray2D(startingArray(cells), 1, NumpyGrid)
+        while game.repeatOf is None:
+            game.nextIteration()
+        assert game.repeatOf >= 1
+
+    @pytest.mark.parametrize('gridType', GRID_TYPES)
+    def test_flipped_cells_should_be_the_difference_between_generations(self, gridType: type):
+        cells = randomCells(9, 70)
+        grid = gridFromNumpy(cells) if gridType is Grid else gridType.fromNumpy(cells)
+        stepped = gridType(9, 70)
+        grid.nextGeneration(into=stepped)
+        rows, cols = stepped.flippedCells()
+        flipped = np.zeros(cells.shape, dtype=np.bool_)
+        flipped[rows, cols] = True
+        assert len(rows) == flipped.sum()
+        assert np.array_equal(flipped, cellsOf(grid) != cellsOf(stepped))
+
+    def test_from_config_should_read_the_starting_cells(self):
+        config = io.StringIO("#comment\n3\n4\n4\n-x--\n-x--\n-x--\n----\n")
+        game = GameController.fromConfig(config, NumpyGrid)
+        assert np.argwhere(currentCells(game)).tolist() == [[0, 1], [1, 1], [2, 1]]
+        game.nextIteration()
+        game.nextIteration()
+        assert game.repeatOf == 0
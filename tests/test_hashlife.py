@@ -0,0 +1,79 @@
+import numpy as np
+import pytest
+from projects.project2.hashlife import HashLife
+from projects.project2.numpygrid import NumpyGrid
+from tests.lifegrids import cellsOf, gridFromNumpy, randomCells
+
+GLIDER = [(1, 2), (2, 3), (3, 1), (3, 2), (3, 3)]
+
+def stepNumpy(cells: np.ndarray, generations: int) -> np.ndarray:
+    grids = [NumpyGrid.fromNumpy(cells), NumpyGrid(*cells.shape)]
+    for generation in range(generations):
+        grids[generation % 2].nextGeneration(into=grids[(generation+1) % 2])
+    return grids[generations % 2].toNumpy()
+
+class TestHashLife:
+    @pytest.fixture
+    def padded_soup(self) -> np.ndarray:
+        #a random soup in the middle of enough dead space that nothing reaches the edge in 32 generations
+        cells = np.zeros((96, 104), dtype=np.bool_)
+        cells[36:60, 40:64] = randomCells(24, 24)
+        return cells
+
+    @pytest.mark.parametrize('k', [0, 1, 2, 3, 4])
+    def test_step_k_should_match_2_to_the_k_single_steps(self, padded_soup: np.ndarray, k: int):
+        jumped, stepped = HashLife.fromNumpy(padded_soup), HashLife.fromNumpy(padded_soup)
+        jumped.step(k)
+        for _ in range(1 << k):
+            stepped.step()
+        assert jumped.generation == stepped.generation == 1 << k
+        assert jumped.population == stepped.population
+        assert np.array_equal(jumped.toNumpy(0, 0, 96, 104), stepped.toNumpy(0, 0, 96, 104))
+
+    @pytest.mark.parametrize('generations', [1, 5, 13, 32])
+    def test_run_should_match_numpy_grid(self, padded_soup: np.ndarray, generations: int):
+        life = HashLife.fromNumpy(padded_soup)
+        life.run(generations)
+        assert life.generation == generations
+        assert np.array_equal(life.toNumpy(0, 0, 96, 104), stepNumpy(padded_soup, generations))
+
+    def test_a_glider_should_move_diagonally_off_the_starting_square(self):
+        cells = np.zeros((5, 5), dtype=np.bool_)
+        for row, col in GLIDER:
+            cells[row, col] = True
+        life = HashLife.fromNumpy(cells)
+        life.step(10)
+        #a glider moves one cell diagonally every 4 generations
+        shift = (1 << 10) // 4
+        assert life.population == 5
+        assert np.array_equal(life.toNumpy(shift, shift, 5, 5), cells)
+        assert life.isAlive(1 + shift, 2 + shift) and not life.isAlive(1, 2)
+
+    def test_a_blinker_should_return_after_two_generations(self):
+        cells = np.zeros((5, 5), dtype=np.bool_)
+        cells[2, 1:4] = True
+        life = HashLife.fromNumpy(cells)
+        life.step()
+        assert np.array_equal(life.toNumpy(0, 0, 5, 5), cells.T)
+        life.step()
+        assert np.array_equal(life.toNumpy(0, 0, 5, 5), cells)
+
+    def test_an_empty_plane_should_stay_empty(self):
+        life = HashLife()
+        life.step(5)
+        assert life.population == 0
+        assert not life.toNumpy(-10, -10, 20, 20).any()
+
+    def test_from_grid_and_to_grid_should_round_trip(self):
+        cells = randomCells(11, 17)
+        life = HashLife.fromGrid(gridFromNumpy(cells))
+        assert np.array_equal(life.toNumpy(0, 0, 11, 17), cells)
+        assert np.array_equal(life.toGrid(11, 17).toNumpy(), cells)
+        assert np.array_equal(cellsOf(life.toGrid(11, 17)), cells)
+
+    def test_to_grid_should_crop_cells_outside_the_grid(self):
+        cells = np.zeros((8, 8), dtype=np.bool_)
+        cells[6, 6] = cells[2, 2] = True
+        grid = HashLife.fromNumpy(cells).toGrid(5, 5)
+        assert grid.shape == (5, 5)
+        assert np.argwhere(grid.toNumpy()).tolist() == [[2, 2]]
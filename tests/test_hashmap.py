@@ -52,3 +52,82 @@ class TestHashMap:
         assert len(empty_hashmap) == 20
         for i in range(20):
             assert empty_hashmap[i] == str(i)
+
+    def test_unhashable_keys(self):
+        hashmap = HashMap[list, str]()
+        hashmap[[1, 2]] = "one two"
+        hashmap[[3]] = "three"
+        assert hashmap[[1, 2]] == "one two"
+        assert [3] in hashmap
+        assert [4] not in hashmap
+
+    @pytest.mark.parametrize('key, equal_key', [
+        ({1: 2, 3: 4}, {3: 4, 1: 2}),
+        ([1], [1.0]),
+        ({1, 2}, {2, 1}),
+        ([{"a": [1, 2]}, bytearray(b"xy")], [{"a": [1.0, 2]}, bytearray(b"xy")]),
+    ])
+    def test_equal_unhashable_keys(self, key: object, equal_key: object):
+        hashmap = HashMap[object, str]()
+        hashmap[key] = "value"
+        assert hashmap[equal_key] == "value"
+        assert len(hashmap) == 1
+
+    def test_equal_keys_of_different_types(self, empty_hashmap: HashMap[int, str]):
+        empty_hashmap[1] = "one"
+        assert empty_hashmap[1.0] == "one"
+        assert empty_hashmap[True] == "one"
+
+    def test_resize_does_not_call_hash_function_again(self):
+        calls = []
+        def counting_hash(key: int) -> int:
+            calls.append(key)
+            return key
+        hashmap = HashMap[int, str](custom_hash_function=counting_hash)
+        for i in range(20):
+            hashmap[i] = str(i)
+        assert len(calls) == 20
+
+    def test_operations_during_incremental_resize(self, empty_hashmap: HashMap[int, str]):
+        #inserts, updates and deletes interleaved with the migration of old buckets
+        for i in range(1000):
+            empty_hashmap[i] = str(i)
+            if i % 3 == 0:
+                del empty_hashmap[i // 2]
+            if i % 5 == 0:
+                empty_hashmap[i // 4] = "updated"
+        expected = {}
+        for i in range(1000):
+            expected[i] = str(i)
+            if i % 3 == 0:
+                del expected[i // 2]
+            if i % 5 == 0:
+                expected[i // 4] = "updated"
+        assert len(empty_hashmap) == len(expected)
+        assert sorted(empty_hashmap.items()) == sorted(expected.items())
+        for key, value in expected.items():
+            assert empty_hashmap[key] == value
+
+    def test_lookups_while_iterating(self, populated_hashmap: HashMap[int, str]):
+        for i in range(10, 40):
+            populated_hashmap[i] = str(i)
+        assert sorted(key for key in populated_hashmap if populated_hashmap[key] == str(key)) == list(range(40))
+
+    def test_equality_does_not_depend_on_insertion_order(self):
+        hashmap1 = HashMap[int, str]()
+        hashmap2 = HashMap[int, str]()
+        for i in range(20):
+            hashmap1[i] = str(i)
+            hashmap2[19 - i] = str(19 - i)
+        assert hashmap1 == hashmap2
+        hashmap2[0] = "changed"
+        assert hashmap1 != hashmap2
+
+    def test_nested_iteration_over_one_bucket(self):
+        #every key lands in the same chain, so both loops walk the same linked list
+        hashmap = HashMap[int, str](custom_hash_function=lambda key: 0)
+        for i in range(5):
+            hashmap[i] = str(i)
+        pairs = [(key, other) for key in hashmap.keys() for other, _ in hashmap.items()]
+        assert len(pairs) == 25
+        assert sorted(pairs) == [(a, b) for a in range(5) for b in range(5)]
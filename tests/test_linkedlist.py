@@ -142,4 +142,227 @@ class TestLinkedList:
         with pytest.raises(ValueError):
             linked_list.insert_after(10, 99)  # Target not in list
         with pytest.raises(ValueError):
-            linked_list.remove(10)  # Item not in list
\ No newline at end of file
+            linked_list.remove(10)  # Item not in list
+
+    def test_nodes_have_no_dict(self) -> None:
+        node = LinkedList.Node(1)
+        assert not hasattr(node, "__dict__")
+
+    def test_node_pool_recycles_removed_nodes(self) -> None:
+        pool = LinkedList.NodePool()
+        linked_list = LinkedList(data_type=int, node_pool=pool)
+        for i in range(5):
+            linked_list.append(i)
+        assert linked_list.pop() == 4
+        assert linked_list.pop_front() == 0
+        linked_list.remove(2)
+        assert len(pool) == 3
+
+        linked_list.append(5)
+        linked_list.prepend(6)
+        assert len(pool) == 1
+        assert list(linked_list) == [6, 1, 3, 5]
+
+    def test_node_pool_remove_all(self) -> None:
+        pool = LinkedList.NodePool()
+        linked_list = LinkedList.from_sequence([1, 2, 1, 3, 1], data_type=int)
+        pooled = LinkedList(data_type=int, node_pool=pool)
+        for item in linked_list:
+            pooled.append(item)
+        pooled.remove_all(1)
+        assert list(pooled) == [2, 3]
+        assert len(pool) == 3
+
+    def test_node_pool_max_size(self) -> None:
+        pool = LinkedList.NodePool(max_size=2)
+        linked_list = LinkedList(data_type=int, node_pool=pool)
+        for i in range(5):
+            linked_list.append(i)
+        while not linked_list.empty:
+            linked_list.pop()
+        assert len(pool) == 2
+
+    def test_node_pool_removing_the_current_item_while_iterating(self) -> None:
+        pool = LinkedList.NodePool()
+        linked_list = LinkedList(data_type=int, node_pool=pool)
+        for i in range(5):
+            linked_list.append(i)
+        #leaves a free node in the pool, so a released node's next points into the free list
+        linked_list.pop()
+        seen = []
+        for item in linked_list:
+            seen.append(item)
+            if item == 1:
+                linked_list.remove(1)
+        assert seen == [0, 1, 2, 3]
+        assert list(linked_list) == [0, 2, 3]
+        assert len(pool) == 2
+
+    def test_nested_iteration(self, linked_list: ILinkedList[int]) -> None:
+        pairs = [(a, b) for a in linked_list for b in linked_list]
+        assert len(pairs) == 25
+        assert pairs[6] == (1, 1)
+        assert linked_list == linked_list
+
+    def test_independent_iterators(self, linked_list: ILinkedList[int]) -> None:
+        first = iter(linked_list)
+        second = iter(linked_list)
+        assert next(first) == 0
+        assert next(first) == 1
+        assert next(second) == 0
+        assert list(first) == [2, 3, 4]
+        assert list(second) == [1, 2, 3, 4]
+
+    def test_removing_the_current_item_while_iterating(self, linked_list: ILinkedList[int]) -> None:
+        seen = []
+        for item in linked_list:
+            seen.append(item)
+            if item == 2:
+                linked_list.remove(2)
+        assert seen == [0, 1, 2, 3, 4]
+        assert list(linked_list) == [0, 1, 3, 4]
+
+    def test_removing_the_current_item_while_iterating_in_reverse(self, linked_list: ILinkedList[int]) -> None:
+        seen = []
+        for item in reversed(linked_list):
+            seen.append(item)
+            if item == 2:
+                linked_list.remove(2)
+        assert seen == [4, 3, 2, 1, 0]
+        assert list(linked_list) == [0, 1, 3, 4]
+
+    def test_insert_at_ends(self, linked_list: ILinkedList[int]) -> None:
+        linked_list.insert_before(0, 98)
+        linked_list.insert_after(4, 99)
+        assert list(linked_list) == [98, 0, 1, 2, 3, 4, 99]
+        assert list(reversed(linked_list)) == [99, 4, 3, 2, 1, 0, 98]
+        assert (linked_list.front, linked_list.back) == (98, 99)
+
+    def test_handles(self, empty: LinkedList[int]) -> None:
+        handles = [empty.append(i) for i in range(5)]
+        first = empty.prepend(-1)
+        assert empty.remove_handle(handles[2]) == 2
+        empty.insert_after_handle(handles[4], 5)
+        empty.insert_before_handle(first, -2)
+        empty.insert_before_handle(handles[3], 99)
+        assert list(empty) == [-2, -1, 0, 1, 99, 3, 4, 5]
+        assert len(empty) == 8
+
+    def test_move_handles(self, empty: LinkedList[int]) -> None:
+        handles = [empty.append(i) for i in range(5)]
+        empty.move_to_front(handles[3])
+        empty.move_to_back(handles[0])
+        empty.move_to_front(handles[3])
+        assert list(empty) == [3, 1, 2, 4, 0]
+        assert list(reversed(empty)) == [0, 4, 2, 1, 3]
+        assert len(empty) == 5
+        assert empty.remove_handle(handles[0]) == 0
+        assert empty.back == 4
+
+    def test_removed_handle(self, empty: LinkedList[int]) -> None:
+        handle = empty.append(1)
+        empty.append(2)
+        empty.remove_handle(handle)
+        with pytest.raises(ValueError):
+            empty.remove_handle(handle)
+        with pytest.raises(ValueError):
+            empty.move_to_front(handle)
+        with pytest.raises(ValueError):
+            empty.insert_after_handle(handle, 3)
+        with pytest.raises(TypeError):
+            empty.insert_after_handle(empty.append(4), "string")
+
+    def test_handles_from_other_lists(self, empty: LinkedList[int]) -> None:
+        other = LinkedList(data_type=int)
+        foreign = other.append(1)
+        with pytest.raises(ValueError):
+            empty.remove_handle(foreign)
+        handles = [empty.append(i) for i in range(6)]
+        empty.clear()
+        with pytest.raises(ValueError):
+            empty.move_to_back(handles[0])
+        assert other.remove_handle(foreign) == 1
+
+    @pytest.mark.parametrize('position', [1, 5])
+    def test_split_at_moves_handles(self, empty: LinkedList[int], position: int) -> None:
+        #either side of the split can be relabelled, depending on which is smaller
+        handles = [empty.append(i) for i in range(6)]
+        back = empty.split_at(position)
+        with pytest.raises(ValueError):
+            empty.remove_handle(handles[5])
+        with pytest.raises(ValueError):
+            back.remove_handle(handles[0])
+        assert back.remove_handle(handles[5]) == 5
+        assert empty.remove_handle(handles[0]) == 0
+        assert (len(empty), len(back)) == (position - 1, 5 - position)
+
+    def test_spliced_handles_follow_later_splits(self, empty: LinkedList[int]) -> None:
+        other = LinkedList(data_type=int)
+        handles = [other.append(i) for i in range(4)]
+        empty.splice(other)
+        other.append(9)
+        with pytest.raises(ValueError):
+            other.remove_handle(handles[0])
+        back = empty.split_at(1)
+        with pytest.raises(ValueError):
+            empty.remove_handle(handles[3])
+        assert back.remove_handle(handles[3]) == 3
+        assert empty.remove_handle(handles[0]) == 0
+
+    def test_splice(self, linked_list: LinkedList[int]) -> None:
+        other = LinkedList.from_sequence([5, 6, 7], data_type=int)
+        handle = other.append(8)
+        linked_list.splice(other)
+        assert list(linked_list) == list(range(9))
+        assert list(reversed(linked_list)) == list(range(8, -1, -1))
+        assert len(linked_list) == 9
+        assert len(other) == 0 and list(other) == []
+        assert linked_list.remove_handle(handle) == 8
+        assert linked_list.back == 7
+
+    def test_splice_empty_and_type(self, empty: LinkedList[int], linked_list: LinkedList[int]) -> None:
+        empty.splice(linked_list)
+        assert list(empty) == [0, 1, 2, 3, 4]
+        empty.splice(LinkedList(data_type=int))
+        assert len(empty) == 5
+        with pytest.raises(TypeError):
+            empty.splice(LinkedList.from_sequence(["string"], data_type=str))
+        with pytest.raises(ValueError):
+            empty.splice(empty)
+
+    def test_concat(self) -> None:
+        lists = [LinkedList.from_sequence(range(i * 3, i * 3 + 3), data_type=int) for i in range(4)]
+        joined = LinkedList.concat(*lists)
+        assert list(joined) == list(range(12))
+        assert all(len(linked_list) == 0 for linked_list in lists)
+        assert len(LinkedList.concat()) == 0
+
+    def test_split_at_index(self, linked_list: LinkedList[int]) -> None:
+        back = linked_list.split_at(2)
+        assert list(linked_list) == [0, 1]
+        assert list(back) == [2, 3, 4]
+        assert list(reversed(back)) == [4, 3, 2]
+        assert (len(linked_list), len(back)) == (2, 3)
+        assert len(linked_list.split_at(2)) == 0
+        assert list(linked_list.split_at(0)) == [0, 1]
+        assert linked_list.empty
+        with pytest.raises(IndexError):
+            back.split_at(4)
+
+    def test_split_at_handle(self, empty: LinkedList[int]) -> None:
+        handles = [empty.append(i) for i in range(6)]
+        back = empty.split_at(handles[4])
+        assert list(empty) == [0, 1, 2, 3]
+        assert list(back) == [4, 5]
+        assert empty.back == 3 and back.front == 4
+        back.move_to_back(handles[4])
+        assert list(back) == [5, 4]
+
+    def test_extend(self, linked_list: LinkedList[int]) -> None:
+        linked_list.extend(range(5, 8))
+        linked_list.extend(LinkedList.from_sequence([8, 9], data_type=int))
+        assert list(linked_list) == list(range(10))
+        with pytest.raises(TypeError):
+            linked_list.extend([10, "string"])
+        assert len(linked_list) == 10
+        assert linked_list.back == 9
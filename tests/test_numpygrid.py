@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+from projects.project2.grid import Grid
+from projects.project2.numpygrid import NumpyGrid
+from tests.lifegrids import cellsOf, gridFromNumpy, randomCells
+
+class TestNumpyGrid:
+    @pytest.fixture
+    def random_cells(self) -> np.ndarray:
+        return randomCells(12, 19)
+
+    @pytest.mark.parametrize('shape', [(12, 19), (19, 12), (3, 3), (16, 16)])
+    def test_next_generation_should_match_grid(self, shape: tuple[int, int]):
+        cells = randomCells(*shape, seed=shape[0] * shape[1])
+        numpyGrids = [NumpyGrid.fromNumpy(cells), NumpyGrid(*shape)]
+        grids = [gridFromNumpy(cells), Grid(*shape)]
+        for generation in range(8):
+            numpyGrids[generation % 2].nextGeneration(into=numpyGrids[(generation+1) % 2])
+            grids[generation % 2].nextGeneration(into=grids[(generation+1) % 2])
+            assert np.array_equal(numpyGrids[(generation+1) % 2].toNumpy(), cellsOf(grids[(generation+1) % 2]))
+
+    def test_check_cell_should_match_next_generation(self, random_cells: np.ndarray):
+        grid, stepped = NumpyGrid.fromNumpy(random_cells), NumpyGrid(*random_cells.shape)
+        grid.nextGeneration(into=stepped)
+        for row in range(1, random_cells.shape[0]-1):
+            for col in range(1, random_cells.shape[1]-1):
+                assert grid.checkCell(row, col) == stepped.isAlive(row, col)
+        with pytest.raises(ValueError):
+            grid.checkCell(0, 5)
+
+    def test_from_numpy_and_to_numpy_should_round_trip(self, random_cells: np.ndarray):
+        grid = NumpyGrid.fromNumpy(random_cells)
+        assert grid.shape == random_cells.shape
+        assert np.array_equal(grid.toNumpy(), random_cells)
+        assert NumpyGrid.fromNumpy(grid.toNumpy()) == grid
+
+    def test_from_numpy_should_clear_the_boarder(self):
+        grid = NumpyGrid.fromNumpy(np.ones((5, 6), dtype=np.bool_))
+        cells = grid.toNumpy()
+        assert not cells[[0, -1], :].any() and not cells[:, [0, -1]].any()
+        assert cells[1:-1, 1:-1].all()
+
+    def test_to_numpy_should_be_read_only(self, random_cells: np.ndarray):
+        with pytest.raises(ValueError):
+            NumpyGrid.fromNumpy(random_cells).toNumpy()[1, 1] = True
+
+    def test_set_alive_should_ignore_boarder_cells(self):
+        grid = NumpyGrid(5, 5)
+        grid.setAlive(0, 2, True)
+        grid.setAlive(-1, -1, True)
+        grid.setAlive(2, 2, True)
+        assert not grid.isAlive(0, 2) and not grid.isAlive(4, 4)
+        assert grid.isAlive(2, 2)
+
+    def test_str_should_match_grid(self, random_cells: np.ndarray):
+        assert str(NumpyGrid.fromNumpy(random_cells)) == str(gridFromNumpy(random_cells))
@@ -0,0 +1,98 @@
+from datastructures.openaddressinghashmap import OpenAddressingHashMap
+from datastructures.hashmap import HashMap
+import pytest
+
+class TestOpenAddressingHashMap:
+
+    @pytest.fixture
+    def empty_hashmap(self) -> OpenAddressingHashMap[int, str]:
+        return OpenAddressingHashMap[int, str]()
+
+    @pytest.fixture
+    def populated_hashmap(self) -> OpenAddressingHashMap[int, str]:
+        hashmap = OpenAddressingHashMap[int, str]()
+        for i in range(10):
+            hashmap[i] = str(i)
+        return hashmap
+
+    def test_set_and_get_item(self, empty_hashmap: OpenAddressingHashMap[int, str]):
+        empty_hashmap[1] = "one"
+        assert empty_hashmap[1] == "one"
+
+    def test_get_nonexistent_key(self, empty_hashmap: OpenAddressingHashMap[int, str]):
+        with pytest.raises(KeyError):
+            _ = empty_hashmap[99]
+
+    def test_update_existing_key(self, populated_hashmap: OpenAddressingHashMap[int, str]):
+        populated_hashmap[5] = "updated"
+        assert populated_hashmap[5] == "updated"
+        assert len(populated_hashmap) == 10
+
+    def test_delete_item(self, populated_hashmap: OpenAddressingHashMap[int, str]):
+        del populated_hashmap[5]
+        assert 5 not in populated_hashmap
+        assert len(populated_hashmap) == 9
+
+    def test_delete_nonexistent_key(self, empty_hashmap: OpenAddressingHashMap[int, str]):
+        with pytest.raises(KeyError):
+            del empty_hashmap[99]
+
+    def test_contains_key(self, populated_hashmap: OpenAddressingHashMap[int, str]):
+        assert 5 in populated_hashmap
+        assert 99 not in populated_hashmap
+
+    def test_len(self, populated_hashmap: OpenAddressingHashMap[int, str], empty_hashmap: OpenAddressingHashMap[int, str]):
+        assert len(populated_hashmap) == 10
+        assert len(empty_hashmap) == 0
+
+    def test_iteration(self, populated_hashmap: OpenAddressingHashMap[int, str]):
+        keys = list(sorted(iter(populated_hashmap)))
+        assert keys == list(range(10))
+        assert sorted(populated_hashmap.items()) == [(i, str(i)) for i in range(10)]
+
+    def test_resize(self, empty_hashmap: OpenAddressingHashMap[int, str]):
+        for i in range(20):
+            empty_hashmap[i] = str(i)
+        assert len(empty_hashmap) == 20
+        for i in range(20):
+            assert empty_hashmap[i] == str(i)
+
+    def test_colliding_keys_probe_past_tombstones(self):
+        #every key hashes to the same slot, so each lookup has to probe past the earlier keys
+        hashmap = OpenAddressingHashMap[int, int](custom_hash_function=lambda key: 0)
+        for i in range(5):
+            hashmap[i] = i
+        del hashmap[1]
+        assert 1 not in hashmap
+        assert hashmap[4] == 4
+        hashmap[1] = 10
+        assert hashmap[1] == 10
+        assert len(hashmap) == 5
+
+    def test_repeated_insert_and_delete_should_not_fill_the_table_with_tombstones(self, empty_hashmap: OpenAddressingHashMap[int, str]):
+        for i in range(1000):
+            empty_hashmap[i] = str(i)
+            del empty_hashmap[i]
+        assert len(empty_hashmap) == 0
+        empty_hashmap[1000] = "1000"
+        assert empty_hashmap[1000] == "1000"
+
+    def test_equal_to_a_chained_hashmap_with_the_same_items(self, populated_hashmap: OpenAddressingHashMap[int, str]):
+        chained = HashMap[int, str]()
+        for i in range(10):
+            chained[i] = str(i)
+        assert populated_hashmap == chained
+        assert chained == populated_hashmap
+        chained[10] = "10"
+        assert populated_hashmap != chained
+        assert chained != populated_hashmap
+
+    def test_invalid_load_factor(self):
+        with pytest.raises(ValueError):
+            OpenAddressingHashMap(load_factor=1)
+
+    def test_unhashable_keys(self):
+        hashmap = OpenAddressingHashMap[list, str]()
+        hashmap[[1, 2]] = "one two"
+        assert hashmap[[1, 2]] == "one two"
+        assert [3] not in hashmap
@@ -0,0 +1,115 @@
+import numpy as np
+import pytest
+from datastructures.primesieve import PrimeSieve
+
+def naive_primes_below(n: int) -> list[int]:
+    return [i for i in range(2, n) if all(i % d != 0 for d in range(2, int(i**0.5) + 1))]
+
+class TestPrimeSieve:
+
+    @pytest.fixture
+    def sieve(self) -> PrimeSieve:
+        #a small segment size makes even small queries cross several segments
+        return PrimeSieve(segment_size=16)
+
+    def test_getitem(self, sieve: PrimeSieve):
+        assert [sieve[i] for i in range(10)] == [2, 3, 5, 7, 11, 13, 17, 19, 23, 29]
+        assert sieve[999] == 7919
+
+    def test_getitem_negative_index(self, sieve: PrimeSieve):
+        with pytest.raises(IndexError):
+            sieve[-1]
+
+    def test_iteration(self, sieve: PrimeSieve):
+        primes = []
+        for prime in sieve:
+            if prime >= 1000:
+                break
+            primes.append(prime)
+        assert primes == naive_primes_below(1000)
+
+    def test_primes_below(self, sieve: PrimeSieve):
+        assert sieve.primes_below(2).tolist() == []
+        assert sieve.primes_below(30).tolist() == [2, 3, 5, 7, 11, 13, 17, 19, 23, 29]
+        assert sieve.primes_below(5000).tolist() == naive_primes_below(5000)
+        assert sieve.primes_below(31).tolist() == naive_primes_below(31)
+
+    def test_primes_in_range(self, sieve: PrimeSieve):
+        assert sieve.primes_in_range(10, 30).tolist() == [11, 13, 17, 19, 23, 29]
+        assert sieve.primes_in_range(0, 10).tolist() == [2, 3, 5, 7]
+        assert sieve.primes_in_range(1000, 2000).tolist() == [p for p in naive_primes_below(2000) if p >= 1000]
+        assert sieve.primes_in_range(10**12, 10**12 + 100).tolist() == [1000000000039, 1000000000061, 1000000000063, 1000000000091]
+
+    def test_next_prime_at_least(self, sieve: PrimeSieve):
+        assert sieve.next_prime_at_least(0) == 2
+        assert sieve.next_prime_at_least(14) == 17
+        assert sieve.next_prime_at_least(17) == 17
+        assert sieve.next_prime_at_least(10**12) == 1000000000039
+
+    def test_large_sieve_matches_known_prime_count(self):
+        #there are 78498 primes below 10**6
+        assert len(PrimeSieve().primes_below(10**6)) == 78498
+        assert isinstance(PrimeSieve().primes_below(10), np.ndarray)
+
+    def test_save_and_load(self, sieve: PrimeSieve, tmp_path):
+        path = str(tmp_path / "primes.cache")
+        expected = sieve.primes_below(10**5).tolist()
+        sieve.save(path)
+
+        loaded = PrimeSieve()
+        loaded.load(path)
+        assert loaded.primes_below(10**5).tolist() == expected
+        assert loaded[len(expected)] == sieve[len(expected)]
+
+    def test_load_does_not_discard_more_primes(self, sieve: PrimeSieve, tmp_path):
+        path = str(tmp_path / "primes.cache")
+        PrimeSieve().save(path)
+        expected = sieve.primes_below(1000).tolist()
+        sieve.load(path)
+        assert sieve.primes_below(1000).tolist() == expected
+
+    def test_load_invalid_file(self, sieve: PrimeSieve, tmp_path):
+        path = tmp_path / "not_primes.cache"
+        path.write_bytes(b"not a prime cache")
+        with pytest.raises(ValueError):
+            sieve.load(str(path))
+
+    def test_load_then_extend_past_cache(self, tmp_path):
+        path = str(tmp_path / "primes.cache")
+        cached = PrimeSieve()
+        cached.primes_below(5000)
+        cached.save(path)
+
+        loaded = PrimeSieve()
+        loaded.load(path)
+        assert loaded.primes_below(100).tolist() == cached.primes_below(100).tolist()
+        assert loaded.primes_below(20000).tolist() == PrimeSieve().primes_below(20000).tolist()
+
+    def test_is_prime_matches_sieve(self, sieve: PrimeSieve):
+        primes = set(PrimeSieve().primes_below(10**4).tolist())
+        for n in range(-5, 10**4):
+            assert sieve.is_prime(n) == (n in primes)
+
+    def test_is_prime_large(self, sieve: PrimeSieve):
+        assert sieve.is_prime(2**61 - 1)
+        assert sieve.is_prime(2**64 - 59)
+        assert not sieve.is_prime(2**64 - 1)
+        #strong pseudoprime to bases 2, 3, 5 and 7
+        assert not sieve.is_prime(3215031751)
+        #carmichael number
+        assert not sieve.is_prime(561)
+        assert not sieve.is_prime((2**31 - 1) * (2**61 - 1))
+
+    def test_count_primes(self, sieve: PrimeSieve):
+        assert sieve.count_primes(1) == 0
+        assert sieve.count_primes(2) == 1
+        assert sieve.count_primes(10**6) == 78498
+        assert sieve.count_primes(10**9) == 50847534
+
+    def test_large_index_without_generating_smaller_primes(self):
+        primes = PrimeSieve().primes_below(2 * 10**7)
+        for index in [300000, 999999, 10**6, 1234567]:
+            assert PrimeSieve()[index] == primes[index]
+        sieve = PrimeSieve()
+        assert sieve[10**7] == 179424691
+        assert sieve.primes_below(10).tolist() == [2, 3, 5, 7]
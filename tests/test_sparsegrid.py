@@ -0,0 +1,98 @@
+import numpy as np
+import pytest
+from projects.project2.grid import Grid
+from projects.project2.numpygrid import NumpyGrid
+from projects.project2.sparsegrid import SparseGrid
+from tests.lifegrids import cellsOf, gridFromNumpy, randomCells
+
+GLIDER = [(1, 2), (2, 3), (3, 1), (3, 2), (3, 3)]
+
+def stepRing(grids: list, generations: int, start: int = 0) -> int:
+    #steps through a ring of grids the way GameController's history does, returning the index of the newest grid
+    for generation in range(start, start + generations):
+        grids[generation % len(grids)].nextGeneration(into=grids[(generation+1) % len(grids)])
+    return (start + generations) % len(grids)
+
+class TestSparseGrid:
+    @pytest.mark.parametrize('shape', [(12, 19), (19, 12), (3, 3), (18, 34), (35, 20)])
+    def test_next_generation_should_match_grid(self, shape: tuple[int, int]):
+        cells = randomCells(*shape, seed=shape[0] * shape[1])
+        sparseGrids = [SparseGrid.fromNumpy(cells), SparseGrid(*shape)]
+        grids = [gridFromNumpy(cells), Grid(*shape)]
+        for generation in range(8):
+            newest = stepRing(sparseGrids, 1, generation)
+            stepRing(grids, 1, generation)
+            assert np.array_equal(sparseGrids[newest].toNumpy(), cellsOf(grids[newest]))
+
+    @pytest.mark.parametrize('historyLength', [2, 3, 6])
+    def test_a_history_of_grids_should_match_numpy_grid(self, historyLength: int):
+        #older grids in the ring only receive the tiles that changed since they were last written
+        cells = np.zeros((70, 90), dtype=np.bool_)
+        cells[10:30, 20:45] = randomCells(20, 25)
+        sparseGrids = [SparseGrid.fromNumpy(cells)] + [SparseGrid(70, 90) for _ in range(historyLength-1)]
+        numpyGrids = [NumpyGrid.fromNumpy(cells), NumpyGrid(70, 90)]
+        for generation in range(60):
+            newest = stepRing(sparseGrids, 1, generation)
+            numpyNewest = stepRing(numpyGrids, 1, generation)
+            assert np.array_equal(sparseGrids[newest].toNumpy(), numpyGrids[numpyNewest].toNumpy())
+
+    def test_a_glider_should_cross_tile_edges(self):
+        cells = np.zeros((100, 100), dtype=np.bool_)
+        for row, col in GLIDER:
+            cells[row + 10, col + 10] = True
+        sparseGrids = [SparseGrid.fromNumpy(cells), SparseGrid(100, 100), SparseGrid(100, 100)]
+        numpyGrids = [NumpyGrid.fromNumpy(cells), NumpyGrid(100, 100)]
+        #the glider crosses from the first tile into the next tiles down and right, and keeps going
+        for generation in range(120):
+            newest = stepRing(sparseGrids, 1, generation)
+            numpyNewest = stepRing(numpyGrids, 1, generation)
+            assert np.array_equal(sparseGrids[newest].toNumpy(), numpyGrids[numpyNewest].toNumpy())
+            #only the up to four tiles the glider is in and their neighbours are active, out of 49
+            assert sparseGrids[newest].activeTiles <= 16
+        assert sparseGrids[newest].toNumpy().sum() == 5
+        assert sparseGrids[newest].isAlive(1 + 10 + 30, 2 + 10 + 30)
+
+    def test_activity_should_die_out_on_a_still_life(self):
+        grid, stepped = SparseGrid(40, 40), SparseGrid(40, 40)
+        for row, col in [(16, 16), (16, 17), (17, 16), (17, 17)]:
+            grid.setAlive(row, col, True)
+        #the block sits on the corner of four tiles
+        assert grid.activeTiles == 9
+        grid.nextGeneration(into=stepped)
+        assert stepped.activeTiles == 0
+        assert stepped == grid
+
+    def test_set_alive_should_activate_neighbouring_tiles(self):
+        grid = SparseGrid(50, 50)
+        assert grid.activeTiles == 0
+        grid.setAlive(0, 5, True)
+        grid.setAlive(17, 17, False)
+        assert grid.activeTiles == 0
+        grid.setAlive(17, 17, True)
+        assert grid.activeTiles == 9
+        grid.setAlive(17, 17, True)
+        assert grid.activeTiles == 9
+
+    def test_cells_set_in_an_older_grid_should_be_overwritten_by_inactive_tiles(self):
+        grid, stepped, older = SparseGrid(40, 40), SparseGrid(40, 40), SparseGrid(40, 40)
+        for row, col in [(5, 5), (5, 6), (6, 5), (6, 6)]:
+            grid.setAlive(row, col, True)
+        grid.nextGeneration(into=stepped)
+        #the stray cell's tile is inactive in stepped, so it's only cleared if the tile is copied
+        older.setAlive(30, 30, True)
+        stepped.nextGeneration(into=older)
+        assert stepped.activeTiles == older.activeTiles == 0
+        assert older == grid
+
+    def test_from_numpy_and_to_numpy_should_round_trip(self):
+        cells = randomCells(20, 37)
+        grid = SparseGrid.fromNumpy(cells)
+        assert isinstance(grid, SparseGrid)
+        assert np.array_equal(grid.toNumpy(), cells)
+        assert SparseGrid.fromNumpy(grid.toNumpy()) == grid
+        assert str(grid) == str(NumpyGrid.fromNumpy(cells))
+
+    def test_random_grid_should_be_a_sparse_grid_with_every_tile_active(self):
+        grid = SparseGrid.randomGrid(20, 37)
+        assert isinstance(grid, SparseGrid)
+        assert grid.activeTiles == 2 * 3
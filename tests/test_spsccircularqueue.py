@@ -0,0 +1,52 @@
+import threading
+import pytest
+from datastructures.spsccircularqueue import SPSCCircularQueue
+
+@pytest.fixture
+def empty_queue():
+    return SPSCCircularQueue(maxsize=5, data_type=int)
+
+class TestSPSCCircularQueue:
+
+    def test_try_operations(self, empty_queue: SPSCCircularQueue):
+        assert empty_queue.try_dequeue() is None
+        for i in range(5):
+            assert empty_queue.try_enqueue(i)
+        assert not empty_queue.try_enqueue(5)
+        assert empty_queue.try_dequeue() == 0
+
+    def test_many(self, empty_queue: SPSCCircularQueue):
+        assert empty_queue.enqueue_many(list(range(7))) == 5
+        assert empty_queue.dequeue_many(3) == [0, 1, 2]
+        assert empty_queue.dequeue_many(10) == [3, 4]
+
+    def test_timeouts(self, empty_queue: SPSCCircularQueue):
+        with pytest.raises(TimeoutError):
+            empty_queue.get(timeout=0.01)
+        empty_queue.enqueue_many([1, 2, 3, 4, 5])
+        with pytest.raises(TimeoutError):
+            empty_queue.put(6, timeout=0.01)
+
+    def test_producer_and_consumer_threads(self):
+        queue = SPSCCircularQueue(maxsize=16, data_type=int)
+        count = 20000
+        received = []
+
+        def produce():
+            for i in range(count):
+                queue.put(i, timeout=5)
+
+        def consume():
+            while len(received) < count:
+                batch = queue.dequeue_many(8)
+                if batch:
+                    received.extend(batch)
+                else:
+                    received.append(queue.get(timeout=5))
+
+        threads = [threading.Thread(target=produce), threading.Thread(target=consume)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert received == list(range(count))
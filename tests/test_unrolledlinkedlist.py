@@ -0,0 +1,151 @@
+import pytest
+
+from datastructures.deque import Deque
+from datastructures.ilinkedlist import ILinkedList
+from datastructures.linkedlist import LinkedList
+from datastructures.liststack import ListStack
+from datastructures.unrolledlinkedlist import UnrolledLinkedList
+
+class TestUnrolledLinkedList:
+
+    @pytest.fixture
+    def empty(self) -> ILinkedList[int]:
+        return UnrolledLinkedList[int](data_type=int, block_size=4)
+
+    @pytest.fixture
+    def linked_list(self) -> ILinkedList[int]:
+        return UnrolledLinkedList[int].from_sequence(list(range(10)), data_type=int, block_size=4)
+
+    def test_append(self, empty: ILinkedList[int]) -> None:
+        for i in range(10):
+            empty.append(i)
+        assert len(empty) == 10
+        assert empty.back == 9
+        assert list(empty) == list(range(10))
+
+    def test_prepend(self, empty: ILinkedList[int]) -> None:
+        for i in range(10):
+            empty.prepend(i)
+        assert len(empty) == 10
+        assert empty.front == 9
+        assert list(empty) == list(range(9, -1, -1))
+
+    def test_insert_before(self, linked_list: ILinkedList[int]) -> None:
+        linked_list.insert_before(2, 99)
+        linked_list.insert_before(0, 98)
+        assert list(linked_list) == [98, 0, 1, 99, 2, 3, 4, 5, 6, 7, 8, 9]
+
+    def test_insert_after(self, linked_list: ILinkedList[int]) -> None:
+        linked_list.insert_after(2, 99)
+        linked_list.insert_after(9, 98)
+        assert list(linked_list) == [0, 1, 2, 99, 3, 4, 5, 6, 7, 8, 9, 98]
+
+    def test_insert_into_full_blocks(self, empty: ILinkedList[int]) -> None:
+        expected = []
+        for i in range(20):
+            if empty.empty:
+                empty.append(i)
+            else:
+                empty.insert_after(expected[len(expected) // 2], i)
+            if expected:
+                expected.insert(len(expected) // 2 + 1, i)
+            else:
+                expected.append(i)
+        assert list(empty) == expected
+        assert list(reversed(empty)) == expected[::-1]
+
+    def test_insert_not_found(self, linked_list: ILinkedList[int]) -> None:
+        with pytest.raises(ValueError):
+            linked_list.insert_before(10, 99)
+        with pytest.raises(ValueError):
+            linked_list.insert_after(10, 99)
+
+    def test_remove(self, linked_list: ILinkedList[int]) -> None:
+        for i in [2, 0, 9, 5, 6, 7]:
+            linked_list.remove(i)
+        assert list(linked_list) == [1, 3, 4, 8]
+        assert len(linked_list) == 4
+        assert (linked_list.front, linked_list.back) == (1, 8)
+        with pytest.raises(ValueError):
+            linked_list.remove(10)
+
+    def test_remove_all(self, linked_list: ILinkedList[int]) -> None:
+        linked_list.append(2)
+        linked_list.prepend(2)
+        linked_list.remove_all(2)
+        assert 2 not in linked_list
+        assert list(linked_list) == [0, 1, 3, 4, 5, 6, 7, 8, 9]
+        assert len(linked_list) == 9
+
+    def test_pop(self, linked_list: ILinkedList[int]) -> None:
+        assert [linked_list.pop() for _ in range(10)] == list(range(9, -1, -1))
+        with pytest.raises(IndexError):
+            linked_list.pop()
+
+    def test_pop_front(self, linked_list: ILinkedList[int]) -> None:
+        assert [linked_list.pop_front() for _ in range(10)] == list(range(10))
+        with pytest.raises(IndexError):
+            linked_list.pop_front()
+
+    def test_front_back_empty(self, empty: ILinkedList[int]) -> None:
+        assert empty.empty is True
+        with pytest.raises(IndexError):
+            _ = empty.front
+        with pytest.raises(IndexError):
+            _ = empty.back
+
+    def test_clear(self, linked_list: ILinkedList[int]) -> None:
+        linked_list.clear()
+        assert len(linked_list) == 0
+        assert list(linked_list) == []
+
+    def test_contains(self, linked_list: ILinkedList[int]) -> None:
+        assert 7 in linked_list
+        assert 10 not in linked_list
+
+    def test_eq(self, linked_list: ILinkedList[int]) -> None:
+        assert linked_list == UnrolledLinkedList.from_sequence(list(range(10)), data_type=int)
+        assert linked_list == LinkedList.from_sequence(list(range(10)), data_type=int)
+        assert LinkedList.from_sequence(list(range(10)), data_type=int) == linked_list
+        linked_list.append(10)
+        assert linked_list != UnrolledLinkedList.from_sequence(list(range(10)), data_type=int)
+
+    def test_str(self, linked_list: ILinkedList[int]) -> None:
+        assert str(linked_list) == str(LinkedList.from_sequence(list(range(10)), data_type=int))
+
+    def test_check_type_asserts(self, linked_list: ILinkedList[int]) -> None:
+        with pytest.raises(TypeError):
+            linked_list.append("string")
+        with pytest.raises(TypeError):
+            linked_list.prepend("string")
+        with pytest.raises(TypeError):
+            linked_list.insert_after(1, "string")
+        with pytest.raises(TypeError):
+            linked_list.insert_before("string", 2)
+        with pytest.raises(TypeError):
+            linked_list.remove_all("string")
+        with pytest.raises(TypeError):
+            UnrolledLinkedList.from_sequence([1, 2, 3], data_type=str)
+
+    def test_backs_deque_and_stack(self) -> None:
+        deque = Deque[int](data_type=int, list_type=UnrolledLinkedList)
+        for i in range(100):
+            deque.enqueue(i)
+        deque.enqueue_front(-1)
+        assert deque.dequeue() == -1
+        assert deque.dequeue_back() == 99
+        assert 50 in deque
+
+        stack = ListStack[int](data_type=int, list_type=UnrolledLinkedList)
+        for i in range(100):
+            stack.push(i)
+        assert stack.pop() == 99
+        assert stack.peek() == 98
+
+    def test_independent_iterators(self, linked_list: ILinkedList[int]) -> None:
+        first = iter(linked_list)
+        second = iter(linked_list)
+        assert next(first) == 0
+        assert next(second) == 0
+        assert list(first) == list(range(1, 10))
+        assert [(a, b) for a in linked_list for b in linked_list][11] == (1, 1)